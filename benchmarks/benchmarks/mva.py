@@ -0,0 +1,166 @@
+"""Benchmarks of the decomposition and blind source separation methods.
+
+The datasets are synthetic low rank signals with Poissonian noise, whose
+size is given as (navigation size, signal size).
+
+"""
+
+import numpy as np
+
+import hyperspy.api as hs
+from hyperspy.misc.machine_learning.import_sklearn import sklearn_installed
+
+SIZES = [(1024, 256), (4096, 1024), (16384, 1024)]
+RANK = 8
+
+hs.preferences.General.show_progressbar = False
+
+
+def low_rank_signal(size, rank=RANK, lazy=False, chunks="auto", random_state=0):
+    """Synthetic non-negative low rank Signal1D with Poissonian noise."""
+    rng = np.random.default_rng(random_state)
+    nav_size, sig_size = size
+    shape = (nav_size // 64, 64)
+    x = np.linspace(0, 1, sig_size)
+    centres = rng.uniform(0.1, 0.9, rank)
+    factors = np.exp(-((x[:, None] - centres) ** 2) / 0.002)
+    loadings = rng.uniform(0, 100, (nav_size, rank))
+    data = rng.poisson(loadings @ factors.T + 1).astype(float)
+    s = hs.signals.Signal1D(data.reshape(shape + (sig_size,)))
+    if lazy:
+        s = s.as_lazy()
+        s.rechunk(nav_chunks=chunks)
+    return s
+
+
+class Decomposition:
+    params = (
+        SIZES,
+        ["full", "randomized", "arpack"],
+    )
+    param_names = ["size", "svd_solver"]
+    timeout = 300
+
+    def setup(self, size, svd_solver):
+        self.s = low_rank_signal(size)
+
+    def time_decomposition(self, size, svd_solver):
+        self.s.decomposition(
+            output_dimension=RANK, svd_solver=svd_solver, print_info=False
+        )
+
+    def peakmem_decomposition(self, size, svd_solver):
+        self.s.decomposition(
+            output_dimension=RANK, svd_solver=svd_solver, print_info=False
+        )
+
+    def time_decomposition_poissonian(self, size, svd_solver):
+        self.s.decomposition(
+            True, output_dimension=RANK, svd_solver=svd_solver, print_info=False
+        )
+
+
+class DecompositionIterative:
+    params = (
+        SIZES[:2],
+        ["MLPCA", "NMF", "ORPCA", "ORNMF"],
+    )
+    param_names = ["size", "algorithm"]
+    # these algorithms are slow, a single run is enough to catch regressions
+    number = 1
+    repeat = 1
+    warmup_time = 0
+    timeout = 600
+
+    def setup(self, size, algorithm):
+        if algorithm == "NMF" and not sklearn_installed:
+            raise NotImplementedError("scikit-learn is not installed")
+        self.s = low_rank_signal(size)
+        self.kwargs = {"output_dimension": RANK, "print_info": False}
+        if algorithm == "NMF":
+            self.kwargs["max_iter"] = 200
+
+    def time_decomposition(self, size, algorithm):
+        self.s.decomposition(algorithm=algorithm, **self.kwargs)
+
+    def peakmem_decomposition(self, size, algorithm):
+        self.s.decomposition(algorithm=algorithm, **self.kwargs)
+
+
+class LazyDecomposition:
+    params = (
+        SIZES,
+        ["SVD", "PCA"],
+        [256, 1024],
+    )
+    param_names = ["size", "algorithm", "navigation_chunks"]
+    timeout = 600
+
+    def setup(self, size, algorithm, navigation_chunks):
+        if algorithm == "PCA" and not sklearn_installed:
+            raise NotImplementedError("scikit-learn is not installed")
+        self.s = low_rank_signal(size, lazy=True, chunks=(navigation_chunks // 64, 64))
+
+    def time_decomposition(self, size, algorithm, navigation_chunks):
+        self.s.decomposition(
+            algorithm=algorithm, output_dimension=RANK, print_info=False
+        )
+
+    def peakmem_decomposition(self, size, algorithm, navigation_chunks):
+        self.s.decomposition(
+            algorithm=algorithm, output_dimension=RANK, print_info=False
+        )
+
+
+class LazyDecompositionOnline(LazyDecomposition):
+    params = (
+        SIZES[:1],
+        ["ORPCA", "ORNMF"],
+        [256, 1024],
+    )
+    number = 1
+    repeat = 1
+    warmup_time = 0
+
+
+class BlindSourceSeparation:
+    params = (
+        SIZES,
+        ["sklearn_fastica", "orthomax"],
+        [False, True],
+    )
+    param_names = ["size", "algorithm", "on_loadings"]
+    timeout = 300
+
+    def setup(self, size, algorithm, on_loadings):
+        if algorithm.startswith("sklearn") and not sklearn_installed:
+            raise NotImplementedError("scikit-learn is not installed")
+        self.s = low_rank_signal(size)
+        self.s.decomposition(output_dimension=RANK, print_info=False)
+
+    def time_blind_source_separation(self, size, algorithm, on_loadings):
+        self.s.blind_source_separation(
+            RANK, algorithm=algorithm, on_loadings=on_loadings, print_info=False
+        )
+
+    def peakmem_blind_source_separation(self, size, algorithm, on_loadings):
+        self.s.blind_source_separation(
+            RANK, algorithm=algorithm, on_loadings=on_loadings, print_info=False
+        )
+
+
+class TwoGaussians:
+    """Decomposition of the ``hs.data.two_gaussians`` example dataset."""
+
+    timeout = 300
+
+    def setup_cache(self):
+        s = hs.data.two_gaussians()
+        s.change_dtype("float64")
+        return s
+
+    def time_decomposition(self, s):
+        s.decomposition(output_dimension=2, print_info=False)
+
+    def time_decomposition_lazy(self, s):
+        s.as_lazy().decomposition(output_dimension=2, print_info=False)
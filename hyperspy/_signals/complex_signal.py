@@ -232,10 +232,18 @@ def unwrapped_phase(
     unwrapped_phase.__doc__ %= (SHOW_PROGRESSBAR_ARG, NUM_WORKERS_ARG)
 
     def _get_current_data(
-        self, axes_manager=None, power_spectrum=False, fft_shift=False, as_numpy=None
+        self,
+        axes_manager=None,
+        power_spectrum=False,
+        fft_shift=False,
+        as_numpy=None,
+        prefetch=False,
     ):
         value = super()._get_current_data(
-            axes_manager=axes_manager, fft_shift=fft_shift, as_numpy=as_numpy
+            axes_manager=axes_manager,
+            fft_shift=fft_shift,
+            as_numpy=as_numpy,
+            prefetch=prefetch,
         )
         if power_spectrum:
             value = abs(value) ** 2
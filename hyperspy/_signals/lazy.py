@@ -18,6 +18,9 @@
 
 import logging
 import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from itertools import product
 
@@ -33,6 +36,7 @@
     MANY_AXIS_PARAMETER,
     SHOW_PROGRESSBAR_ARG,
 )
+from hyperspy.drawing._data_fetcher import backend_supports_timers
 from hyperspy.external.progressbar import progressbar
 from hyperspy.misc.array_tools import (
     _get_navigation_dimension_chunk_slice,
@@ -46,6 +50,28 @@
 
 _logger = logging.getLogger(__name__)
 
+# The chunks loaded in advance by `LazySignal._get_cache_dask_chunk`, as
+# futures keyed by the navigation start and stop of the chunks, for each
+# signal. The lock protects these and the cached chunk of the signals.
+_prefetched_dask_chunks = weakref.WeakKeyDictionary()
+_cache_lock = threading.Lock()
+_prefetch_executor = None
+
+
+def _get_prefetch_executor():
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="hyperspy-prefetch"
+        )
+    return _prefetch_executor
+
+
+def _chunk_slice_key(chunk_slice):
+    # slices are not hashable before python 3.12
+    return tuple((s.start, s.stop) for s in chunk_slice)
+
+
 lazyerror = NotImplementedError("This method is not available in lazy signals")
 
 
@@ -127,6 +153,7 @@ def __init__(self, *args, **kwargs):
         # the NumPy array originates from.
         self._cache_dask_chunk = None
         self._cache_dask_chunk_slice = None
+        self._navigator_refinement = None
         if self._clear_cache_dask_data not in self.events.data_changed.connected:
             self.events.data_changed.connect(self._clear_cache_dask_data)
 
@@ -306,8 +333,12 @@ def close_file(self):
             _logger.warning("Failed to close lazy signal file")
 
     def _clear_cache_dask_data(self, obj=None):
-        self._cache_dask_chunk = None
-        self._cache_dask_chunk_slice = None
+        with _cache_lock:
+            self._cache_dask_chunk = None
+            self._cache_dask_chunk_slice = None
+            futures = _prefetched_dask_chunks.pop(self, {})
+        for future in futures.values():
+            future.cancel()
 
     def _get_dask_chunks(self, axis=None, dtype=None):
         """Returns dask chunks.
@@ -513,7 +544,7 @@ def get_dask_function(numpy_name):
             s._remove_axis([ax.index_in_axes_manager for ax in axes])
             return s
 
-    def _get_cache_dask_chunk(self, indices):
+    def _get_cache_dask_chunk(self, indices, prefetch=False):
         """Method for handling caching of dask chunks, when using __call__.
 
         When accessing data in a chunked HDF5 file, the whole chunks needs
@@ -532,6 +563,11 @@ def _get_cache_dask_chunk(self, indices):
         plot and fitting functions. This will not work with the region of
         interest functionality.
 
+        With ``prefetch=True``, the chunks next to the cached chunk along each
+        navigation axis are loaded in background threads, so that they are
+        readily available when navigating. The chunks which are not next to
+        the cached chunk anymore are discarded.
+
         The cached chunk is stored in the attribute s._cache_dask_chunk,
         and the slice needed to extract this chunk is in
         s._cache_dask_chunk_slice. To these, use s._clear_cache_dask_data()
@@ -540,6 +576,8 @@ def _get_cache_dask_chunk(self, indices):
         ----------
         indices : tuple
             Must be the same length as navigation dimensions in self.
+        prefetch : bool, default False
+            Whether to load the neighbouring chunks in advance.
 
         Returns
         -------
@@ -562,21 +600,60 @@ def _get_cache_dask_chunk(self, indices):
         navigation_indices = indices[:-sig_dim]
         chunk_slice = _get_navigation_dimension_chunk_slice(navigation_indices, chunks)
 
-        if (
-            chunk_slice != self._cache_dask_chunk_slice
-            or self._cache_dask_chunk is None
-        ):
-            with dummy_context_manager():
-                self._cache_dask_chunk = self.data.__getitem__(chunk_slice).compute()
-            self._cache_dask_chunk_slice = chunk_slice
+        # The cache can be updated from another thread, e.g. when the data
+        # is fetched in the background for plotting
+        with _cache_lock:
+            cache_chunk = self._cache_dask_chunk
+            cached = chunk_slice == self._cache_dask_chunk_slice
+        if not cached or cache_chunk is None:
+            cache_chunk = self._pop_prefetched_dask_chunk(chunk_slice)
+            if cache_chunk is None:
+                with dummy_context_manager():
+                    cache_chunk = self.data.__getitem__(chunk_slice).compute()
+            with _cache_lock:
+                self._cache_dask_chunk = cache_chunk
+                self._cache_dask_chunk_slice = chunk_slice
+        if prefetch:
+            self._prefetch_dask_chunks(navigation_indices, chunks, chunk_slice)
 
         indices = list(indices)
         for i, temp_slice in enumerate(chunk_slice):
             indices[i] -= temp_slice.start
         indices = tuple(indices)
-        value = self._cache_dask_chunk[indices]
+        value = cache_chunk[indices]
         return value
 
+    def _pop_prefetched_dask_chunk(self, chunk_slice):
+        with _cache_lock:
+            futures = _prefetched_dask_chunks.get(self, {})
+            future = futures.pop(_chunk_slice_key(chunk_slice), None)
+        if future is None or future.cancel():
+            return None
+        return future.result()
+
+    def _prefetch_dask_chunks(self, navigation_indices, chunks, chunk_slice):
+        neighbours = {}
+        for i, temp_slice in enumerate(chunk_slice):
+            for index in (temp_slice.stop, temp_slice.start - 1):
+                if 0 <= index < self.data.shape[i]:
+                    neighbour_indices = list(navigation_indices)
+                    neighbour_indices[i] = index
+                    neighbour = _get_navigation_dimension_chunk_slice(
+                        neighbour_indices, chunks
+                    )
+                    neighbours[_chunk_slice_key(neighbour)] = neighbour
+        with _cache_lock:
+            futures = _prefetched_dask_chunks.setdefault(self, {})
+            for key in list(futures):
+                if key not in neighbours:
+                    # Superseded: the navigation moved away from this chunk
+                    futures.pop(key).cancel()
+            for key, neighbour in neighbours.items():
+                if key not in futures:
+                    futures[key] = _get_prefetch_executor().submit(
+                        self.data.__getitem__(neighbour).compute
+                    )
+
     def rebin(
         self,
         new_shape=None,
@@ -1223,12 +1300,49 @@ def plot(self, navigator="auto", **kwargs):
                 )
                 navigator = "auto"
             if navigator == "auto":
-                if self.navigator is None:
-                    self.compute_navigator()
+                refinement = self._navigator_refinement
+                if self.navigator is None or (
+                    not self.navigator.original_metadata.get_item("refined", True)
+                    and (refinement is None or refinement.done)
+                ):
+                    # Only compute the navigator progressively when the
+                    # figure can be updated during the refinement
+                    self.compute_navigator(
+                        progressive=preferences.Plot.lazy_asynchronous_data
+                        and backend_supports_timers()
+                    )
                 navigator = self.navigator
         super().plot(navigator=navigator, **kwargs)
-
-    def compute_navigator(self, index=None, chunks_number=None, show_progressbar=None):
+        self._connect_navigator_refinement()
+
+    def _connect_navigator_refinement(self):
+        # Update the navigator plot with the progress of the refinement
+        refinement = self._navigator_refinement
+        navigator_plot = self._plot.navigator_plot if self._plot else None
+        if refinement is None or refinement.done or navigator_plot is None:
+            return
+        if navigator_plot.figure is None:
+            return
+        timer = navigator_plot.figure.canvas.new_timer(interval=200)
+
+        def update_navigator_plot():
+            done = refinement.done
+            if refinement.pop_updated() and navigator_plot.figure is not None:
+                navigator_plot.update()
+            if done:
+                timer.stop()
+
+        timer.add_callback(update_navigator_plot)
+        timer.start()
+        navigator_plot.events.closed.connect(timer.stop, [])
+
+    def compute_navigator(
+        self,
+        index=None,
+        chunks_number=None,
+        show_progressbar=None,
+        progressive=False,
+    ):
         """
         Compute the navigator by taking the sum over a single chunk contained
         the specified coordinate. Taking the sum over a single chunk is a
@@ -1248,6 +1362,13 @@ def compute_navigator(self, index=None, chunks_number=None, show_progressbar=Non
             If None, the existing chunking will be considered when picking the
             chunk used in the navigator calculation.
         %s
+        progressive : bool or int, default False
+            If not False, a coarse navigator is first computed from a subset
+            of the navigation positions, regularly spaced, and is then refined
+            chunk by chunk in a background thread. The navigator plot, if any,
+            is updated as the refinement progresses. If an integer, the
+            maximum number of positions along each navigation axis used to
+            compute the coarse navigator; ``True`` corresponds to 32.
 
         Returns
         -------
@@ -1260,6 +1381,11 @@ def compute_navigator(self, index=None, chunks_number=None, show_progressbar=Non
         the case of diffraction pattern), the number of chunk needs to be an
         odd number, so that the middle is centered.
 
+        The navigator is stored in the metadata and is therefore saved with
+        the signal. While it is progressively refined, the ``refined`` item of
+        its ``original_metadata`` is False, in which case it is computed
+        again when plotting the signal.
+
         """
 
         signal_shape = self.axes_manager.signal_shape
@@ -1301,14 +1427,106 @@ def compute_navigator(self, index=None, chunks_number=None, show_progressbar=Non
 
         _logger.info(f"Computing sum over signal dimension: {isig_slice}")
         axes = [axis.index_in_array for axis in self.axes_manager.signal_axes]
-        navigator = self.isig[isig_slice].sum(axes)
-        navigator.compute(show_progressbar=show_progressbar)
+        if self._navigator_refinement is not None:
+            self._navigator_refinement.cancel()
+            self._navigator_refinement = None
+        if progressive and self.axes_manager.navigation_dimension:
+            navigator = self._compute_coarse_navigator(
+                isig_slice, axes, 32 if progressive is True else progressive
+            )
+        else:
+            navigator = self.isig[isig_slice].sum(axes)
+            navigator.compute(show_progressbar=show_progressbar)
         navigator.original_metadata.set_item("sum_from", str(isig_slice))
 
         self.navigator = navigator.T
+        if self._navigator_refinement is not None:
+            self._navigator_refinement.navigator = self.navigator
+            self._navigator_refinement.start()
 
     compute_navigator.__doc__ %= SHOW_PROGRESSBAR_ARG
 
+    def _compute_coarse_navigator(self, isig_slice, axes, resolution):
+        summed = self.isig[isig_slice]
+        nav_shape = summed.data.shape[: self.axes_manager.navigation_dimension]
+        steps = [max(1, -(-size // resolution)) for size in nav_shape]
+        # The data is strided before taking the sum to read only the
+        # positions used by the coarse navigator
+        strides = tuple(slice(None, None, step) for step in steps)
+        coarse = summed.data[strides].sum(axis=tuple(axes)).compute()
+        for i, step in enumerate(steps):
+            coarse = np.repeat(coarse, step, axis=i)
+        coarse = coarse[tuple(slice(size) for size in nav_shape)]
+
+        navigator = summed.sum(axes)
+        refined_data = navigator.data
+        navigator.data = da.from_array(coarse, chunks=-1)
+        navigator.compute(show_progressbar=False)
+        navigator.original_metadata.set_item("refined", False)
+        self._navigator_refinement = _NavigatorRefinement(navigator, refined_data)
+        return navigator
+
+
+class _NavigatorRefinement:
+    """Compute the data of a navigator chunk by chunk in a background thread,
+    replacing the data of the (coarse) navigator as the chunks are computed.
+    """
+
+    def __init__(self, navigator, data):
+        """
+        Parameters
+        ----------
+        navigator : :class:`~hyperspy.signal.BaseSignal`
+            The navigator, whose data is replaced in place.
+        data : :class:`dask.array.Array`
+            The data of the refined navigator, with the same shape as the
+            data of the navigator.
+        """
+        self.navigator = navigator
+        self._data = data
+        self._updated = False
+        self._cancelled = False
+        self._done = False
+        self._thread = threading.Thread(
+            target=self._run, name="hyperspy-navigator", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        data = self._data
+        try:
+            for block_index, block_slice in zip(
+                np.ndindex(*data.numblocks), da.core.slices_from_chunks(data.chunks)
+            ):
+                if self._cancelled:
+                    return
+                self.navigator.data[block_slice] = data.blocks[block_index].compute()
+                self._updated = True
+            self.navigator.original_metadata.set_item("refined", True)
+        except Exception:
+            _logger.exception("The refinement of the navigator failed.")
+        finally:
+            self._done = True
+
+    @property
+    def done(self):
+        return self._cancelled or self._done
+
+    def pop_updated(self):
+        """Return whether the navigator has been updated since last call."""
+        updated, self._updated = self._updated, False
+        return updated
+
+    def cancel(self):
+        self._cancelled = True
+
+    def wait(self, timeout=None):
+        """Wait for the refinement to complete."""
+        if self._thread.ident is not None:
+            self._thread.join(timeout)
+
 
 def _reshuffle_mixed_blocks(array, ndim, sshape, nav_chunks):
     """Reshuffles dask block-shuffled array
@@ -182,6 +182,13 @@ class PlotConfig(t.HasTraits):
     pick_tolerance = t.CFloat(
         7.5, label="Pick tolerance", desc="The pick tolerance of ROIs in screen pixels."
     )
+    lazy_asynchronous_data = t.CBool(
+        True,
+        label="Fetch the lazy data in the background",
+        desc="When navigating lazy signals in interactive figures, read the "
+        "data in a background thread (together with the neighbouring chunks) "
+        "and display the last available data in the meantime.",
+    )
 
 
 template = {
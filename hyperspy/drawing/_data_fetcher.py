@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2024 The HyperSpy developers
+#
+# This file is part of HyperSpy.
+#
+# HyperSpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# HyperSpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import TimerBase
+
+_logger = logging.getLogger(__name__)
+
+
+def supports_timers(canvas):
+    """Return whether the timers of a matplotlib canvas are run, i.e. whether
+    the figure is displayed with an interactive backend."""
+    return getattr(canvas, "_timer_cls", TimerBase) is not TimerBase
+
+
+def backend_supports_timers():
+    """Return whether the timers of the canvas of the current matplotlib
+    backend are run, i.e. whether the backend is interactive."""
+    try:
+        canvas_class = plt._get_backend_mod().FigureCanvas
+    except AttributeError:
+        return False
+    return supports_timers(canvas_class)
+
+
+class AsyncDataFetcher:
+    """Fetch the data displayed by a plot in a background thread.
+
+    The data at the current navigation position is requested with
+    :meth:`fetch`, which returns immediately. When the data is available,
+    ``callback`` is called from the GUI thread (using a timer of the figure
+    canvas) and the next call to :meth:`fetch` returns the data. A request
+    superseded before being processed is skipped, and the data of a request
+    superseded while being processed are discarded.
+
+    The data function is called with an ``axes_manager`` which only provides
+    the ``_getitem_tuple`` attribute of the requested position, since the
+    navigation position can change while the data is fetched, and with
+    ``prefetch=True`` to load the data of the neighbouring positions in
+    advance.
+    """
+
+    def __init__(self, data_function, canvas, callback, interval=20):
+        """
+        Parameters
+        ----------
+        data_function : callable
+            The function returning the data, e.g.
+            :meth:`~hyperspy.signal.BaseSignal._get_current_data`.
+        canvas : :class:`matplotlib.backend_bases.FigureCanvasBase`
+            The canvas of the figure displaying the data.
+        callback : callable
+            Called without arguments from the GUI thread when the data are
+            available.
+        interval : int, default 20
+            The interval, in milliseconds, at which the availability of the
+            data is checked.
+        """
+        self.data_function = data_function
+        self.callback = callback
+        self._canvas = canvas
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._executor = None
+        self._timer = None
+        self._queued = False
+        self._running = None
+        # The latest request and the result of the latest processed request
+        self._request = None
+        self._result = None
+
+    def fetch(self, axes_manager, **kwargs):
+        """Request the data at the current position of ``axes_manager``.
+
+        Parameters
+        ----------
+        axes_manager : :class:`~hyperspy.axes.AxesManager`
+        **kwargs : dict
+            Passed to the data function.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The data, if it is available, otherwise None.
+        """
+        request = (axes_manager._getitem_tuple, kwargs)
+        with self._lock:
+            if self._result is not None and self._result[0] == request:
+                # The data is only returned once, since it may be outdated
+                # at the next request, e.g. if the data of the signal changed
+                data, error = self._result[1:]
+                self._result = None
+                if error is not None:
+                    raise error
+                return data
+            self._request = request
+            if not self._queued and request != self._running:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="hyperspy-plot"
+                    )
+                self._queued = True
+                self._executor.submit(self._run)
+        if self._timer is None:
+            self._timer = self._canvas.new_timer(interval=self._interval)
+            self._timer.add_callback(self._poll)
+            self._timer.start()
+        return None
+
+    def _run(self):
+        with self._lock:
+            self._queued = False
+            request = self._running = self._request
+        getitem_tuple, kwargs = request
+        data, error = None, None
+        try:
+            data = self.data_function(
+                axes_manager=SimpleNamespace(_getitem_tuple=getitem_tuple),
+                prefetch=True,
+                **kwargs,
+            )
+        except Exception as e:
+            error = e
+        with self._lock:
+            self._running = None
+            if request == self._request:
+                self._result = (request, data, error)
+            else:
+                _logger.debug("Discarding the data of a superseded request.")
+
+    def _poll(self):
+        with self._lock:
+            ready = self._result is not None and self._result[0] == self._request
+        if ready:
+            self._stop_timer()
+            self.callback()
+
+    def _stop_timer(self):
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def close(self):
+        """Stop fetching the data."""
+        self._stop_timer()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._request = self._result = None
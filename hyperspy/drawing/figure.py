@@ -22,15 +22,37 @@
 import matplotlib.pyplot as plt
 
 from hyperspy.drawing import utils
+from hyperspy.drawing._data_fetcher import supports_timers
 from hyperspy.events import Event, Events
 
 _logger = logging.getLogger(__name__)
 
 
 class BlittedFigure(object):
+    """Base class of the HyperSpy figures, which redraw their animated
+    artists using blitting when supported by the matplotlib backend.
+
+    With interactive backends, the calls to :meth:`render_figure` are
+    coalesced: the figure is rendered once at the next iteration of the GUI
+    event loop, however many renders were requested in the meantime, e.g.
+    by the markers, the widgets and the lines updated after a change of the
+    navigation position.
+
+    Attributes
+    ----------
+    renders_requested : int
+        The number of calls to :meth:`render_figure`.
+    renders_performed : int
+        The number of times the figure was actually rendered.
+    """
+
     def __init__(self):
         self._draw_event_cid = None
         self._background = None
+        self._render_timer = None
+        self._render_pending = False
+        self.renders_requested = 0
+        self.renders_performed = 0
         self.events = Events()
         self.events.closed = Event(
             """
@@ -117,6 +139,10 @@ def _on_close(self):
         if self._draw_event_cid:
             self.figure.canvas.mpl_disconnect(self._draw_event_cid)
             self._draw_event_cid = None
+        if self._render_timer is not None:
+            self._render_timer.stop()
+            self._render_timer = None
+        self._render_pending = False
         plt.close(self.figure)
         self.figure = None
         self.ax = None
@@ -137,6 +163,34 @@ def title(self, value):
         self._title = textwrap.fill(value, 60)
 
     def render_figure(self):
+        """Render the figure, using blitting if supported.
+
+        With interactive backends, the figure is rendered at the next
+        iteration of the GUI event loop and the renders requested until then
+        are coalesced into a single one.
+        """
+        self.renders_requested += 1
+        canvas = self.figure.canvas
+        if not supports_timers(canvas):
+            self._render_figure()
+            return
+        if self._render_pending:
+            return
+        if self._render_timer is None:
+            self._render_timer = canvas.new_timer(interval=0)
+            self._render_timer.single_shot = True
+            self._render_timer.add_callback(self._on_render_timer)
+        self._render_pending = True
+        self._render_timer.start()
+
+    def _on_render_timer(self):
+        if not self._render_pending or self.figure is None:
+            return
+        self._render_figure()
+
+    def _render_figure(self):
+        self._render_pending = False
+        self.renders_performed += 1
         if self.figure.canvas.supports_blit and self._background is not None:
             self._update_animated()
         else:
@@ -31,6 +31,7 @@
 
 from hyperspy.docstrings.plot import PLOT2D_DOCSTRING
 from hyperspy.drawing import utils, widgets
+from hyperspy.drawing._data_fetcher import AsyncDataFetcher, supports_timers
 from hyperspy.drawing.figure import BlittedFigure
 from hyperspy.misc import math_tools
 from hyperspy.misc.test_utils import ignore_warning
@@ -40,6 +41,36 @@
 _logger = logging.getLogger(__name__)
 
 
+def _block_mean(data):
+    """Downsample an image by 2 along its first two axes by taking the mean
+    of 2x2 blocks. The last row/column is repeated if the shape is odd."""
+    pad = [(0, size % 2) for size in data.shape[:2]] + [(0, 0)] * (data.ndim - 2)
+    if any(p[1] for p in pad):
+        data = np.pad(data, pad, mode="edge")
+    shape = (data.shape[0] // 2, 2, data.shape[1] // 2, 2) + data.shape[2:]
+    dtype = np.result_type(data.dtype, np.float32)
+    mean = data.reshape(shape).mean(axis=(1, 3), dtype=dtype)
+    if not np.issubdtype(data.dtype, np.inexact):
+        mean = np.round(mean).astype(data.dtype)
+    return mean
+
+
+class _DisplayPyramid:
+    """The levels of an image downsampled by block mean, computed on demand.
+
+    The level ``n`` is the image downsampled by ``2**n`` along both axes,
+    computed from the level ``n - 1``.
+    """
+
+    def __init__(self, data):
+        self.levels = [data]
+
+    def get_level(self, level):
+        while len(self.levels) <= level and min(self.levels[-1].shape[:2]) > 1:
+            self.levels.append(_block_mean(self.levels[-1]))
+        return self.levels[min(level, len(self.levels) - 1)]
+
+
 class ImagePlot(BlittedFigure):
     """Class to plot an image with the necessary machinery to update
     the image when the coordinates of an AxesManager change.
@@ -49,9 +80,25 @@ class ImagePlot(BlittedFigure):
     data_function : function or method
         A function that returns a 2D array when called without any
         arguments.
+    asynchronous_data : bool
+        If True and the figure is interactive, the data is fetched in a
+        background thread while the last available data is displayed. The
+        ``data_function`` must accept the ``prefetch`` keyword argument.
+        Default is False.
     %s
     pixel_units : {None, string}
         The pixel units for the scale bar.
+    pyramid_min_size : int or None
+        The minimum number of pixels of an image to display it from a pyramid
+        of downsampled images, whose level is chosen from the resolution of
+        the displayed area. This avoids resampling very large images at
+        every update. If None, the images are always displayed at full
+        resolution. Default is 2**22.
+    contrast_max_samples : int or None
+        The maximum number of pixels used to calculate the percentiles of the
+        automatic contrast and the histogram of the contrast editor. Larger
+        images are sampled regularly. If None, all the pixels are used.
+        Default is 2**20.
     plot_indices : bool
     title : str
         The title is printed at the top of the image.
@@ -62,6 +109,13 @@ def __init__(self, title="", **kwargs):
         super().__init__()
         self.data_function = None
         self.data_function_kwargs = {}
+        self.asynchronous_data = False
+        self._data_fetcher = None
+        self._current_data = None
+        self.pyramid_min_size = 2**22
+        self.contrast_max_samples = 2**20
+        self._pyramid = None
+        self._display_level = 0
 
         # Attribute matching the arguments of
         # `hyperspy._signal.signal2d.signal2D.plot`
@@ -263,7 +317,9 @@ def _calculate_vmin_max(self, data, auto_contrast=False, vmin=None, vmax=None):
         if auto_contrast and (isinstance(self.vmin, str) or isinstance(self.vmax, str)):
             with ignore_warning(category=RuntimeWarning):
                 # In case of "All-NaN slices"
-                vmin, vmax = utils.contrast_stretching(data, self.vmin, self.vmax)
+                vmin, vmax = utils.contrast_stretching(
+                    data, self.vmin, self.vmax, max_samples=self.contrast_max_samples
+                )
         else:
             vmin, vmax = self._vmin_numeric, self._vmax_numeric
         # provided vmin, vmax override the calculated value
@@ -376,6 +432,8 @@ def plot(self, data_function_kwargs={}, **kwargs):
                 pass
 
         self.connect()
+        # The view limits and the axes size are only known now
+        self._on_view_changed(self.ax)
         self.render_figure()
 
     def _add_colorbar(self):
@@ -387,11 +445,33 @@ def _add_colorbar(self):
         self._colorbar.set_label(self.quantity_label, rotation=-90, va="bottom")
         self._colorbar.ax.yaxis.set_animated(self.figure.canvas.supports_blit)
 
+    def _get_data_fetcher(self):
+        if not self.asynchronous_data or not supports_timers(self.figure.canvas):
+            return None
+        if self._data_fetcher is None:
+            self._data_fetcher = AsyncDataFetcher(
+                self.data_function, self.figure.canvas, self._on_data_fetched
+            )
+            self.events.closed.connect(self._data_fetcher.close, [])
+        return self._data_fetcher
+
+    def _on_data_fetched(self):
+        if self.figure is not None:
+            self.update()
+
     def _update_data(self):
         # self._current_data caches the displayed data.
-        data = self.data_function(
-            axes_manager=self.axes_manager, **self.data_function_kwargs
-        )
+        fetcher = self._get_data_fetcher()
+        if fetcher is not None and self._current_data is not None:
+            data = fetcher.fetch(self.axes_manager, **self.data_function_kwargs)
+            if data is None:
+                # Keep displaying the current data until the new data is
+                # available
+                return
+        else:
+            data = self.data_function(
+                axes_manager=self.axes_manager, **self.data_function_kwargs
+            )
         # the colorbar of matplotlib ~< 3.2 doesn't support bool array
         if data.dtype == bool:
             data = data.astype(int)
@@ -541,8 +621,7 @@ def format_coord(x, y):
 
         if self.plot_indices is True:
             self._text.set_text(self.axes_manager.indices)
-        if self.no_nans:
-            data = np.nan_to_num(data)
+        data = self._get_display_data(data)
 
         if ims:  # the images have already been drawn previously
             if len(self.ax.images):  # imshow
@@ -594,6 +673,46 @@ def format_coord(x, y):
         if self.axes_ticks == "off":
             self.ax.set_axis_off()
 
+    def _get_display_level(self):
+        # The level of the pyramid with at least one pixel per screen pixel
+        bbox = self.ax.get_window_extent()
+        if bbox.width <= 0 or bbox.height <= 0:
+            return 0
+        xmin, xmax = self.ax.get_xlim()
+        ymin, ymax = self.ax.get_ylim()
+        factor = min(
+            abs(xmax - xmin) / abs(self.xaxis.scale) / bbox.width,
+            abs(ymax - ymin) / abs(self.yaxis.scale) / bbox.height,
+        )
+        return int(np.log2(factor)) if factor >= 2 else 0
+
+    def _get_display_data(self, data):
+        """Return the data to pass to matplotlib: the data itself or a level
+        of the display pyramid for large images."""
+        if (
+            self.pyramid_min_size is None
+            or data.shape[0] * data.shape[1] < self.pyramid_min_size
+            or not (self.xaxis.is_uniform and self.yaxis.is_uniform)
+        ):
+            self._pyramid = None
+            self._display_level = 0
+        else:
+            if self._pyramid is None or self._pyramid.levels[0] is not data:
+                self._pyramid = _DisplayPyramid(data)
+            self._display_level = self._get_display_level()
+            data = self._pyramid.get_level(self._display_level)
+        if self.no_nans:
+            data = np.nan_to_num(data)
+        return data
+
+    def _on_view_changed(self, ax):
+        # Display the level of the pyramid matching the new view limits
+        if self._pyramid is None or not self.ax.images:
+            return
+        if self._get_display_level() != self._display_level:
+            self.ax.images[0].set_data(self._get_display_data(self._pyramid.levels[0]))
+            self.figure.canvas.draw_idle()
+
     def _update(self):
         # This "wrapper" because on_trait_change fiddles with the
         # method arguments and auto contrast does not work then
@@ -621,6 +740,8 @@ def connect(self):
         # in case the figure is not displayed
         if self.figure is not None:
             self.figure.canvas.mpl_connect("key_press_event", self.on_key_press)
+            self.ax.callbacks.connect("xlim_changed", self._on_view_changed)
+            self.ax.callbacks.connect("ylim_changed", self._on_view_changed)
         if self.axes_manager:
             if self.update not in self.axes_manager.events.indices_changed.connected:
                 self.axes_manager.events.indices_changed.connect(self.update, [])
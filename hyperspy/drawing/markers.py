@@ -17,6 +17,7 @@
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import logging
+from collections import OrderedDict
 from copy import deepcopy
 
 import dask.array as da
@@ -41,6 +42,44 @@ def convert_positions(peaks, signal_axes):
     return new_data
 
 
+class _RaggedIndex:
+    """Flat (CSR-style) index of a ragged array of marker arguments.
+
+    The items of the ragged array are concatenated in a single array and the
+    item at a navigation position is the view of this array between two
+    consecutive values of ``indptr``, which avoids indexing the object array
+    at each navigation change. Ragged arrays whose items are not numerical
+    arrays of the same dtype and trailing shape (e.g. lists of strings) are
+    indexed directly.
+
+    Since the items are copied, the ragged array must not be modified after
+    creating the index: it is only used for the computed chunks of the lazy
+    arguments, which are owned by the cache of the markers.
+    """
+
+    def __init__(self, array):
+        self.array = array
+        self.data = None
+        self.indptr = None
+        items = array.ravel()
+        if items.size == 0 or not all(
+            isinstance(item, np.ndarray) and item.ndim > 0 and item.dtype.kind in "biuf"
+            for item in items
+        ):
+            return
+        if len({(item.dtype, item.shape[1:]) for item in items}) != 1:
+            return
+        self.indptr = np.zeros(items.size + 1, dtype=np.intp)
+        np.cumsum([len(item) for item in items], out=self.indptr[1:])
+        self.data = np.concatenate(items)
+
+    def __getitem__(self, indices):
+        if self.data is None:
+            return self.array[indices]
+        i = np.ravel_multi_index(indices, self.array.shape)
+        return self.data[self.indptr[i] : self.indptr[i + 1]]
+
+
 class Markers:
     """A set of markers using Matplotlib collections."""
 
@@ -49,6 +88,8 @@ class Markers:
     # For VerticalLines and HorizontalLines, the key to set is different from
     # `_position_key`
     _position_key_to_set = None
+    # The number of chunks of each lazy argument kept in memory
+    _dask_chunk_cache_size = 4
 
     def __init__(
         self,
@@ -222,8 +263,9 @@ def __init__(
             ):
                 self.kwargs[key] = (value,)
 
-        self._cache_dask_chunk_kwargs = {}
-        self._cache_dask_chunk_kwargs_slice = {}
+        # The ragged index of the computed chunks of the lazy arguments,
+        # keyed by argument and chunk, in least recently used order
+        self._cache_dask_chunk_kwargs = OrderedDict()
 
         self._class_name = self.__class__.__name__
         self.name = name
@@ -493,37 +535,41 @@ def add_items(self, navigation_indices=None, **kwargs):
 
     def _get_cache_dask_kwargs_chunk(self, indices):
         """
-        Get the kwargs at some index.  If the index is cached return the cached value
-        otherwise compute the kwargs and cache them.
+        Get the kwargs at some index.  If the chunk containing the index is
+        cached, return the cached value otherwise compute the chunks of all
+        kwargs at once and cache them.
         """
-        chunks = {key: value.chunks for key, value in self.dask_kwargs.items()}
         chunk_slices = {
-            key: _get_navigation_dimension_chunk_slice(indices, chunk)
-            for key, chunk in chunks.items()
+            key: _get_navigation_dimension_chunk_slice(indices, value.chunks)
+            for key, value in self.dask_kwargs.items()
         }
+        cache = self._cache_dask_chunk_kwargs
+        cache_keys = {}
         to_compute = {}
         for key, value in self.dask_kwargs.items():
-            index_slice = chunk_slices[key]
-            current_slice = self._cache_dask_chunk_kwargs_slice.get(key, None)
-            if current_slice is None or current_slice != index_slice:
-                to_compute[key] = value[index_slice]
-                self._cache_dask_chunk_kwargs_slice[key] = index_slice
+            # slices are not hashable before python 3.12
+            cache_key = (key, tuple((s.start, s.stop) for s in chunk_slices[key]))
+            cache_keys[key] = cache_key
+            if cache_key in cache:
+                cache.move_to_end(cache_key)
+            else:
+                to_compute[cache_key] = value[chunk_slices[key]]
 
         if len(to_compute) > 0:
-            # values = da.compute([value for value in to_compute.values()])
-            # self._cache_dask_chunk_kwargs.update({key: value for
-            #                                      key, value in zip(to_compute.keys(), values)})
-            for key in to_compute:  # this should be one da.compute() function...
-                self._cache_dask_chunk_kwargs[key] = to_compute[key].compute()
+            values = da.compute(*to_compute.values())
+            for cache_key, value in zip(to_compute.keys(), values):
+                cache[cache_key] = _RaggedIndex(value)
+            while len(cache) > self._dask_chunk_cache_size * len(self.dask_kwargs):
+                cache.popitem(last=False)
 
         out_kwargs = {}
-        for key, value in self._cache_dask_chunk_kwargs.items():
-            temp_indices = list(indices)
-            for i, temp_slice in enumerate(chunk_slices[key]):
-                # add offset to the indices
-                temp_indices[i] -= temp_slice.start
-            temp_indices = tuple(temp_indices)
-            out_kwargs[key] = self._cache_dask_chunk_kwargs[key][temp_indices]
+        for key, cache_key in cache_keys.items():
+            # add offset to the indices
+            temp_indices = tuple(
+                index - temp_slice.start
+                for index, temp_slice in zip(indices, chunk_slices[key])
+            )
+            out_kwargs[key] = cache[cache_key][temp_indices]
         return out_kwargs
 
     def __repr__(self):
@@ -774,6 +820,7 @@ def close(self, render_figure=True):
         self._closing = True
         self._collection.remove()
         self._collection = None
+        self._cache_dask_chunk_kwargs.clear()
         self.events.closed.trigger(obj=self)
         self._signal = None
         for f in self.events.closed.connected:
@@ -43,6 +43,9 @@ def __init__(self):
         self.navigator_data_function = None
         # args to pass to `__call__`
         self.signal_data_function_kwargs = {}
+        # Fetch the signal data in a background thread when the figure is
+        # interactive, used for lazy signals
+        self.asynchronous_signal_data = False
         self.axes_manager = None
         self.signal_title = ""
         self.navigator_title = ""
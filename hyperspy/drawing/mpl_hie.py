@@ -34,6 +34,7 @@ def plot_signal(self, **kwargs):
         imf = image.ImagePlot()
         imf.axes_manager = self.axes_manager
         imf.data_function = self.signal_data_function
+        imf.asynchronous_data = self.asynchronous_signal_data
         imf.title = self.signal_title + " Signal"
         imf.xaxis, imf.yaxis = self.axes_manager.signal_axes
 
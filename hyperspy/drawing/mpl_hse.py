@@ -92,6 +92,7 @@ def plot_signal(self, **kwargs):
         sl = signal1d.Signal1DLine()
         is_complex = np.iscomplexobj(self.signal_data_function())
         sl.data_function = self.signal_data_function
+        sl.asynchronous_data = self.asynchronous_signal_data
         kwargs["data_function_kwargs"] = self.signal_data_function_kwargs
         sl.plot_indices = True
         if self.pointer is not None:
@@ -106,6 +107,7 @@ def plot_signal(self, **kwargs):
         if is_complex:
             sl = signal1d.Signal1DLine()
             sl.data_function = self.signal_data_function
+            sl.asynchronous_data = self.asynchronous_signal_data
             sl.plot_coordinates = True
             sl._plot_imag = True
             sl.set_line_properties(color="blue", type="step")
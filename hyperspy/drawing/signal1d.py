@@ -26,6 +26,7 @@
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 from hyperspy.drawing import utils
+from hyperspy.drawing._data_fetcher import AsyncDataFetcher, supports_timers
 from hyperspy.drawing.figure import BlittedFigure
 from hyperspy.events import Event, Events
 from hyperspy.misc.test_utils import ignore_warning
@@ -287,6 +288,10 @@ def __init__(self):
         self.data_function = None
         # args to pass to `__call__`
         self.data_function_kwargs = {}
+        # Fetch the data in a background thread when the figure is
+        # interactive, the `data_function` must accept the `prefetch` argument
+        self.asynchronous_data = False
+        self._data_fetcher = None
         self.axis = None
         self.axes_manager = None
         self._plot_imag = False
@@ -439,15 +444,40 @@ def plot(self, data=1, **kwargs):
         self._y_min, self._y_max = self.ax.get_ylim()
         self.ax.hspy_fig.render_figure()
 
-    def _get_data(self, real_part=False):
-        if self._plot_imag and not real_part:
-            ydata = self.data_function(
+    def _get_data_fetcher(self):
+        canvas = self.ax.figure.canvas
+        if not self.asynchronous_data or not supports_timers(canvas):
+            return None
+        if self._data_fetcher is None:
+            self._data_fetcher = AsyncDataFetcher(
+                self.data_function, canvas, self._on_data_fetched
+            )
+            self.events.closed.connect(self._data_fetcher.close, [])
+        return self._data_fetcher
+
+    def _on_data_fetched(self):
+        if self.line is not None and self.ax.figure is not None:
+            self.update(update_ylimits=True)
+
+    def _fetch_data(self):
+        """Return the data, or None if it is being fetched in a background
+        thread."""
+        fetcher = self._get_data_fetcher()
+        if fetcher is not None and self.line is not None:
+            return fetcher.fetch(self.axes_manager, **self.data_function_kwargs)
+        return self.data_function(
+            axes_manager=self.axes_manager, **self.data_function_kwargs
+        )
+
+    def _get_data(self, real_part=False, data=None):
+        if data is None:
+            data = self.data_function(
                 axes_manager=self.axes_manager, **self.data_function_kwargs
-            ).imag
+            )
+        if self._plot_imag and not real_part:
+            ydata = data.imag
         else:
-            ydata = self.data_function(
-                axes_manager=self.axes_manager, **self.data_function_kwargs
-            ).real
+            ydata = data.real
         return ydata
 
     def _auto_update_line(self, update_ylimits=False, **kwargs):
@@ -485,7 +515,11 @@ def update(self, force_replot=False, render_figure=True, update_ylimits=False):
             self.plot(data_function_kwargs=self.data_function_kwargs, norm=self.norm)
 
         self._y_min, self._y_max = self.ax.get_ylim()
-        ydata = self._get_data()
+        data = self._fetch_data()
+        if data is None:
+            # Keep displaying the current line until the new data is available
+            return
+        ydata = self._get_data(data=data)
 
         # If axis is a DataAxis instance, take the axis attribute
         axis = getattr(self.axis, "axis", self.axis)
@@ -518,7 +552,7 @@ def update(self, force_replot=False, render_figure=True, update_ylimits=False):
 
             if self._plot_imag:
                 # Add real plot
-                yreal = self._get_data(real_part=True)[i1:i2]
+                yreal = self._get_data(real_part=True, data=data)[i1:i2]
                 with ignore_warning(category=RuntimeWarning):
                     # In case of "All-NaN slices"
                     y_min = min(y_min, np.nanmin(yreal))
@@ -27,6 +27,7 @@
 
 class HistogramTilePlot(BlittedFigure):
     def __init__(self):
+        super().__init__()
         self.figure = None
         self.title = ""
         self.ax = None
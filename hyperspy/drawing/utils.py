@@ -20,6 +20,7 @@
 import itertools
 import logging
 import textwrap
+import time
 import warnings
 from functools import partial
 
@@ -31,6 +32,7 @@
 import numpy as np
 import traits.api as t
 from matplotlib.backend_bases import key_press_handler
+from matplotlib.collections import LineCollection
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 from packaging.version import Version
 from rsciio.utils import rgb_tools
@@ -44,7 +46,27 @@
 _logger = logging.getLogger(__name__)
 
 
-def contrast_stretching(data, vmin=None, vmax=None):
+def sample_data(data, max_size=None):
+    """Return a regularly strided view of the data with at most about
+    ``max_size`` elements.
+
+    Parameters
+    ----------
+    data: numpy array
+    max_size: int or None
+        The maximum number of elements. If None, the data is returned.
+
+    Returns
+    -------
+    numpy array
+    """
+    if max_size is None or data.size <= max_size:
+        return data
+    step = int(np.ceil((data.size / max_size) ** (1 / data.ndim)))
+    return data[(slice(None, None, step),) * data.ndim]
+
+
+def contrast_stretching(data, vmin=None, vmax=None, max_samples=None):
     """Estimate bounds of the data to display.
 
     Parameters
@@ -59,6 +81,10 @@ def contrast_stretching(data, vmin=None, vmax=None):
         value. See :func:`numpy.percentile` for more explanation.
         If None, use the percentiles value set in the preferences.
         If float of integer, keep this value as bounds.
+    max_samples: int or None
+        If not None, the percentiles are estimated from a regularly strided
+        subset of the data with at most about ``max_samples`` elements. The
+        0th and 100th percentiles are always calculated from all the data.
 
     Returns
     -------
@@ -92,12 +118,23 @@ def _parse_value(value, value_name):
         # If there is a mask, compressed the data to remove the masked data
         data = np.ma.masked_less_equal(data, 0).compressed()
 
+    def _percentile(value, value_name):
+        value = _parse_value(value, value_name)
+        # The minimum and maximum are much faster to calculate
+        if data.size == 0:
+            return np.nan
+        elif value == 0:
+            return np.float64(np.nanmin(data))
+        elif value == 100:
+            return np.float64(np.nanmax(data))
+        return np.nanpercentile(sample_data(data, max_samples), value)
+
     # If vmin, vmax are float or int, we keep the value, if not we calculate
     # the precentile value
     if not isinstance(vmin, (float, int)):
-        vmin = np.nanpercentile(data, _parse_value(vmin, "vmin"))
+        vmin = _percentile(vmin, "vmin")
     if not isinstance(vmax, (float, int)):
-        vmax = np.nanpercentile(data, _parse_value(vmax, "vmax"))
+        vmax = _percentile(vmax, "vmax")
 
     return vmin, vmax
 
@@ -275,6 +312,52 @@ def subplot_parameters(fig):
     return left, bottom, right, top, wspace, hspace
 
 
+# The minimum number of spectra plotted with ``style="overlap"`` to use a
+# single LineCollection instead of one line per spectrum
+_LINE_COLLECTION_MIN_SPECTRA = 100
+
+
+class _PlotTimings:
+    """Record the time spent in the successive steps of the construction of
+    a plot.
+
+    Each call to :meth:`mark` records the time elapsed since the previous
+    call (or since the creation of the instance) as the duration of the
+    given step. The timings are logged at the debug level by :meth:`log` and
+    the timings of the last plot are stored in ``_PlotTimings.last``.
+
+    Examples
+    --------
+    >>> timings = _PlotTimings("plot_spectra") # doctest: +SKIP
+    >>> fig = plt.figure() # doctest: +SKIP
+    >>> timings.mark("figure") # doctest: +SKIP
+    >>> ax.plot(x, y) # doctest: +SKIP
+    >>> timings.mark("artists") # doctest: +SKIP
+    >>> timings.log() # doctest: +SKIP
+    """
+
+    last = {}
+
+    def __init__(self, name):
+        self.name = name
+        self.timings = {}
+        self._start = self._last = time.perf_counter()
+
+    def mark(self, step):
+        now = time.perf_counter()
+        self.timings[step] = self.timings.get(step, 0.0) + now - self._last
+        self._last = now
+
+    def log(self):
+        self.timings["total"] = time.perf_counter() - self._start
+        _PlotTimings.last = dict(self.timings, function=self.name)
+        _logger.debug(
+            "%s timings: %s",
+            self.name,
+            ", ".join(f"{k}: {v * 1e3:.1f} ms" for k, v in self.timings.items()),
+        )
+
+
 class ColorCycle:
     _color_cycle = [
         mcolors.to_rgba(color) for color in ("b", "g", "r", "c", "m", "y", "k")
@@ -445,6 +528,48 @@ def _make_overlap_plot(spectra, ax, color, linestyle, normalise, **kwargs):
     ax.autoscale(tight=True)
 
 
+def _get_overlap_segments(spectra, normalise):
+    """Return the (x, y) segments of the spectra to plot in a LineCollection."""
+    from hyperspy.signal import BaseSignal
+
+    if (
+        isinstance(spectra, BaseSignal)
+        and spectra.axes_manager.signal_dimension == 1
+        and spectra.axes_manager.navigation_dimension == 1
+    ):
+        # all spectra at once
+        x = spectra.axes_manager.signal_axes[0].axis
+        data = _parse_array(spectra)
+        if normalise:
+            data_min = data.min(axis=-1, keepdims=True)
+            data = (data - data_min) / (data.max(axis=-1, keepdims=True) - data_min)
+        segments = np.empty(data.shape + (2,))
+        segments[..., 0] = x
+        segments[..., 1] = data
+        return list(segments)
+    segments = []
+    for spectrum in spectra:
+        x_axis = spectrum.axes_manager.signal_axes[0]
+        spectrum = _transpose_if_required(spectrum, 1)
+        segments.append(
+            np.column_stack([x_axis.axis, _parse_array(spectrum, normalise)])
+        )
+    return segments
+
+
+def _make_overlap_collection(spectra, ax, color, linestyle, normalise):
+    segments = _get_overlap_segments(spectra, normalise)
+    collection = LineCollection(
+        segments,
+        colors=list(itertools.islice(color, len(segments))),
+        linestyles=list(itertools.islice(linestyle, len(segments))),
+    )
+    ax.add_collection(collection)
+    _set_spectrum_xlabel(spectra, ax)
+    ax.autoscale(tight=True)
+    return collection
+
+
 def _make_cascade_subplot(
     spectra, ax, color, linestyle, normalise, padding=1, **kwargs
 ):
@@ -540,6 +665,7 @@ def plot_images(
     legend_picking=True,
     legend_loc="upper right",
     pixel_size_factor=None,
+    mosaic=False,
     **kwargs,
 ):
     """Plot multiple images either as sub-images or overlayed in one figure.
@@ -677,6 +803,15 @@ def plot_images(
         plotting an overlay image. The higher the number the larger the figure
         and therefore a greater number of pixels are used. This value will be
         ignored if a Figure is provided.
+    mosaic : bool, optional
+        If True, the images are tiled (``per_row`` images per row) in a single
+        image displayed with one call to :func:`matplotlib.pyplot.imshow`,
+        using the same contrast for all images. This is much faster than
+        plotting each image in its own subplot when plotting many images, but
+        the images must have the same shape, and the labels, scalebars and
+        axes decorations are not displayed. Incompatible with
+        ``overlay=True``. The colorbar is always a single colorbar when
+        ``colorbar`` is not None. Default is False.
     **kwargs, optional
         Additional keyword arguments passed to :func:`matplotlib.pyplot.imshow`.
 
@@ -718,6 +853,8 @@ def __check_single_colorbar(cbar):
     from hyperspy.drawing.widgets import ScaleBar
     from hyperspy.signal import BaseSignal
 
+    timings = _PlotTimings("plot_images")
+
     # Check that we have a hyperspy signal
     im = [images] if not isinstance(images, (list, tuple)) else images
     for image in im:
@@ -753,6 +890,13 @@ def __check_single_colorbar(cbar):
             else 1
         )
 
+    if mosaic:
+        if overlay:
+            raise ValueError("`mosaic=True` is not compatible with `overlay=True`.")
+        # all images have the same contrast
+        if colorbar in ["default", "multi"]:
+            colorbar = "single"
+
     # Check compatibility of colorbar and overlay arguments
     if overlay and colorbar != "default":
         _logger.info(
@@ -808,6 +952,25 @@ def __check_single_colorbar(cbar):
     centre_colormaps = itertools.cycle(centre_colormaps)
     cmap = itertools.cycle(cmap)
 
+    if mosaic:
+        return _plot_images_mosaic(
+            images,
+            per_row=per_row,
+            cmap=next(cmap),
+            centre=next(centre_colormaps),
+            colorbar=colorbar,
+            vmin=vmin,
+            vmax=vmax,
+            no_nans=no_nans,
+            suptitle=suptitle,
+            suptitle_fontsize=suptitle_fontsize,
+            fig=fig,
+            padding=padding,
+            tight_layout=tight_layout,
+            timings=timings,
+            **kwargs,
+        )
+
     # Sort out the labeling:
     div_num = 0
     all_match = False
@@ -948,6 +1111,7 @@ def __check_single_colorbar(cbar):
         f = plt.figure(figsize=figsize, dpi=dpi)
     else:
         f = fig
+    timings.mark("figure")
 
     # Initialize list to hold subplot axes
     axes_list = []
@@ -1000,6 +1164,7 @@ def check_list_length(arg, arg_name):
     else:
         vmin = check_list_length(vmin, "vmin")
         vmax = check_list_length(vmax, "vmax")
+    timings.mark("contrast")
 
     idx = 0
     ax_im_list = [0] * len(isrgb)
@@ -1243,6 +1408,7 @@ def transparent_single_color_cmap(color):
                 replot_ims.append(im)
 
                 idx += 1
+    timings.mark("artists")
 
     # If using a single colorbar, add it, and do tight_layout, ensuring that
     # a colorbar is only added based off of non-rgb Images:
@@ -1273,6 +1439,7 @@ def transparent_single_color_cmap(color):
     # Adjust subplot spacing according to user's specification
     if padding is not None:
         plt.subplots_adjust(**padding)
+    timings.mark("layout")
 
     # Replot: connect function
     def on_dblclick(event):
@@ -1320,9 +1487,95 @@ def update_image(image, ax, image_index):
         disconnect = partial(image.events.data_changed.disconnect, f)
         on_figure_window_close(ax.get_figure(), disconnect)
 
+    timings.log()
     return axes_list
 
 
+def _plot_images_mosaic(
+    images,
+    per_row,
+    cmap,
+    centre,
+    colorbar,
+    vmin,
+    vmax,
+    no_nans,
+    suptitle,
+    suptitle_fontsize,
+    fig,
+    padding,
+    tight_layout,
+    timings,
+    **kwargs,
+):
+    """Plot the images tiled in a single image, see :func:`plot_images`."""
+    planes = []
+    for image in images:
+        data = _parse_array(image)
+        if rgb_tools.is_rgbx(data):
+            raise ValueError("RGB images can't be plotted with `mosaic=True`.")
+        # the navigation dimensions are iterated in "flyback" order
+        planes.append(data.reshape((-1,) + data.shape[-2:]))
+    if len({plane.shape[1:] for plane in planes}) != 1:
+        raise ValueError(
+            "The images must have the same shape to be plotted with `mosaic=True`."
+        )
+    planes = np.concatenate(planes)
+    if no_nans:
+        planes = np.nan_to_num(planes)
+    n, height, width = planes.shape
+    per_row = min(per_row, n)
+    rows = int(np.ceil(n / per_row))
+    # The missing tiles of the last row are transparent
+    tiles = np.full(
+        (rows * per_row, height, width),
+        np.nan,
+        dtype=np.result_type(planes.dtype, np.float32),
+    )
+    tiles[:n] = planes
+    tiles = tiles.reshape((rows, per_row, height, width)).swapaxes(1, 2)
+    tiles = tiles.reshape((rows * height, per_row * width))
+    timings.mark("data")
+
+    if any([isinstance(v, (tuple, list)) for v in [vmin, vmax]]):
+        _logger.warning(
+            "The provided vmin or vmax value are ignored "
+            "because it needs to be a scalar or a str "
+            "to be compatible with `mosaic=True`. "
+            "The default values are used instead."
+        )
+        vmin, vmax = None, None
+    _vmin, _vmax = contrast_stretching(planes, vmin, vmax)
+    if centre:
+        _vmin, _vmax = centre_colormap_values(_vmin, _vmax)
+    timings.mark("contrast")
+
+    if fig is None:
+        w, h = plt.rcParams["figure.figsize"]
+        k = max(w, h) / max(per_row, rows)
+        fig = plt.figure(figsize=(k * per_row, k * rows))
+    ax = fig.add_subplot()
+    kwargs.setdefault("interpolation", "nearest")
+    axes_im = ax.imshow(tiles, cmap=cmap, vmin=_vmin, vmax=_vmax, **kwargs)
+    set_axes_decor(ax, "off")
+    timings.mark("artists")
+
+    if colorbar is not None:
+        div = make_axes_locatable(ax)
+        cax = div.append_axes("right", size="5%", pad=0.05)
+        plt.colorbar(axes_im, cax=cax)
+    if tight_layout:
+        fig.tight_layout()
+    if suptitle:
+        fig.suptitle(suptitle, fontsize=suptitle_fontsize)
+    if padding is not None:
+        fig.subplots_adjust(**padding)
+    timings.mark("layout")
+    timings.log()
+
+    return [ax]
+
+
 def _parse_vmin_vmax(data, vmin, vmax, index, centre):
     _vmin = vmin[index] if isinstance(vmin, (tuple, list)) else vmin
     _vmax = vmax[index] if isinstance(vmax, (tuple, list)) else vmax
@@ -1426,6 +1679,7 @@ def plot_spectra(
     ax=None,
     auto_update=None,
     normalise=False,
+    line_collection=None,
     **kwargs,
 ):
     """Plot several spectra in the same figure.
@@ -1486,6 +1740,13 @@ def plot_spectra(
         If None (default), update the plot only for style='overlap'.
     normalise : bool, default False
         If True, the data are normalised to the [0, 1] interval in the plot.
+    line_collection : bool or None, default None
+        Only for ``style='overlap'``. If True, the spectra are drawn as a
+        single :class:`matplotlib.collections.LineCollection` instead of one
+        line per spectrum, which is much faster for a large number of
+        spectra but is not compatible with ``legend`` and ``drawstyle``.
+        If None (default), a ``LineCollection`` is used for 100 spectra or
+        more when ``legend`` is None and ``drawstyle`` is ``'default'``.
     **kwargs : dict
         Depending on the style used, the keyword arguments are passed to different functions
 
@@ -1573,14 +1834,35 @@ def _reverse_legend(ax_, legend_loc_):
     else:
         ylabel = "Intensity"
 
+    if style != "overlap":
+        line_collection = False
+    elif line_collection is None:
+        line_collection = (
+            len(spectra) >= _LINE_COLLECTION_MIN_SPECTRA
+            and legend is None
+            and drawstyle == "default"
+        )
+    elif line_collection and (legend is not None or drawstyle != "default"):
+        raise ValueError(
+            "`line_collection=True` is not compatible with `legend` and `drawstyle`."
+        )
+
+    timings = _PlotTimings("plot_spectra")
     if style == "overlap":
         if fig is None:
             fig = plt.figure(**kwargs)
         if ax is None:
             ax = fig.add_subplot(111)
-        _make_overlap_plot(
-            spectra, ax, color, linestyle, normalise, drawstyle=drawstyle
-        )
+        timings.mark("figure")
+        if line_collection:
+            collection = _make_overlap_collection(
+                spectra, ax, color, linestyle, normalise
+            )
+        else:
+            _make_overlap_plot(
+                spectra, ax, color, linestyle, normalise, drawstyle=drawstyle
+            )
+        timings.mark("artists")
         ax.set_ylabel(ylabel)
         if legend is not None:
             ax.legend(legend, loc=legend_loc)
@@ -1592,6 +1874,7 @@ def _reverse_legend(ax_, legend_loc_):
             fig = plt.figure(**kwargs)
         if ax is None:
             ax = fig.add_subplot(111)
+        timings.mark("figure")
         _make_cascade_subplot(
             spectra,
             ax,
@@ -1601,6 +1884,7 @@ def _reverse_legend(ax_, legend_loc_):
             padding=padding,
             drawstyle=drawstyle,
         )
+        timings.mark("artists")
         if legend is not None:
             ax.legend(legend, loc=legend_loc)
             _reverse_legend(ax, legend_loc)
@@ -1611,6 +1895,7 @@ def _reverse_legend(ax_, legend_loc_):
         default_fsize = plt.rcParams["figure.figsize"]
         figsize = (default_fsize[0], default_fsize[1] * len(spectra))
         fig, subplots = plt.subplots(len(spectra), 1, figsize=figsize, **kwargs)
+        timings.mark("figure")
         if legend is None:
             legend = [legend] * len(spectra)
         for spectrum, ax, color, linestyle, legend in zip(
@@ -1632,6 +1917,7 @@ def _reverse_legend(ax_, legend_loc_):
                 _set_spectrum_xlabel(spectrum, ax)
         if isinstance(spectra, BaseSignal):
             _set_spectrum_xlabel(spectrum, ax)
+        timings.mark("artists")
         fig.tight_layout()
 
     elif style == "heatmap":
@@ -1643,6 +1929,8 @@ def _reverse_legend(ax_, legend_loc_):
         with spectra.unfolded():
             ax = _make_heatmap_subplot(spectra, normalise, **kwargs)
             ax.set_ylabel("Spectra")
+        timings.mark("artists")
+    timings.mark("layout")
     ax = ax if style != "mosaic" else subplots
 
     def update_line(spectrum, line, normalise):
@@ -1655,6 +1943,25 @@ def update_line(spectrum, line, normalise):
         ax.autoscale_view()
         fig.canvas.draw()
 
+    def update_collection(collection):
+        ax = collection.axes
+        # `relim` doesn't support collections
+        ax.ignore_existing_data_limits = True
+        ax.update_datalim(collection.get_datalim(ax.transData).get_points())
+        ax.autoscale_view()
+        ax.get_figure().canvas.draw()
+
+    def update_segment(spectrum, collection, index, normalise):
+        x_axis = spectrum.axes_manager[-1].axis
+        segments = collection.get_segments()
+        segments[index] = np.column_stack([x_axis, _parse_array(spectrum, normalise)])
+        collection.set_segments(segments)
+        update_collection(collection)
+
+    def update_segments(spectra, collection, normalise):
+        collection.set_segments(_get_overlap_segments(spectra, normalise))
+        update_collection(collection)
+
     if auto_update is None and style == "overlap":
         auto_update = True
 
@@ -1664,13 +1971,40 @@ def update_line(spectrum, line, normalise):
                 "auto_update=True is only supported with " "style='overlap'."
             )
 
-        for s, line in zip(spectra, ax.get_lines()):
-            f = partial(update_line, s, line=line, normalise=normalise)
+        if line_collection and isinstance(spectra, BaseSignal):
+            # all the segments are updated at once when the data of the
+            # signal change
+            callbacks = [
+                (
+                    spectra,
+                    partial(
+                        update_segments,
+                        spectra,
+                        collection=collection,
+                        normalise=normalise,
+                    ),
+                )
+            ]
+        else:
+            if line_collection:
+                updates = [
+                    partial(update_segment, collection=collection, index=i)
+                    for i in range(len(spectra))
+                ]
+            else:
+                updates = [partial(update_line, line=line) for line in ax.get_lines()]
+            callbacks = [
+                (s, partial(update, s, normalise=normalise))
+                for s, update in zip(spectra, updates)
+            ]
+        for s, f in callbacks:
             s.events.data_changed.connect(f, [])
             # disconnect event when closing figure
             disconnect = partial(s.events.data_changed.disconnect, f)
             on_figure_window_close(fig, disconnect)
+        timings.mark("auto_update")
 
+    timings.log()
     return ax
 
 
@@ -17,6 +17,11 @@
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import inspect
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_logger = logging.getLogger(__name__)
 
 
 def _connect_events(event, to_connect):
@@ -59,17 +64,56 @@ class Interactive:
         events, in which case all the events are connected.
     *args :
         Arguments to be passed to ``f``.
+    update_interval : float or None, default None
+        If not None, the minimum time in seconds between two updates of the
+        result: the events triggered during this interval are merged and the
+        operation is performed once, with the latest state, at the end of the
+        interval. This avoids repeating the operation many times when the
+        events are triggered continuously, e.g. when dragging a widget.
+    background : bool, default False
+        If True, the operation is performed in a background thread, so that
+        the events return immediately. When a new update is requested while
+        the operation is running, the running operation is considered stale:
+        it is not interrupted, but its result is discarded and the ``out``
+        object is only updated with the result of the latest operation. Use
+        :meth:`Interactive.wait` to wait for the pending operations to
+        complete. As with ``update_interval``, if ``out`` is plotted with an
+        interactive matplotlib backend, it is updated from the GUI thread
+        using a timer of the canvas of its figure.
     **kwargs : dict
         Keyword arguments to be passed to ``f``.
 
     """
 
-    def __init__(self, f, event="auto", recompute_out_event="auto", *args, **kwargs):
+    def __init__(
+        self,
+        f,
+        event="auto",
+        recompute_out_event="auto",
+        *args,
+        update_interval=None,
+        background=False,
+        **kwargs,
+    ):
         from hyperspy.signal import BaseSignal
 
         self.f = f
         self.args = args
         self.kwargs = kwargs
+        self.update_interval = update_interval
+        self.background = background
+        self._lock = threading.RLock()
+        # Incremented every time an update is requested, to identify the
+        # results of stale operations
+        self._generation = 0
+        self._pending = None
+        self._queued = False
+        self._timer = None
+        self._executor = None
+        # The result of the latest background operation and the timer of the
+        # canvas used to set it from the GUI thread
+        self._result = None
+        self._poll_timer = None
         _plot_kwargs = self.kwargs.pop("_plot_kwargs", None)
         if "out" in self.kwargs:
             self.f(*self.args, **self.kwargs)
@@ -108,8 +152,29 @@ def __init__(self, f, event="auto", recompute_out_event="auto", *args, **kwargs)
                 #  We "simulate" out by triggering `recompute_out` instead.
                 _connect_events(event, self.recompute_out)
 
+    @property
+    def _deferred(self):
+        return self.background or bool(self.update_interval)
+
     def recompute_out(self):
-        out = self.f(*self.args, **self.kwargs)
+        if self._deferred:
+            self._schedule("recompute_out")
+        else:
+            self._recompute_out()
+
+    def update(self):
+        if self._deferred:
+            self._schedule("update")
+        else:
+            self._update()
+
+    def _recompute_out(self):
+        self._set_out(self.f(*self.args, **self.kwargs))
+
+    def _update(self):
+        self.f(*self.args, out=self.out, **self.kwargs)
+
+    def _set_out(self, out):
         if out is None:
             return
         if out.data.shape == self.out.data.shape:
@@ -120,8 +185,128 @@ def recompute_out(self):
         self.out.axes_manager.update_axes_attributes_from(out.axes_manager._axes)
         self.out.events.data_changed.trigger(self.out)
 
-    def update(self):
-        self.f(*self.args, out=self.out, **self.kwargs)
+    def _get_canvas(self):
+        # The canvas of the figure displaying `out`, if its timers are run
+        from hyperspy.drawing._data_fetcher import supports_timers
+
+        plot = getattr(self.out, "_plot", None)
+        if plot is None or not plot.is_active or plot.signal_plot is None:
+            return None
+        canvas = plot.signal_plot.figure.canvas
+        return canvas if supports_timers(canvas) else None
+
+    def _schedule(self, kind):
+        with self._lock:
+            self._generation += 1
+            if self._pending != "recompute_out":
+                # A full recomputation also takes care of the update
+                self._pending = kind
+            if self.update_interval:
+                if self._timer is None:
+                    canvas = self._get_canvas()
+                    if canvas is None:
+                        self._timer = threading.Timer(self.update_interval, self._flush)
+                        self._timer.daemon = True
+                    else:
+                        # Flush from the GUI thread
+                        self._timer = canvas.new_timer(
+                            interval=int(self.update_interval * 1000)
+                        )
+                        self._timer.single_shot = True
+                        self._timer.add_callback(self._flush)
+                    self._timer.start()
+                return
+        self._flush()
+
+    def _flush(self):
+        with self._lock:
+            self._timer = None
+            if self._pending is None:
+                return
+            if self.background:
+                # A single operation is queued at a time: it is performed
+                # with the latest state when the running one is finished.
+                if not self._queued:
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="hyperspy-interactive"
+                        )
+                    self._queued = True
+                    self._executor.submit(self._run)
+                canvas = self._get_canvas()
+                if canvas is not None and self._poll_timer is None:
+                    # As `AsyncDataFetcher`, the result is set from the GUI
+                    # thread, which checks for it with a timer of the canvas
+                    self._poll_timer = canvas.new_timer(interval=20)
+                    self._poll_timer.add_callback(self._poll)
+                    self._poll_timer.start()
+                return
+        self._run()
+
+    def _run(self):
+        with self._lock:
+            self._queued = False
+            kind, self._pending = self._pending, None
+            generation = self._generation
+        if kind is None:
+            return
+        try:
+            if not self.background:
+                getattr(self, "_" + kind)()
+                return
+            # The operation can't safely write in `out` while it is
+            # displayed, so a new object is always computed.
+            out = self.f(*self.args, **self.kwargs)
+        except Exception:
+            _logger.exception(f"The interactive operation {self.f} failed.")
+            out = None
+        with self._lock:
+            if generation != self._generation:
+                _logger.debug("Discarding the result of a stale operation.")
+                return
+            if self._poll_timer is None:
+                self._set_out(out)
+            else:
+                self._result = (generation, out)
+
+    def _poll(self):
+        with self._lock:
+            result, self._result = self._result, None
+            if result is None:
+                return
+            if self._pending is None and not self._queued:
+                # The latest operation is done
+                self._stop_poll_timer()
+            if result[0] != self._generation:
+                return
+        self._set_out(result[1])
+
+    def _stop_poll_timer(self):
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+            self._poll_timer = None
+
+    def wait(self, timeout=None):
+        """Wait for the pending operations to complete.
+
+        Parameters
+        ----------
+        timeout : float or None, default None
+            The maximum time to wait, in seconds. If None, wait until all the
+            pending operations are completed.
+        """
+        timer = self._timer
+        if isinstance(timer, threading.Timer):
+            timer.join(timeout)
+        elif timer is not None:
+            # The timer of a canvas: flush now
+            timer.stop()
+            self._flush()
+        if self._executor is not None:
+            # The operations are run in order by a single thread
+            self._executor.submit(lambda: None).result(timeout)
+        if self._poll_timer is not None:
+            self._poll()
 
 
 def interactive(f, event="auto", recompute_out_event="auto", *args, **kwargs):
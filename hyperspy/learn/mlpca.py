@@ -24,16 +24,87 @@
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+from numpy.linalg import svd
 
-from hyperspy.learn.svd_pca import svd_solve
+from hyperspy.learn.svd_pca import svd_flip_signs, svd_solve
 
 _logger = logging.getLogger(__name__)
 
 
+def _weighted_projection(X, inv_v, U, chunk_size, num_workers):
+    """Project each column of X onto the span of U using weighted least squares.
+
+    The columns are processed in blocks and the weighted normal equations
+    of every column of a block are solved at once. Each block only
+    allocates temporary arrays of size ``m * chunk_size``, which avoids
+    materializing the full variance-weighted matrix.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        Matrix of observations with shape (m, n). It can be a transposed
+        view of the original data.
+    inv_v : numpy.ndarray
+        Inverse of the variances with the same shape as X.
+    U : numpy.ndarray
+        Orthonormal basis with shape (m, k).
+    chunk_size : int
+        Number of columns processed in each block.
+    num_workers : int
+        Number of threads used to process the blocks.
+
+    Returns
+    -------
+    C : numpy.ndarray
+        Coefficients with shape (k, n) such that the maximum likelihood
+        estimate of X is ``U @ C``.
+    float
+        Value of the objective function.
+
+    """
+    m, n = X.shape
+    k = U.shape[1]
+    # Outer products of the rows of U, so that the k x k normal matrices
+    # of all the columns of a block are computed with a single product
+    UU = (U[:, :, np.newaxis] * U[:, np.newaxis, :]).reshape(m, k * k)
+    C = np.empty((k, n))
+
+    def _project_block(sl):
+        Xb = X[:, sl]
+        Wb = inv_v[:, sl]
+        A = (Wb.T @ UU).reshape(-1, k, k)
+        b = (Wb * Xb).T @ U
+        Cb = np.linalg.solve(A, b[..., np.newaxis])[..., 0]
+        C[:, sl] = Cb.T
+        dx = Xb - U @ Cb.T
+        return np.einsum("ij,ij,ij->", dx, Wb, dx)
+
+    slices = [slice(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size)]
+    if num_workers > 1 and len(slices) > 1:
+        # numpy releases the GIL in the linear algebra routines
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            s_obj = sum(executor.map(_project_block, slices))
+    else:
+        s_obj = sum(_project_block(sl) for sl in slices)
+
+    return C, s_obj
+
+
 def mlpca(
-    X, varX, output_dimension, svd_solver="auto", tol=1e-10, max_iter=50000, **kwargs
+    X,
+    varX,
+    output_dimension,
+    svd_solver="auto",
+    tol=1e-10,
+    max_iter=50000,
+    chunk_size=None,
+    num_workers=None,
+    return_info=False,
+    **kwargs,
 ):
     """Performs maximum likelihood PCA with missing data and/or heteroskedastic noise.
 
@@ -59,6 +130,9 @@ def mlpca(
     output_dimension : int
         The model dimensionality.
     svd_solver : {``"auto"``, ``"full"``, ``"arpack"``, ``"randomized"``}, default ``"auto"``
+        Solver used to compute the initial estimate of the subspace from
+        the centred data.
+
         If auto:
             The solver is selected by a default policy based on ``data.shape`` and
             `output_dimension`: if the input data is larger than 500x500 and the
@@ -80,6 +154,15 @@ def mlpca(
         Tolerance of the stopping condition.
     max_iter : int
         Maximum number of iterations before exiting without convergence.
+    chunk_size : None or int, default None
+        Number of rows or columns projected together in each alternating
+        least squares step. Larger values are faster but use more memory.
+        If None, the blocks are chosen to hold about 4 million elements.
+    num_workers : None or int, default None
+        Number of threads used to process the blocks. If None, use
+        the number of CPUs.
+    return_info : bool, default False
+        If True, also return a dictionary with convergence diagnostics.
 
     Returns
     -------
@@ -87,6 +170,12 @@ def mlpca(
         The pseudo-SVD parameters.
     float
         Value of the objective function.
+    dict
+        Only returned if ``return_info=True``. Contains the number of
+        iterations (``"n_iter"``), whether the stopping condition was
+        reached (``"converged"``), the value of the objective function
+        (``"objective"``) and of the stop criterion (``"stop_criterion"``)
+        at each iteration where it is evaluated.
 
     References
     ----------
@@ -98,6 +187,9 @@ def mlpca(
     """
     m, n = X.shape
 
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
     with np.errstate(divide="ignore"):
         # Shouldn't really have zero variance anywhere,
         # except for missing data but handle it here.
@@ -106,50 +198,78 @@ def mlpca(
 
     _logger.info("Performing maximum likelihood principal components analysis")
 
-    # Generate initial estimates
+    # Generate initial estimates from the principal components of the
+    # centred data, which avoids computing the m x m covariance matrix
     _logger.info("Generating initial estimates")
-    U, _, _ = svd_solve(np.cov(X), svd_solver=svd_solver, **kwargs)
+    U, _, _ = svd_solve(
+        X - X.mean(axis=1, keepdims=True),
+        output_dimension=output_dimension,
+        svd_solver=svd_solver,
+        **kwargs,
+    )
     U = U[:, :output_dimension]
     s_old = 0.0
+    converged = False
+    objective = []
+    stop_criteria = []
 
-    # Placeholders
-    F = np.empty((m, n))
-    M = np.zeros((m, n))
-    Uq = np.zeros((output_dimension, m))
+    # The alternation works on transposed views of X and inv_v
+    transposed = False
 
     # Loop for alternating least squares
     _logger.info("Optimization iteration loop")
     for itr in range(max_iter):  # pragma: no branch
-        s_obj = 0.0
+        X_ = X.T if transposed else X
+        inv_v_ = inv_v.T if transposed else inv_v
+        if chunk_size is None:
+            chunk_size_ = max(1, 2**22 // X_.shape[0])
+        else:
+            chunk_size_ = chunk_size
 
-        for i in range(n):
-            Uq = U.T * inv_v[:, i]
-            F = np.linalg.inv(Uq @ U)
-            M[:, i] = np.linalg.multi_dot([U, F, Uq, X[:, i].T])
-            dx = X[:, i] - M[:, i]
-            s_obj += (dx * inv_v[:, i]) @ dx.T
+        C, s_obj = _weighted_projection(X_, inv_v_, U, chunk_size_, num_workers)
+        # Keep track of the basis and orientation of the current estimate
+        UC, transposed_C = U, transposed
+        objective.append(s_obj)
 
         # Every second iteration, check the stop criterion
         if itr > 0 and itr % 2 == 0:
             stop_criterion = abs(s_old - s_obj) / s_obj
+            stop_criteria.append(stop_criterion)
             _logger.info(f"Iteration: {itr // 2}, convergence: {stop_criterion}")
 
             if stop_criterion < tol:
+                converged = True
                 break
 
-        # Transpose for next iteration
+        # The estimate M = U @ C has rank output_dimension and U is
+        # orthonormal, so the right singular vectors of M, which are the
+        # basis for the next iteration, are those of the small matrix C.
         s_old = s_obj
-        _, _, V = svd_solve(M, svd_solver=svd_solver, **kwargs)
-
-        X = X.T
-        inv_v = inv_v.T
-        F = F.T
-        M = M.T
+        _, _, V = svd(C, full_matrices=False)
 
-        m, n = X.shape
+        transposed = not transposed
         U = V[:output_dimension].T
 
-    U, S, V = svd_solve(M, svd_solver=svd_solver, **kwargs)
+    if not converged:
+        _logger.warning(
+            f"MLPCA did not converge after {max_iter} iterations. "
+            "Consider increasing `max_iter` or `tol`."
+        )
+
+    Uc, S, V = svd(C, full_matrices=False)
+    U = UC @ Uc
+    if transposed_C:
+        U, V = V.T, U.T
+    U, V = svd_flip_signs(U, V)
     V = V.T
 
+    if return_info:
+        info = {
+            "n_iter": itr + 1,
+            "converged": converged,
+            "objective": np.array(objective),
+            "stop_criterion": np.array(stop_criteria),
+        }
+        return U, S, V, s_obj, info
+
     return U, S, V, s_obj
@@ -218,9 +218,11 @@ def decomposition(
 
         Returns
         -------
-         tuple of numpy.ndarray or sklearn.base.BaseEstimator or None
+         tuple of numpy.ndarray, dict, sklearn.base.BaseEstimator or None
             * If True and 'algorithm' in ['RPCA', 'ORPCA', 'ORNMF'], returns
               the low-rank (X) and sparse (E) matrices from robust PCA/NMF.
+            * If True and 'algorithm' is 'MLPCA', returns a dictionary with
+              the convergence diagnostics of :func:`~.learn.mlpca.mlpca`.
             * If True and 'algorithm' is an sklearn Estimator, returns the
               Estimator object.
             * Otherwise, returns None
@@ -440,11 +442,12 @@ def decomposition(
                             "defining the coefficients of a polynomial"
                         )
 
-                U, S, V, Sobj = mlpca(
+                U, S, V, Sobj, info = mlpca(
                     data_,
                     var_array,
                     output_dimension,
                     svd_solver=svd_solver,
+                    return_info=True,
                     **kwargs,
                 )
 
@@ -452,6 +455,9 @@ def decomposition(
                 factors = V
                 explained_variance = S**2 / len(factors)
 
+                if return_info:
+                    to_return = info
+
             elif algorithm == "RPCA":
                 X, E, U, S, V = rpca_godec(data_, rank=output_dimension, **kwargs)
 
@@ -659,6 +665,7 @@ def blind_source_separation(
         on_loadings=False,
         reverse_component_criterion="factors",
         whiten_method="PCA",
+        max_samples=None,
         return_info=False,
         print_info=True,
         **kwargs,
@@ -711,6 +718,14 @@ def blind_source_separation(
             How to whiten the data prior to blind source separation.
             If None, no whitening is applied. See :func:`~.learn.whitening.whiten_data`
             for more details.
+        max_samples : None or int, default None
+            If not None, the unmixing matrix is learnt from at most
+            ``max_samples`` regularly spaced samples, i.e. signal positions
+            when `on_loadings` is False or navigation positions when
+            `on_loadings` is True. The unmixing matrix is then applied to all
+            the samples. For lazy signals, only the selected samples are
+            computed, which is useful with `on_loadings=True` when the
+            navigation space is large.
         return_info: bool, default False
             The result of the decomposition is stored internally. However,
             some algorithms generate some extra information that is not
@@ -751,11 +766,6 @@ def blind_source_separation(
                 else:
                     factors = self.get_decomposition_factors()
 
-        if hasattr(factors, "compute"):
-            # if the factors are lazy, we compute them, which should be fine
-            # since we already reduce the dimensionality of the data.
-            factors.compute()
-
         # Check factors
         if not isinstance(factors, BaseSignal):
             raise TypeError(
@@ -763,6 +773,12 @@ def blind_source_separation(
                 f"of type {type(factors)} was provided"
             )
 
+        if isinstance(factors.data, da.Array) and not factors._lazy:
+            # The results of a lazy decomposition are dask arrays. They
+            # are kept lazy and only the samples used to learn the
+            # unmixing matrix are computed below.
+            factors = factors.as_lazy()
+
         # Check factor dimensions
         if factors.axes_manager.navigation_dimension != 1:
             raise ValueError(
@@ -907,11 +923,20 @@ def blind_source_separation(
 
         # Unfold in case the signal_dimension > 1
         factors.unfold()
+        factors = factors.data.T
         if mask is not None:
             mask.unfold()
-            factors = factors.data.T[np.where(~mask.data)]
+            samples = np.flatnonzero(~mask.data)
         else:
-            factors = factors.data.T
+            samples = np.arange(factors.shape[0])
+        if max_samples is not None and len(samples) > max_samples:
+            samples = samples[
+                np.linspace(0, len(samples) - 1, max_samples).round().astype(int)
+            ]
+        if len(samples) < factors.shape[0]:
+            factors = factors[samples]
+        if isinstance(factors, da.Array):
+            factors = factors.compute()
 
         # Center and whiten the data via PCA or ZCA methods
         if whiten_method is not None:
@@ -1126,14 +1151,20 @@ def reverse_bss_component(self, component_number):
         >>> s.reverse_bss_component((0, 2)) # doctest: +SKIP
 
         """
-        if hasattr(self.learning_results.bss_factors, "compute"):
-            _logger.warning(
-                f"Component(s) {component_number} not reversed, "
-                "feature not implemented for lazy computations"
-            )
+        target = self.learning_results
+        if isinstance(target.bss_factors, da.Array) or isinstance(
+            target.bss_loadings, da.Array
+        ):
+            # Multiplying by the signs keeps the results lazy. The unmixing
+            # matrix must not be changed in place since it can be referenced
+            # by the task graph of the lazy results.
+            _logger.info(f"Component {component_number} reversed")
+            signs = np.ones(target.bss_factors.shape[1])
+            signs[list(np.atleast_1d(component_number))] = -1
+            target.bss_factors = target.bss_factors * signs
+            target.bss_loadings = target.bss_loadings * signs
+            target.unmixing_matrix = target.unmixing_matrix * signs[:, np.newaxis]
         else:
-            target = self.learning_results
-
             for i in [component_number]:
                 _logger.info(f"Component {i} reversed")
                 target.bss_factors[:, i] *= -1
@@ -1170,18 +1201,26 @@ def _unmix_components(self, compute=False):
 
     def _auto_reverse_bss_component(self, reverse_component_criterion):
         n_components = self.learning_results.bss_factors.shape[1]
+        if reverse_component_criterion == "factors":
+            values = self.learning_results.bss_factors
+        elif reverse_component_criterion == "loadings":
+            values = self.learning_results.bss_loadings
+        else:
+            raise ValueError(
+                "`reverse_component_criterion` can take only "
+                "`factor` or `loading` as parameter."
+            )
+        if isinstance(values, da.Array):
+            # Compute the extrema of all the components in a single pass
+            minima, maxima = da.compute(
+                da.nanmin(values, axis=0), da.nanmax(values, axis=0)
+            )
+        else:
+            minima = np.nanmin(values, axis=0)
+            maxima = np.nanmax(values, axis=0)
         for i in range(n_components):
-            if reverse_component_criterion == "factors":
-                values = self.learning_results.bss_factors
-            elif reverse_component_criterion == "loadings":
-                values = self.learning_results.bss_loadings
-            else:
-                raise ValueError(
-                    "`reverse_component_criterion` can take only "
-                    "`factor` or `loading` as parameter."
-                )
-            minimum = np.nanmin(values[:, i])
-            maximum = np.nanmax(values[:, i])
+            minimum = minima[i]
+            maximum = maxima[i]
             if minimum < 0 and -minimum > maximum:
                 self.reverse_bss_component(i)
                 _logger.info(
@@ -2708,7 +2747,11 @@ def save(self, filename, overwrite=None):
         Parameters
         ----------
         filename : string
-            Path to save the results to.
+            Path to save the results to. If the extension is ``.hdf5`` or
+            ``.h5``, the results are saved in the HDF5 format, which allows
+            the factors and loadings to be memory mapped when loading them
+            back (see :meth:`load`). Otherwise, they are saved in the numpy
+            ``.npz`` format.
         overwrite : {True, False, None}, default None
             If True, overwrite the file if it exists.
             If None (default), prompt user if file exists.
@@ -2727,19 +2770,31 @@ def save(self, filename, overwrite=None):
             overwrite = io_tools.overwrite(filename)
         # Save, if all went well!
         if overwrite:
-            np.savez(filename, **kwargs)
+            if str(filename).lower().endswith(_HDF5_EXTENSIONS):
+                _save_hdf5(filename, kwargs)
+            else:
+                np.savez(filename, **kwargs)
             _logger.info(f"Saved results to {filename}")
 
-    def load(self, filename):
+    def load(self, filename, memmap=True):
         """Load the results of a previous decomposition and demixing analysis.
 
         Parameters
         ----------
         filename : string
             Path to load the results from.
+        memmap : bool, default True
+            Only used for files saved in the HDF5 format. If True, the
+            factors and loadings are memory mapped (copy-on-write) instead of
+            being read into memory, so that only the components that are
+            used, for example when plotting or building a model with a
+            few components, are read from the disk.
 
         """
-        decomposition = np.load(filename, allow_pickle=True)
+        if _is_hdf5(filename):
+            decomposition = _load_hdf5(filename, memmap=memmap)
+        else:
+            decomposition = np.load(filename, allow_pickle=True)
 
         for key, value in decomposition.items():
             if value.dtype == np.dtype("object"):
@@ -2857,3 +2912,95 @@ def _transpose_results(self):
             self.bss_loadings,
             self.bss_factors,
         )
+
+
+_HDF5_EXTENSIONS = (".hdf5", ".h5")
+
+# Arrays stored transposed and contiguous in the HDF5 file so that each
+# component can be memory mapped and read independently
+_HDF5_MEMMAP_KEYS = ("factors", "loadings", "bss_factors", "bss_loadings")
+
+
+def _is_hdf5(filename):
+    import h5py
+
+    try:
+        return h5py.is_hdf5(filename)
+    except OSError:
+        return False
+
+
+def _save_hdf5(filename, results):
+    """Save a dictionary of learning results to an HDF5 file.
+
+    Arrays are stored as datasets and scalars as attributes. The factors and
+    loadings are stored transposed, unchunked and uncompressed, so that they
+    can be memory mapped component by component by :func:`_load_hdf5`.
+    The keys of the values that can't be represented, e.g. ``None``, are
+    saved in the ``_none_keys`` attribute, so that these values are reset
+    when loading the file, as for the ``.npz`` format.
+
+    """
+    import h5py
+
+    none_keys = []
+    with h5py.File(filename, "w") as f:
+        for key, value in results.items():
+            if value is None:
+                none_keys.append(key)
+                continue
+            if key in _HDF5_MEMMAP_KEYS and value.ndim == 2:
+                dset = f.create_dataset(key, shape=value.shape[::-1], dtype=value.dtype)
+                dset.attrs["transposed"] = True
+                if isinstance(value, da.Array):
+                    # Written chunk by chunk without loading it in memory
+                    da.store(value.T, dset)
+                else:
+                    dset[...] = value.T
+            elif isinstance(value, (np.ndarray, da.Array, list, tuple)):
+                value = np.asarray(value)
+                if value.dtype == np.dtype("object"):
+                    none_keys.append(key)
+                    continue
+                f.create_dataset(key, data=value)
+            else:
+                f.attrs[key] = value
+        f.attrs["_none_keys"] = np.array(none_keys, dtype=h5py.string_dtype())
+
+
+def _load_hdf5(filename, memmap=True):
+    """Load the learning results saved by :func:`_save_hdf5`.
+
+    Returns a dictionary of numpy arrays, in which the factors and loadings
+    are transposed views of copy-on-write memory maps if ``memmap`` is True
+    and the values which were ``None`` are 0D object arrays, as in the
+    ``.npz`` format.
+
+    """
+    import h5py
+
+    results = {}
+    with h5py.File(filename, "r") as f:
+        for key, value in f.attrs.items():
+            if key == "_none_keys":
+                for none_key in value:
+                    results[str(none_key)] = np.array(None, dtype=object)
+            else:
+                results[key] = np.asarray(value)
+        for key, dset in f.items():
+            if dset.attrs.get("transposed", False):
+                offset = dset.id.get_offset()
+                if memmap and offset is not None:
+                    value = np.memmap(
+                        filename,
+                        mode="c",
+                        dtype=dset.dtype,
+                        shape=dset.shape,
+                        offset=offset,
+                    )
+                else:
+                    value = dset[()]
+                results[key] = value.T
+            else:
+                results[key] = dset[()]
+    return results
@@ -22,19 +22,21 @@
 import numpy as np
 from scipy.stats import halfnorm
 
+from hyperspy.decorators import jit_ifnumba
 from hyperspy.external.progressbar import progressbar
+from hyperspy.misc.machine_learning.tools import iter_batches
 from hyperspy.misc.math_tools import check_random_state
 
 _logger = logging.getLogger(__name__)
 
 
+@jit_ifnumba(cache=True, nogil=True)
 def _thresh(X, lambda1, vmax):
     """Soft-thresholding with clipping."""
-    res = abs(X) - lambda1
-    np.maximum(res, 0.0, out=res)
-    res *= np.sign(X)
-    np.clip(res, -vmax, vmax, out=res)
-    return res
+    # Written as a single array expression, which numba fuses in one loop
+    return np.minimum(
+        np.maximum(np.sign(X) * np.maximum(np.abs(X) - lambda1, 0.0), -vmax), vmax
+    )
 
 
 def _mrdivide(B, A):
@@ -66,17 +68,13 @@ def _solveproj(v, W, lambda1, kappa=1, h=None, e=None, vmax=None):
     if vmax is None:
         vmax = v.max()
 
-    if len(v.shape) == 2:
-        batch_size = v.shape[1]
-        eshape = (m, batch_size)
-        hshape = (n, batch_size)
-    else:
-        eshape = (m,)
-        hshape = (n,)
-    if h is None or h.shape != hshape:
-        h = np.zeros(hshape)
-    if e is None or e.shape != eshape:
-        e = np.zeros(eshape)
+    if v.ndim == 2:
+        return _solveproj_batch(v, W, lambda1, kappa, h=h, e=e, vmax=vmax)
+
+    if h is None or h.shape != (n,):
+        h = np.zeros(n)
+    if e is None or e.shape != (m,):
+        e = np.zeros(m)
 
     eta = kappa / np.linalg.norm(W, "fro") ** 2
 
@@ -104,6 +102,63 @@ def _solveproj(v, W, lambda1, kappa=1, h=None, e=None, vmax=None):
     return h, e
 
 
+def _solveproj_batch(v, W, lambda1, kappa=1, h=None, e=None, vmax=None):
+    """Project a batch of samples, given as the columns of v, on W.
+
+    All the samples are solved at once with matrix operations, and the
+    iterations continue only for the samples which have not converged.
+    """
+    m, n = W.shape
+    batch_size = v.shape[1]
+    eshape = (m, batch_size)
+    hshape = (n, batch_size)
+    # Copy the initial values since they are updated in place below
+    if h is None or h.shape != hshape:
+        h = np.zeros(hshape)
+    else:
+        h = np.array(h, dtype=float)
+    if e is None or e.shape != eshape:
+        e = np.zeros(eshape)
+    else:
+        e = np.array(e, dtype=float)
+
+    eta = kappa / np.linalg.norm(W, "fro") ** 2
+
+    maxiter = 1e6
+    iters = 0
+    active = np.arange(batch_size)
+
+    while active.size:
+        iters += 1
+        idx = slice(None) if active.size == batch_size else active
+        va = v[:, idx]
+
+        # Solve for h
+        htmp = h[:, idx]
+        ha = htmp - eta * W.T @ (W @ htmp + e[:, idx] - va)
+        np.maximum(ha, 0.0, out=ha)
+
+        # Solve for e
+        etmp = e[:, idx]
+        ea = _thresh(va - W @ ha, lambda1, vmax)
+
+        # Stop conditions, evaluated for each sample
+        dh = ha - htmp
+        de = ea - etmp
+        stop = np.sqrt(
+            np.maximum(np.einsum("ij,ij->j", dh, dh), np.einsum("ij,ij->j", de, de))
+        )
+        stop /= m
+
+        h[:, idx] = ha
+        e[:, idx] = ea
+        if iters > maxiter:
+            break
+        active = active[stop >= 1e-5]
+
+    return h, e
+
+
 class ORNMF:
     """Performs Online Robust NMF with missing or corrupted data.
 
@@ -233,7 +288,8 @@ def fit(self, X, batch_size=None):
             or an iterator that yields samples, each with n_features elements.
         batch_size : {None, int}
             If not None, learn the data in batches, each of batch_size samples
-            or less.
+            or less. The samples of a batch are projected together and
+            the subspace is updated once per batch.
 
         """
         if self.n_features is None:
@@ -242,13 +298,13 @@ def fit(self, X, batch_size=None):
         num = None
         prod = np.outer
         if batch_size is not None:
-            if not isinstance(X, np.ndarray):
-                raise ValueError("can't batch iterating data")
-            else:
-                prod = np.dot
+            prod = np.dot
+            if isinstance(X, np.ndarray):
                 length = X.shape[0]
                 num = max(length // batch_size, 1)
                 X = np.array_split(X, num, axis=0)
+            else:
+                X = iter_batches(X, batch_size)
 
         if isinstance(X, np.ndarray):
             num = X.shape[0]
@@ -308,7 +364,7 @@ def _solve_W(self, A, B):
             np.maximum(self.W, 0.0, out=self.W)
             self.W /= max(np.linalg.norm(self.W, "fro"), 1.0)
 
-    def project(self, X, return_error=False):
+    def project(self, X, return_error=False, batch_size=None):
         """Project the learnt components on the data.
 
         Parameters
@@ -319,6 +375,10 @@ def project(self, X, return_error=False):
         return_error : bool, default False
             If True, returns the sparse error matrix as well. Otherwise only
             the weights (loadings)
+        batch_size : None or int
+            Number of samples projected together. If None, all the samples
+            of an array are projected at once and the samples yielded by
+            an iterator are grouped in batches of 1000 samples.
 
         """
         H = []
@@ -327,17 +387,21 @@ def project(self, X, return_error=False):
 
         num = None
         if isinstance(X, np.ndarray):
-            num = X.shape[0]
-            X = iter(X)
-        for v in progressbar(X, leave=False, total=num):
+            if batch_size is None:
+                batch_size = max(X.shape[0], 1)
+            num = max(X.shape[0] // batch_size, 1)
+            X = np.array_split(X, num, axis=0)
+        else:
+            X = iter_batches(X, 1000 if batch_size is None else batch_size)
+        for v in progressbar(X, leave=False, total=num, disable=num == 1):
             h, e = _solveproj(v, self.W, self.lambda1, self.kappa, vmax=np.inf)
-            H.append(h.copy())
+            H.append(h)
             if return_error:
-                E.append(e.copy())
+                E.append(e)
 
-        H = np.stack(H, axis=-1)
+        H = np.concatenate(H, axis=-1)
         if return_error:
-            return H, np.stack(E, axis=-1)
+            return H, np.concatenate(E, axis=-1)
         else:
             return H
 
@@ -382,7 +446,8 @@ def ornmf(
         If True, project the data X onto the learnt model.
     batch_size : None or int, default None
         If not None, learn the data in batches, each of batch_size samples
-        or less.
+        or less. The samples of a batch are projected together and the
+        subspace is updated once per batch.
     lambda1 : float, default 1.0
         Nuclear norm regularization parameter.
     kappa : float, default 1.0
@@ -436,7 +501,10 @@ def ornmf(
 
     if store_error:
         Xhat = W @ H
-        Ehat = np.array(_ornmf.E).T
+        if _ornmf.E[0].ndim == 1:
+            Ehat = np.stack(_ornmf.E, axis=-1)
+        else:
+            Ehat = np.concatenate(_ornmf.E, axis=1)
 
         return Xhat, Ehat, W, H
     else:
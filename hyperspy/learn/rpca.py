@@ -22,19 +22,20 @@
 import numpy as np
 import scipy.linalg
 
+from hyperspy.decorators import jit_ifnumba
 from hyperspy.external.progressbar import progressbar
 from hyperspy.learn.svd_pca import svd_solve
+from hyperspy.misc.machine_learning.tools import iter_batches
 from hyperspy.misc.math_tools import check_random_state
 
 _logger = logging.getLogger(__name__)
 
 
+@jit_ifnumba(cache=True, nogil=True)
 def _soft_thresh(X, lambda1):
     """Soft-thresholding of array X."""
-    res = abs(X) - lambda1
-    np.maximum(res, 0.0, out=res)
-    res *= np.sign(X)
-    return res
+    # Written as a single array expression, which numba fuses in one loop
+    return np.sign(X) * np.maximum(np.abs(X) - lambda1, 0.0)
 
 
 def rpca_godec(
@@ -152,17 +153,13 @@ def _solveproj(z, X, Id, lambda2, r=None, e=None):
     m, n = X.shape
     z = z.T
 
-    if len(z.shape) == 2:
-        batch_size = z.shape[1]
-        eshape = (m, batch_size)
-        rshape = (n, batch_size)
-    else:
-        eshape = (m,)
-        rshape = (n,)
-    if r is None or r.shape != rshape:
-        r = np.zeros(rshape)
-    if e is None or e.shape != eshape:
-        e = np.zeros(eshape)
+    if z.ndim == 2:
+        return _solveproj_batch(z, X, Id, lambda2, r=r, e=e)
+
+    if r is None or r.shape != (n,):
+        r = np.zeros(n)
+    if e is None or e.shape != (m,):
+        e = np.zeros(m)
 
     ddt = np.linalg.solve(X.T @ X + Id, X.T)
     maxiter = 1e6
@@ -188,6 +185,61 @@ def _solveproj(z, X, Id, lambda2, r=None, e=None):
     return r, e
 
 
+def _solveproj_batch(z, X, Id, lambda2, r=None, e=None):
+    """Project a batch of samples, given as the columns of z, on X.
+
+    All the samples are solved at once with matrix operations, and the
+    iterations continue only for the samples which have not converged.
+    """
+    m, n = X.shape
+    batch_size = z.shape[1]
+    eshape = (m, batch_size)
+    rshape = (n, batch_size)
+    # Copy the initial values since they are updated in place below
+    if r is None or r.shape != rshape:
+        r = np.zeros(rshape)
+    else:
+        r = np.array(r, dtype=float)
+    if e is None or e.shape != eshape:
+        e = np.zeros(eshape)
+    else:
+        e = np.array(e, dtype=float)
+
+    ddt = np.linalg.solve(X.T @ X + Id, X.T)
+    maxiter = 1e6
+    itr = 0
+    active = np.arange(batch_size)
+
+    while active.size:
+        itr += 1
+        idx = slice(None) if active.size == batch_size else active
+        za = z[:, idx]
+
+        # Solve for r
+        rtmp = r[:, idx]
+        ra = ddt @ (za - e[:, idx])
+
+        # Solve for e
+        etmp = e[:, idx]
+        ea = _soft_thresh(za - X @ ra, lambda2)
+
+        # Stop conditions, evaluated for each sample
+        dr = ra - rtmp
+        de = ea - etmp
+        stop = np.sqrt(
+            np.maximum(np.einsum("ij,ij->j", dr, dr), np.einsum("ij,ij->j", de, de))
+        )
+        stop /= m
+
+        r[:, idx] = ra
+        e[:, idx] = ea
+        if itr > maxiter:
+            break
+        active = active[stop >= 1e-5]
+
+    return r, e
+
+
 def _updatecol(X, A, B, Id):
     tmp, n = X.shape
     L = X
@@ -319,7 +371,7 @@ def _setup(self, X):
         self.n_features = m
         self.iterating = iterating
 
-        self.L = self._initialize_subspace(X)
+        self.L, X = self._initialize_subspace(X)
         self.K = self.lambda1 * np.eye(self.rank)
         self.R = []
 
@@ -333,7 +385,11 @@ def _setup(self, X):
         return X
 
     def _initialize_subspace(self, X):
-        """Initialize the subspace estimate."""
+        """Initialize the subspace estimate.
+
+        Returns the subspace and the data, since the training samples
+        consumed from an iterator have to be put back in front of it.
+        """
         m = self.n_features
 
         if isinstance(self.init, np.ndarray):
@@ -342,7 +398,7 @@ def _initialize_subspace(self, X):
             init_m, init_r = self.init.shape
             if init_m != m or init_r != self.rank:
                 raise ValueError("'init' has to be of shape [n_features x rank]")
-            return self.init.copy()
+            return self.init.copy(), X
         elif self.init == "qr":
             if self.iterating:
                 Y2 = np.stack([next(X) for _ in range(self.training_samples)], axis=-1)
@@ -350,11 +406,11 @@ def _initialize_subspace(self, X):
             else:
                 Y2 = X[: self.training_samples, :].T
             L, _ = scipy.linalg.qr(Y2, mode="economic")
-            return L[:, : self.rank]
+            return L[:, : self.rank], X
         elif self.init == "rand":
             Y2 = self.random_state.normal(size=(m, self.rank))
             L, _ = scipy.linalg.qr(Y2, mode="economic")
-            return L[:, : self.rank]
+            return L[:, : self.rank], X
 
     def fit(self, X, batch_size=None):
         """Learn RPCA components from the data.
@@ -366,7 +422,8 @@ def fit(self, X, batch_size=None):
             or an iterator that yields samples, each with n_features elements.
         batch_size : None or int
             If not None, learn the data in batches, each of batch_size samples
-            or less.
+            or less. The samples of a batch are projected together and
+            the subspace is updated once per batch.
 
         """
         if self.n_features is None:
@@ -375,13 +432,13 @@ def fit(self, X, batch_size=None):
         num = None
         prod = np.outer
         if batch_size is not None:
-            if not isinstance(X, np.ndarray):
-                raise ValueError("can't batch iterating data")
-            else:
-                prod = np.dot
+            prod = np.dot
+            if isinstance(X, np.ndarray):
                 length = X.shape[0]
                 num = max(length // batch_size, 1)
                 X = np.array_split(X, num, axis=0)
+            else:
+                X = iter_batches(X, batch_size)
 
         if isinstance(X, np.ndarray):
             num = X.shape[0]
@@ -430,7 +487,7 @@ def _solve_L(self, A, B):
             self.vnew = (self.L @ A - B + self.lambda1 * self.L) / learn
             self.L -= vold + self.vnew
 
-    def project(self, X, return_error=False):
+    def project(self, X, return_error=False, batch_size=None):
         """Project the learnt components on the data.
 
         Parameters
@@ -441,6 +498,10 @@ def project(self, X, return_error=False):
         return_error : bool, default False
             If True, returns the sparse error matrix as well. Otherwise only
             the weights (loadings)
+        batch_size : None or int
+            Number of samples projected together. If None, all the samples
+            of an array are projected at once and the samples yielded by
+            an iterator are grouped in batches of 1000 samples.
 
         """
         R = []
@@ -449,17 +510,21 @@ def project(self, X, return_error=False):
 
         num = None
         if isinstance(X, np.ndarray):
-            num = X.shape[0]
-            X = iter(X)
-        for v in progressbar(X, leave=False, total=num):
+            if batch_size is None:
+                batch_size = max(X.shape[0], 1)
+            num = max(X.shape[0] // batch_size, 1)
+            X = np.array_split(X, num, axis=0)
+        else:
+            X = iter_batches(X, 1000 if batch_size is None else batch_size)
+        for v in progressbar(X, leave=False, total=num, disable=num == 1):
             r, e = _solveproj(v, self.L, self.K, self.lambda2)
-            R.append(r.copy())
+            R.append(r)
             if return_error:
-                E.append(e.copy())
+                E.append(e)
 
-        R = np.stack(R, axis=-1)
+        R = np.concatenate(R, axis=-1)
         if return_error:
-            return R, np.stack(E, axis=-1)
+            return R, np.concatenate(E, axis=-1)
         else:
             return R
 
@@ -508,7 +573,8 @@ def orpca(
         If True, project the data X onto the learnt model.
     batch_size : None, int, default None
         If not None, learn the data in batches, each of batch_size samples
-        or less.
+        or less. The samples of a batch are projected together and the
+        subspace is updated once per batch.
     lambda1 : float, default 0.1
         Nuclear norm regularization parameter.
     lambda2 : float, default 1.0
@@ -568,7 +634,10 @@ def orpca(
 
     if store_error:
         Xhat = L @ R
-        Ehat = np.array(_orpca.E).T
+        if _orpca.E[0].ndim == 1:
+            Ehat = np.stack(_orpca.E, axis=-1)
+        else:
+            Ehat = np.concatenate(_orpca.E, axis=1)
 
         # Do final SVD
         U, S, Vh = svd_solve(Xhat, output_dimension=rank)
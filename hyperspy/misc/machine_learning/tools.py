@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+from itertools import islice
+
 import numpy as np
 
 
@@ -59,3 +61,25 @@ def amari(W, A):
     P_sr_1 = np.sum(P_sq_sum_1 / P_sq_max_1 - 1)
 
     return (P_sr_0 + P_sr_1) / (2 * m)
+
+
+def iter_batches(X, batch_size):
+    """Group the samples yielded by an iterator in arrays of batch_size samples.
+
+    Parameters
+    ----------
+    X : iterator of numpy.ndarray
+        The samples.
+    batch_size : int
+        The number of samples in each batch. The last batch can be smaller.
+
+    Yields
+    ------
+    numpy.ndarray
+        The samples of the batch, stacked along the first axis.
+    """
+    while True:
+        batch = list(islice(X, batch_size))
+        if not batch:
+            return
+        yield np.stack(batch, axis=0)
@@ -23,6 +23,7 @@
 import logging
 import types
 import unicodedata
+import weakref
 from collections.abc import Iterable, Mapping
 from contextlib import contextmanager
 from io import StringIO
@@ -1317,6 +1318,7 @@ def process_function_blockwise(
     output_signal_size=None,
     output_dtype=None,
     arg_keys=None,
+    vectorized=False,
     **kwargs,
 ):
     """
@@ -1342,6 +1344,9 @@ def process_function_blockwise(
     arg_keys : tuple
         The list of keys for the passed arguments (args).  Together this makes
         a set of key:value pairs to be passed to the function.
+    vectorized : bool, default False
+        If True, the function is called once for the whole chunk, with the
+        navigation axes flattened: see :func:`process_function_batched`.
     **kwargs : dict
         Any additional key value pairs to be used by the function
         (Note that these are the constants that are applied.)
@@ -1351,6 +1356,17 @@ def process_function_blockwise(
     dtype = output_dtype
     chunk_nav_shape = tuple([data.shape[i] for i in sorted(nav_indexes)])
     output_shape = chunk_nav_shape + tuple(output_signal_size)
+    if vectorized:
+        return process_function_batched(
+            data,
+            *args,
+            function=function,
+            nav_dimension=len(chunk_nav_shape),
+            output_shape=output_shape,
+            output_dtype=dtype,
+            arg_keys=arg_keys,
+            **kwargs,
+        )
     # Pre-allocating the output array
     output_array = np.empty(output_shape, dtype=dtype, like=data)
     if len(args) == 0:
@@ -1378,7 +1394,199 @@ def process_function_blockwise(
     return output_array
 
 
-def _get_block_pattern(args, output_shape):
+def get_batch(array, nav_dimension):
+    """Flatten the navigation axes of an array to get a batch of signals,
+    with the singleton signal axes removed, as done for each signal when
+    iterating over the navigation axes.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The array, with the navigation axes first.
+    nav_dimension : int
+        The number of navigation axes.
+
+    Returns
+    -------
+    np.ndarray
+        The array of shape ``(n, *signal_shape)``.
+    """
+    batch = array.reshape((-1,) + array.shape[nav_dimension:])
+    singleton = tuple(i for i in range(1, batch.ndim) if batch.shape[i] == 1)
+    return batch.squeeze(axis=singleton)
+
+
+def process_function_batched(
+    data,
+    *args,
+    function,
+    nav_dimension,
+    output_shape,
+    output_dtype,
+    arg_keys=None,
+    **kwargs,
+):
+    """
+    Apply a vectorized function to a chunk of data at once. The function
+    receives the signals of the chunk as an array of shape
+    ``(n, *signal_shape)``, the matching batch of each iterating argument,
+    and must return an array of shape ``(n, *output_signal_shape)`` or, if
+    the output is ragged, a sequence of ``n`` objects.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The data for one chunk, with the navigation axes first.
+    *args : tuple of np.ndarray
+        The arrays iterated alongside the data, with the navigation axes
+        first.
+    function : function
+        The function to apply to the batch of signals.
+    nav_dimension : int
+        The number of navigation axes.
+    output_shape : tuple
+        The shape of the output for the chunk.
+    output_dtype : dtype
+        The data type for the output.
+    arg_keys : tuple
+        The keys of the arguments passed to the function for ``args``.
+    **kwargs : dict
+        Any other keyword arguments passed to the function.
+    """
+    if arg_keys is None:
+        arg_keys = ()
+    chunk_nav_shape = output_shape[:nav_dimension]
+    batch = data.reshape((-1,) + data.shape[nav_dimension:])
+    iter_dict = {key: get_batch(a, nav_dimension) for key, a in zip(arg_keys, args)}
+    result = function(batch, **iter_dict, **kwargs)
+    if np.dtype(output_dtype) == object:
+        output_array = np.empty(batch.shape[0], dtype=object)
+        if len(result) != batch.shape[0]:
+            raise ValueError(
+                f"The function returned {len(result)} results for a batch of "
+                f"{batch.shape[0]} signals."
+            )
+        for i, item in enumerate(result):
+            output_array[i] = item
+        output_array = output_array.reshape(output_shape)
+    else:
+        result = np.asarray(result, dtype=output_dtype, like=data)
+        try:
+            output_array = result.reshape(output_shape)
+        except ValueError:
+            raise ValueError(
+                f"The function returned an array of shape {result.shape} for a "
+                f"batch of {batch.shape[0]} signals, instead of "
+                f"{(batch.shape[0],) + tuple(output_shape[nav_dimension:])}."
+            )
+    if not (chunk_nav_shape == output_array.shape):
+        try:
+            output_array = output_array.squeeze(-1)
+        except ValueError:
+            pass
+    return output_array
+
+
+def process_function_threaded(
+    data,
+    *args,
+    function,
+    output,
+    nav_dimension,
+    arg_keys=None,
+    num_workers=None,
+    show_progressbar=None,
+    vectorized=False,
+    **kwargs,
+):
+    """
+    Apply a function to in-memory data at all navigation indices, using a
+    pool of threads, without building a dask graph. The navigation indices
+    are split in contiguous blocks, each processed by
+    :func:`process_function_blockwise`, and the results are written directly
+    into the preallocated output array.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The data, with the navigation axes first.
+    *args : tuple of np.ndarray
+        The arrays iterated alongside the data, with the same navigation
+        shape as the data, first.
+    function : function
+        The function to apply to the signal axes.
+    output : np.ndarray
+        The array to write the results in, of shape
+        ``navigation_shape + output_signal_size``. It can be ``data``
+        itself, since each block is read before the results are written.
+    nav_dimension : int
+        The number of navigation axes.
+    arg_keys : tuple
+        The keys of the arguments passed to the function for ``args``.
+    num_workers : None or int
+        The number of threads. If None, the number of CPUs is used.
+    %s
+    vectorized : bool, default False
+        If True, the function is called once per block with a batch of
+        signals, see :func:`process_function_batched`.
+    **kwargs : dict
+        Any other keyword arguments passed to the function.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from dask.system import CPU_COUNT
+
+    from hyperspy.defaults_parser import preferences
+    from hyperspy.external.progressbar import progressbar
+
+    if show_progressbar is None:
+        show_progressbar = preferences.General.show_progressbar
+    nav_shape = data.shape[:nav_dimension]
+    nav_size = int(np.prod(nav_shape))
+    if num_workers is None:
+        num_workers = CPU_COUNT
+    num_workers = max(1, min(num_workers, nav_size))
+
+    def flatten(array):
+        return array.reshape((nav_size,) + array.shape[nav_dimension:])
+
+    data = flatten(data)
+    args = tuple(flatten(arg) for arg in args)
+    output = flatten(output)
+
+    def process(block):
+        result = process_function_blockwise(
+            data[block],
+            *(arg[block] for arg in args),
+            function=function,
+            nav_indexes=(0,),
+            output_signal_size=output.shape[1:],
+            output_dtype=output.dtype,
+            arg_keys=arg_keys,
+            vectorized=vectorized,
+            **kwargs,
+        )
+        output[block] = result.reshape(output[block].shape)
+        return block.stop - block.start
+
+    # a few blocks per thread to balance the load
+    bounds = np.linspace(0, nav_size, min(nav_size, 4 * num_workers) + 1, dtype=int)
+    blocks = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+    with progressbar(total=nav_size, disable=not show_progressbar, leave=True) as pbar:
+        if num_workers == 1:
+            for block in blocks:
+                pbar.update(process(block))
+        else:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                futures = [executor.submit(process, block) for block in blocks]
+                for future in as_completed(futures):
+                    pbar.update(future.result())
+
+
+process_function_threaded.__doc__ %= SHOW_PROGRESSBAR_ARG
+
+
+def _get_block_pattern(args, output_shape, concatenate_axes=()):
     """Returns the block pattern used by the `blockwise` function for a
     set of arguments give a resulting output_shape
 
@@ -1388,6 +1596,10 @@ def _get_block_pattern(args, output_shape):
         A list of all the arguments which are used for `da.blockwise`
     output_shape: tuple
         The output shape for the function passed to `da.blockwise` given args
+    concatenate_axes: tuple
+        The axes of the first argument split in several chunks, which are
+        given dummy indices so that `da.blockwise` concatenates their blocks
+        for each output block, instead of rechunking the array.
     """
     arg_patterns = tuple(tuple(range(a.ndim)) for a in args)
     arg_shapes = tuple(a.shape for a in args)
@@ -1408,11 +1620,23 @@ def _get_block_pattern(args, output_shape):
                 new_axis[i] = output_shape[i]
             else:  # output shape is an existing axis
                 adjust_chunks[i] = output_shape[i]  # adjusting chunks based on output
+    if concatenate_axes:
+        first_pattern = list(arg_patterns[0])
+        for n, i in enumerate(concatenate_axes):
+            first_pattern[i] = max_len + n  # dummy index
+            if i < len(output_pattern):
+                # the output axis doesn't come from the first argument anymore
+                adjust_chunks.pop(i, None)
+                if any(i in pattern for pattern in arg_patterns[1:]):
+                    adjust_chunks[i] = output_shape[i]
+                else:
+                    new_axis[i] = output_shape[i]
+        arg_patterns = (tuple(first_pattern),) + arg_patterns[1:]
     arg_pairs = [(a, p) for a, p in zip(args, arg_patterns)]
     return arg_pairs, adjust_chunks, new_axis, output_pattern
 
 
-def guess_output_signal_size(test_data, function, ragged, **kwargs):
+def guess_output_signal_size(test_data, function, ragged, vectorized=False, **kwargs):
     """This function is for guessing the output signal shape and size.
     It will attempt to apply the function to some test data and then output
     the resulting signal shape and datatype.
@@ -1427,6 +1651,10 @@ def guess_output_signal_size(test_data, function, ragged, **kwargs):
     ragged : bool
         If the data is ragged then the output signal size is () and the
         data type is 'object'
+    vectorized : bool, default False
+        If True, the function operates on a batch of signals: ``test_data``
+        (and the iterating arguments in ``kwargs``) must be a batch of a
+        single signal and the first axis of the output is discarded.
     **kwargs : dict
         Any other keyword arguments passed to the function.
     """
@@ -1442,9 +1670,151 @@ def guess_output_signal_size(test_data, function, ragged, **kwargs):
             output = np.asarray(output)
             output_dtype = output.dtype
             output_signal_size = output.shape
+        if vectorized:
+            if output_signal_size[:1] != (1,):
+                raise ValueError(
+                    "A vectorized function must return an array of shape "
+                    f"`(n, *output_signal_shape)` for a batch of n signals, but "
+                    f"it returned an array of shape {output_signal_size} for a "
+                    "batch of 1 signal."
+                )
+            output_signal_size = output_signal_size[1:]
     return output_signal_size, output_dtype
 
 
+def _hashable_argument(value):
+    # small numpy arrays are hashed by value, the other arguments must be
+    # hashable
+    if isinstance(value, np.ndarray):
+        if value.dtype == object or value.size > 1024:
+            raise TypeError("unhashable array")
+        return ("ndarray", value.shape, value.dtype.str, value.tobytes())
+    hash(value)
+    return value
+
+
+class OutputSignatureCache:
+    """Cache of the output signal size and dtype of the functions used with
+    :meth:`~hyperspy.api.signals.BaseSignal.map`, to avoid computing the
+    function on the first navigation pixel to guess them. It is only used
+    when ``map`` is called with ``cache_output_signature=True``.
+
+    The output signature is assumed to only depend on the function, the
+    shape and dtype of the signal and the values of the keyword arguments
+    at the first navigation pixel. The functions are weakly referenced, so
+    that the entries of a function are removed when it is deleted.
+    """
+
+    def __init__(self, max_entries=16):
+        """
+        Parameters
+        ----------
+        max_entries : int, default 16
+            The maximum number of input signatures cached per function.
+        """
+        self.max_entries = max_entries
+        self._cache = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def get_key(signal_shape, dtype, vectorized=False, **kwargs):
+        """Return the input signature used as key of the cache, or None if
+        some arguments can't be hashed.
+
+        Parameters
+        ----------
+        signal_shape : tuple
+            The signal shape of the data.
+        dtype : numpy.dtype
+            The dtype of the data.
+        vectorized : bool, default False
+            Whether the function operates on batches of signals.
+        **kwargs : dict
+            The arguments passed to the function at the first navigation
+            pixel.
+        """
+        try:
+            return (
+                tuple(signal_shape),
+                np.dtype(dtype).str,
+                vectorized,
+                tuple(
+                    (key, _hashable_argument(value))
+                    for key, value in sorted(kwargs.items())
+                ),
+            )
+        except TypeError:
+            return None
+
+    def get(self, function, key):
+        """Return the cached ``(output_signal_size, output_dtype)`` of the
+        function for the given input signature, or None."""
+        if key is None:
+            return None
+        try:
+            return self._cache.get(function, {}).get(key)
+        except TypeError:
+            # the function can't be weakly referenced
+            return None
+
+    def set(self, function, key, value):
+        """Store the ``(output_signal_size, output_dtype)`` of the function
+        for the given input signature."""
+        if key is None:
+            return
+        try:
+            entries = self._cache.setdefault(function, {})
+        except TypeError:
+            return
+        if len(entries) >= self.max_entries:
+            entries.pop(next(iter(entries)))
+        entries[key] = value
+
+    def clear(self):
+        """Remove all the cached signatures."""
+        self._cache.clear()
+
+
+output_signature_cache = OutputSignatureCache()
+
+
+def replace_first_navigation_block(array, nav_dimension, values):
+    """Return a dask array equal to ``array``, where the blocks of the first
+    navigation chunk are taken from an already computed array, to avoid
+    computing (or reading) them again.
+
+    Parameters
+    ----------
+    array : dask.array.Array
+        The array, with the navigation axes first.
+    nav_dimension : int
+        The number of navigation axes.
+    values : numpy.ndarray
+        The values of the first navigation chunk of ``array``, i.e.
+        ``array.blocks[(0,) * nav_dimension].compute()``.
+
+    Returns
+    -------
+    dask.array.Array
+    """
+    from dask.base import tokenize
+    from dask.highlevelgraph import HighLevelGraph
+
+    name = "first-block-" + tokenize(array.name, nav_dimension)
+    starts = [np.cumsum((0,) + chunks) for chunks in array.chunks]
+    layer = {}
+    for index in np.ndindex(*array.numblocks):
+        if any(index[:nav_dimension]):
+            # alias to the original block
+            layer[(name,) + index] = (array.name,) + index
+        else:
+            islice = tuple(
+                slice(start[i], start[i + 1]) for start, i in zip(starts, index)
+            )
+            layer[(name,) + index] = values[islice]
+    graph = HighLevelGraph.from_collections(name, layer, dependencies=[array])
+    return da.Array(graph, name, array.chunks, meta=array._meta)
+
+
 def multiply(iterable):
     """Return product of sequence of numbers.
 
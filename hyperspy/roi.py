@@ -243,6 +243,120 @@ def __call__(self, signal, out=None, axes=None):
 
     __call__.__doc__ %= PARSE_AXES_DOCSTRING
 
+    def _get_mask(self, axes):
+        """Return the boolean mask of the pixels selected by the ROI.
+
+        Parameters
+        ----------
+        axes : tuple of :class:`~hyperspy.axes.DataAxis`
+            The axes the ROI is applied on.
+
+        Returns
+        -------
+        numpy.ndarray
+            The mask, whose dimensions are in the order of ``axes``.
+        """
+        if not self.is_valid():
+            raise ValueError(not_set_error_msg)
+        mask = np.zeros([axis.size for axis in axes], dtype=bool)
+        mask[self._make_slices(axes, axes)] = True
+        return mask
+
+    def _reduce(self, signal, reduction, axes=None):
+        if axes is None and signal in self.signal_map:
+            axes = self.signal_map[signal][1]
+        else:
+            axes = self._parse_axes(axes, signal.axes_manager)
+        order = np.argsort([axis.index_in_array for axis in axes])
+        mask = self._get_mask(axes).transpose(order)
+        axes = tuple(axes[i] for i in order)
+        indices = [axis.index_in_array for axis in axes]
+        ndim = len(indices)
+        if not mask.any():
+            raise ValueError("The ROI doesn't select any pixel of the signal.")
+        # only the bounding box of the ROI is used
+        bbox = tuple(
+            slice(nonzero.min(), nonzero.max() + 1) for nonzero in np.nonzero(mask)
+        )
+        mask = mask[bbox]
+        data = signal.data
+        if signal._lazy:
+            import dask.array as da
+
+            data = da.moveaxis(data, indices, list(range(ndim)))[bbox]
+            chunks = tuple((1,) * len(c) for c in data.chunks[:ndim])
+            chunks += data.chunks[ndim:]
+            partial = "sum" if reduction == "mean" else reduction
+            dtype = getattr(np.zeros(1, dtype=data.dtype), partial)().dtype
+            values = da.map_blocks(
+                _reduce_masked_block,
+                data,
+                mask=mask,
+                reduction=partial,
+                out_dtype=dtype,
+                chunks=chunks,
+                dtype=dtype,
+            )
+            values = getattr(values, partial)(axis=tuple(range(ndim)))
+            if reduction == "mean":
+                values = values / np.count_nonzero(mask)
+        else:
+            data = np.moveaxis(data, indices, list(range(ndim)))[bbox]
+            # the boolean indexing copies only the pixels of the ROI
+            values = getattr(data[mask], reduction)(axis=0)
+        return _get_reduced_signal(signal, values, axes)
+
+    def sum(self, signal, axes=None):
+        """Sum the signal over the pixels selected by the ROI.
+
+        Contrary to slicing the signal with the ROI and summing the result,
+        the pixels which are not selected are not replaced by ``nan`` in a
+        copy of the data: they are ignored in the reduction, which is done
+        chunk by chunk for lazy signals.
+
+        Parameters
+        ----------
+        signal : :class:`~.api.signals.BaseSignal`
+            The signal to reduce.
+        %s
+
+        Returns
+        -------
+        :class:`~.api.signals.BaseSignal` (or subclass)
+            The signal without the axes of the ROI.
+
+        See Also
+        --------
+        mean, reduce_rois
+        """
+        return self._reduce(signal, "sum", axes)
+
+    sum.__doc__ %= PARSE_AXES_DOCSTRING
+
+    def mean(self, signal, axes=None):
+        """Average the signal over the pixels selected by the ROI.
+
+        See :meth:`sum` for more details.
+
+        Parameters
+        ----------
+        signal : :class:`~.api.signals.BaseSignal`
+            The signal to reduce.
+        %s
+
+        Returns
+        -------
+        :class:`~.api.signals.BaseSignal` (or subclass)
+            The signal without the axes of the ROI.
+
+        See Also
+        --------
+        sum, reduce_rois
+        """
+        return self._reduce(signal, "mean", axes)
+
+    mean.__doc__ %= PARSE_AXES_DOCSTRING
+
     def _parse_axes(self, axes, axes_manager):
         """Utility function to parse the 'axes' argument to a list of
         :class:`~hyperspy.axes.DataAxis`.
@@ -1097,6 +1211,27 @@ def _apply_roi2widget(self, widget):
     def _get_widget_type(self, axes, signal):
         return widgets.CircleWidget
 
+    def _get_mask(self, axes):
+        if not self.is_valid():
+            raise ValueError(not_set_error_msg)
+        for axis in axes:
+            if not axis.is_uniform:
+                raise NotImplementedError(
+                    "This ROI cannot operate on a non-uniform axis."
+                )
+        # Same selection as when slicing a signal with the ROI
+        cx = self.cx + 0.5001 * axes[0].scale
+        cy = self.cy + 0.5001 * axes[1].scale
+        ranges = [[cx - self.r, cx + self.r], [cy - self.r, cy + self.r]]
+        slices = self._make_slices(axes, axes, ranges)
+        gx, gy = np.meshgrid(
+            axes[0].axis[slices[0]] - cx, axes[1].axis[slices[1]] - cy, indexing="ij"
+        )
+        gr = gx**2 + gy**2
+        mask = np.zeros([axis.size for axis in axes], dtype=bool)
+        mask[slices] = (gr <= self.r**2) & (gr >= self.r_inner**2)
+        return mask
+
     def __call__(self, signal, out=None, axes=None):
         if not self.is_valid():
             raise ValueError(not_set_error_msg)
@@ -1247,6 +1382,11 @@ def _apply_roi2widget(self, widget):
     def _get_widget_type(self, axes, signal):
         return widgets.Line2DWidget
 
+    def _get_mask(self, axes):
+        raise NotImplementedError(
+            "A `Line2DROI` selects a profile and not a region of the signal."
+        )
+
     @staticmethod
     def _line_profile_coordinates(src, dst, linewidth=1):
         """Return the coordinates of the profile of an image along a scan line.
@@ -1349,6 +1489,73 @@ def angle(self, axis="horizontal", units="degrees"):
                 "Axis is not recognized. " "Use  either 'horizontal' or 'vertical'."
             )
 
+    @staticmethod
+    def _profile_weights(coordinates, shape, order):
+        """Return the interpolation weights of a line profile.
+
+        Parameters
+        ----------
+        coordinates : numpy.ndarray
+            The coordinates of the points of the profile in pixels, of shape
+            ``(2, length, linewidth)``, see :meth:`_line_profile_coordinates`.
+        shape : tuple of int
+            The shape of the image.
+        order : {0, 1}
+            The order of the interpolation, nearest-neighbor or linear.
+
+        Returns
+        -------
+        weights : scipy.sparse.csr_matrix
+            The weights of the pixels of the (flattened) image for each
+            pixel of the profile, of shape ``(length, image size)``, so that
+            the profile is the product of the weights and the image.
+        outside : numpy.ndarray
+            The fraction of the points of each pixel of the profile falling
+            outside of the image, which take the constant value.
+
+        Notes
+        -----
+        The result is the same as averaging over the line width the values
+        interpolated by :func:`scipy.ndimage.map_coordinates` with
+        ``mode="constant"``.
+        """
+        from scipy import sparse
+
+        _, length, linewidth = coordinates.shape
+        rows = np.repeat(np.arange(length), linewidth)
+        c0, c1 = coordinates[0].ravel(), coordinates[1].ravel()
+        # no interpolation beyond the edges
+        inside = (c0 >= 0) & (c0 <= shape[0] - 1) & (c1 >= 0) & (c1 <= shape[1] - 1)
+        rows, c0, c1 = rows[inside], c0[inside], c1[inside]
+        if order == 0:
+            i0 = np.floor(c0 + 0.5).astype(int)
+            i1 = np.floor(c1 + 0.5).astype(int)
+            cols = np.ravel_multi_index((i0, i1), shape)
+            values = np.ones(rows.size)
+        else:
+            f0, f1 = np.floor(c0), np.floor(c1)
+            d0, d1 = c0 - f0, c1 - f1
+            f0, f1 = f0.astype(int), f1.astype(int)
+            cols, values = [], []
+            for i, w0 in ((0, 1 - d0), (1, d0)):
+                for j, w1 in ((0, 1 - d1), (1, d1)):
+                    # the weight is zero beyond the edges
+                    index = (
+                        np.minimum(f0 + i, shape[0] - 1),
+                        np.minimum(f1 + j, shape[1] - 1),
+                    )
+                    cols.append(np.ravel_multi_index(index, shape))
+                    values.append(w0 * w1)
+            rows = np.tile(rows, 4)
+            cols, values = np.concatenate(cols), np.concatenate(values)
+        weights = sparse.csr_matrix(
+            (values / linewidth, (rows, cols)), shape=(length, int(np.prod(shape)))
+        )
+        outside = np.bincount(
+            np.repeat(np.arange(length), linewidth)[~inside], minlength=length
+        )
+        return weights, outside / linewidth
+
     @staticmethod
     def profile_line(
         img, src, dst, axes, linewidth=1, order=1, mode="constant", cval=0.0
@@ -1412,8 +1619,21 @@ def profile_line(
         # Minimum size 1 pixel
         linewidth_px = linewidth_px if linewidth_px >= 1 else 1
         perp_lines = Line2DROI._line_profile_coordinates(p0, p1, linewidth=linewidth_px)
-        if img.ndim > 2:
-            idx = [ax.index_in_array for ax in axes]
+        idx = [ax.index_in_array for ax in axes]
+        if order in (0, 1) and mode == "constant" and not is_cupy_array(img):
+            # The interpolation weights are computed once and applied to
+            # all the channels with a single sparse matrix product
+            shape = (img.shape[idx[1]], img.shape[idx[0]])
+            weights, offset = Line2DROI._profile_weights(perp_lines, shape, order)
+            intensities = _apply_pixel_weights(
+                np.moveaxis(img, idx[::-1], [0, 1]), 2, weights
+            )
+            if cval != 0:
+                intensities = intensities + cval * offset.reshape(
+                    (-1,) + (1,) * (intensities.ndim - 1)
+                )
+            intensities = np.moveaxis(intensities, 0, min(idx))
+        elif img.ndim > 2:
             if idx[0] < idx[1]:
                 img = np.rollaxis(img, idx[0], 0)
                 img = np.rollaxis(img, idx[1], 1)
@@ -1474,6 +1694,12 @@ def __call__(self, signal, out=None, axes=None, order=0):
             linewidth=self.linewidth,
             order=order,
         )
+        return self._set_profile(signal, profile, axes, out=out)
+
+    __call__.__doc__ %= PARSE_AXES_DOCSTRING
+
+    def _set_profile(self, signal, profile, axes, out=None):
+        # Return the signal of a profile of `signal`, or set it in `out`
         length = np.linalg.norm(
             np.diff(np.array(((self.x1, self.y1), (self.x2, self.y2))), axis=0), axis=1
         )[0]
@@ -1489,7 +1715,10 @@ def __call__(self, signal, out=None, axes=None, order=0):
             )
             axis.axes_manager = axm
             axm._axes.insert(i0, axis)
-            from hyperspy.signals import BaseSignal
+            if isinstance(profile, np.ndarray) or is_cupy_array(profile):
+                from hyperspy.signals import BaseSignal
+            else:
+                from hyperspy._signals.lazy import LazySignal as BaseSignal
 
             roi = BaseSignal(
                 profile,
@@ -1511,6 +1740,423 @@ def __call__(self, signal, out=None, axes=None, order=0):
             out.events.data_changed.trigger(out)
 
 
+def profile_lines(signal, rois, axes=None, order=0):
+    """Extract the profiles of a signal along several lines at once.
+
+    This is equivalent to calling each :class:`~.api.roi.Line2DROI` with the
+    signal, but the data is only read once: the interpolation weights of all
+    the lines are gathered in a single sparse matrix, which is applied to all
+    the channels of the signal at once.
+
+    Parameters
+    ----------
+    signal : :class:`~.api.signals.BaseSignal`
+        The signal to extract the profiles from. It can be lazy, in which
+        case the profiles are lazy.
+    rois : list of :class:`~.api.roi.Line2DROI`
+        The lines.
+    %s
+    order : {0, 1}, default 0
+        The interpolation order: 0 means nearest-neighbor interpolation and
+        1 linear interpolation.
+
+    Returns
+    -------
+    list of :class:`~.api.signals.BaseSignal`
+        The profile of each line, as returned by calling the ROI.
+
+    Examples
+    --------
+    >>> s = hs.signals.Signal1D(np.random.random((64, 64, 1024)))
+    >>> lines = [
+    ...     hs.roi.Line2DROI(x1=0, y1=0, x2=60, y2=60, linewidth=3),
+    ...     hs.roi.Line2DROI(x1=0, y1=60, x2=60, y2=0, linewidth=3),
+    ... ]
+    >>> profiles = hs.roi.profile_lines(s, lines)
+    >>> profiles[0]
+    <BaseSignal, title: , dimensions: (86|1024)>
+    """
+    from scipy import sparse
+
+    if order not in (0, 1):
+        raise ValueError("`order` must be 0 or 1.")
+    rois = list(rois)
+    if len(rois) == 0:
+        raise ValueError("At least one ROI is required.")
+    for roi in rois:
+        if not isinstance(roi, Line2DROI):
+            raise TypeError("All the ROIs must be `Line2DROI`.")
+        if not roi.is_valid():
+            raise ValueError(not_set_error_msg)
+    if axes is None and signal in rois[0].signal_map:
+        axes = rois[0].signal_map[signal][1]
+    else:
+        axes = rois[0]._parse_axes(axes, signal.axes_manager)
+    for axis in axes:
+        if not axis.is_uniform:
+            raise NotImplementedError(
+                "Line profiles on data with non-uniform axes is not implemented."
+            )
+    idx = [axis.index_in_array for axis in axes]
+    data = signal.data
+    shape = (data.shape[idx[1]], data.shape[idx[0]])
+    min_scale = np.min([axis.scale for axis in axes])
+    weights, lengths = [], []
+    for roi in rois:
+        # Same coordinates as `Line2DROI.profile_line`
+        p0, p1 = (
+            tuple((v - axis.offset) / axis.scale for v, axis in zip(point, axes))
+            for point in ((roi.x1, roi.y1), (roi.x2, roi.y2))
+        )
+        linewidth = max(int(round(roi.linewidth / min_scale)), 1)
+        coordinates = Line2DROI._line_profile_coordinates(p0, p1, linewidth=linewidth)
+        roi_weights, _ = Line2DROI._profile_weights(coordinates, shape, order)
+        weights.append(roi_weights)
+        lengths.append(roi_weights.shape[0])
+    profiles = _apply_pixel_weights(
+        np.moveaxis(data, idx[::-1], [0, 1]), 2, sparse.vstack(weights).tocsr()
+    )
+    bounds = np.cumsum([0] + lengths)
+    return [
+        roi._set_profile(signal, np.moveaxis(profiles[start:stop], 0, min(idx)), axes)
+        for roi, start, stop in zip(rois, bounds[:-1], bounds[1:])
+    ]
+
+
+profile_lines.__doc__ %= PARSE_AXES_DOCSTRING
+
+
+def _get_rois_weights(signal, rois, axes):
+    # Return the sparse matrix of the weights of the pixels of the space of
+    # `axes` (flattened in array order) for each ROI, and the axes.
+    from scipy import sparse
+
+    if isinstance(rois, hs.signals.BaseSignal):
+        rois = rois.data
+    if isinstance(rois, np.ndarray):
+        # label image, in array order
+        labels = rois
+        if axes is None:
+            am = signal.axes_manager
+            if labels.shape == am._navigation_shape_in_array:
+                axes = am.navigation_axes
+            elif labels.shape == am._signal_shape_in_array:
+                axes = am.signal_axes
+            else:
+                raise ValueError(
+                    f"The shape of the labels {labels.shape} doesn't match "
+                    "the navigation or signal shape of the signal."
+                )
+        else:
+            axes = signal.axes_manager[axes]
+            if not isinstance(axes, tuple):
+                axes = (axes,)
+        axes = tuple(sorted(axes, key=lambda axis: axis.index_in_array))
+        if labels.shape != tuple(axis.size for axis in axes):
+            raise ValueError(
+                f"The shape of the labels {labels.shape} doesn't match the "
+                "shape of the axes."
+            )
+        labels = labels.ravel()
+        pixels = np.flatnonzero(labels > 0)
+        number = int(labels.max(initial=0))
+        rows = labels[pixels].astype(int) - 1
+    else:
+        rois = list(rois)
+        if len(rois) == 0:
+            raise ValueError("At least one ROI is required.")
+        if axes is None and signal in rois[0].signal_map:
+            axes = rois[0].signal_map[signal][1]
+        else:
+            axes = rois[0]._parse_axes(axes, signal.axes_manager)
+        order = np.argsort([axis.index_in_array for axis in axes])
+        rows, pixels = [], []
+        for i, roi in enumerate(rois):
+            if roi.ndim != len(axes):
+                raise ValueError("All the ROIs must have the same dimension.")
+            # the mask in array order
+            mask = roi._get_mask(axes).transpose(order)
+            roi_pixels = np.flatnonzero(mask)
+            rows.append(np.full(roi_pixels.size, i))
+            pixels.append(roi_pixels)
+        axes = tuple(axes[i] for i in order)
+        number = len(rois)
+        rows, pixels = np.concatenate(rows), np.concatenate(pixels)
+    size = int(np.prod([axis.size for axis in axes]))
+    weights = sparse.csr_matrix(
+        (np.ones(pixels.size), (rows, pixels)), shape=(number, size)
+    )
+    return weights, axes
+
+
+def _sum_rois_block(block, weights, shape, out_dtype, block_info=None):
+    # Sum of the pixels of each ROI in a block whose first axes are the axes
+    # of the ROIs, keeping these axes with a size of 1 and adding the ROI
+    # axis last.
+    ndim = len(shape)
+    location = block_info[0]["array-location"][:ndim]
+    grid = np.meshgrid(
+        *[np.arange(start, stop) for start, stop in location], indexing="ij"
+    )
+    pixels = np.ravel_multi_index(grid, shape).ravel()
+    values = weights[:, pixels] @ block.reshape((pixels.size, -1))
+    values = np.asarray(values, dtype=out_dtype)
+    return values.T.reshape((1,) * ndim + block.shape[ndim:] + (-1,))
+
+
+def _reduce_masked_block(block, mask, reduction, out_dtype, block_info=None):
+    # Reduction of the pixels selected by the mask in a block whose first
+    # axes are the axes of the mask, keeping these axes with a size of 1.
+    ndim = mask.ndim
+    location = block_info[0]["array-location"][:ndim]
+    block_mask = mask[tuple(slice(start, stop) for start, stop in location)]
+    shape = (1,) * ndim + block.shape[ndim:]
+    if not block_mask.any():
+        if reduction == "sum":
+            fill = 0
+        elif np.issubdtype(block.dtype, np.inexact):
+            fill = -np.inf if reduction == "max" else np.inf
+        else:
+            info = np.iinfo(block.dtype)
+            fill = info.min if reduction == "max" else info.max
+        return np.full(shape, fill, dtype=out_dtype)
+    values = getattr(block[block_mask], reduction)(axis=0)
+    return np.asarray(values, dtype=out_dtype).reshape(shape)
+
+
+def _get_reduced_signal(signal, values, axes, new_axis=None):
+    # Return a signal with the given data, whose axes are the axes of
+    # `signal` except `axes`, optionally with `new_axis` (an axis
+    # dictionary) inserted in place of the first of these axes.
+    axes_dicts = [
+        axis.get_axis_dictionary()
+        for axis in signal.axes_manager._axes
+        if all(axis is not roi_axis for roi_axis in axes)
+    ]
+    if new_axis is not None:
+        axes_dicts.insert(min(axis.index_in_array for axis in axes), new_axis)
+    elif not axes_dicts:
+        values = values.reshape((1,))
+        axes_dicts = [{"size": 1, "name": "Scalar", "navigate": False}]
+    out = signal._deepcopy_with_new_data(values)
+    out.axes_manager.__init__(axes_dicts)
+    out.axes_manager._ragged = False
+    out._assign_subclass()
+    return out
+
+
+def _get_weighted_sum_dtype(dtype):
+    # The dtype of the sums of the pixels weighted by the ROIs: integer data
+    # is summed in double precision to keep the exact sum of counts
+    if np.issubdtype(dtype, np.inexact):
+        return np.result_type(dtype, np.float32)
+    return np.dtype(np.float64)
+
+
+def _apply_pixel_weights(data, ndim, weights):
+    # Return the product of the sparse matrix of weights with the pixels of
+    # the data, whose first `ndim` axes are flattened, as an array of shape
+    # ``(weights.shape[0],) + data.shape[ndim:]``. The product is computed
+    # chunk by chunk for dask arrays.
+    dtype = _get_weighted_sum_dtype(data.dtype)
+    number = weights.shape[0]
+    if isinstance(data, np.ndarray):
+        values = weights @ data.reshape((weights.shape[1], -1))
+        values = np.asarray(values, dtype=dtype)
+        return values.reshape((number,) + data.shape[ndim:])
+    import dask.array as da
+
+    chunks = tuple((1,) * len(c) for c in data.chunks[:ndim])
+    chunks += data.chunks[ndim:] + ((number,),)
+    values = da.map_blocks(
+        _sum_rois_block,
+        data,
+        # fast column slicing
+        weights=weights.tocsc(),
+        shape=data.shape[:ndim],
+        out_dtype=dtype,
+        chunks=chunks,
+        new_axis=data.ndim,
+        dtype=dtype,
+    ).sum(axis=tuple(range(ndim)))
+    return da.moveaxis(values, -1, 0)
+
+
+# The maximum number of elements of the dense array of the weights of the
+# pixels of the ROIs used by `_contract_pixel_weights`
+_DENSE_WEIGHTS_MAX_SIZE = 2**22
+
+
+def _contract_pixel_weights(data, indices, shape, weights):
+    # Same as `_apply_pixel_weights` for a numpy array whose axes `indices`
+    # (of shape `shape`) are contracted with the weights in place: moving
+    # them first would copy the whole array. A single ROI only uses the
+    # bounding box of its pixels, like slicing the signal with it; several
+    # ROIs use a dense array of the weights when it is small enough.
+    from scipy import sparse
+
+    dtype = _get_weighted_sum_dtype(data.dtype)
+    number = weights.shape[0]
+    ndim = len(indices)
+    if weights.nnz == 0:
+        other_shape = tuple(
+            size for i, size in enumerate(data.shape) if i not in indices
+        )
+        return np.zeros((number,) + other_shape, dtype=dtype)
+    if number == 1 or number * np.prod(shape) > _DENSE_WEIGHTS_MAX_SIZE:
+        coords = np.unravel_index(weights.indices, shape)
+        bbox = tuple(slice(c.min(), c.max() + 1) for c in coords)
+        shape = tuple(s.stop - s.start for s in bbox)
+        pixels = np.ravel_multi_index(
+            tuple(c - s.start for c, s in zip(coords, bbox)), shape
+        )
+        weights = sparse.csr_matrix(
+            (weights.data, pixels, weights.indptr),
+            shape=(number, int(np.prod(shape))),
+        )
+        slices = [slice(None)] * data.ndim
+        for index, bbox_slice in zip(indices, bbox):
+            slices[index] = bbox_slice
+        data = data[tuple(slices)]
+    if number * np.prod(shape) > _DENSE_WEIGHTS_MAX_SIZE:
+        # many large ROIs: only their bounding box is copied
+        return _apply_pixel_weights(
+            np.moveaxis(data, indices, list(range(ndim))), ndim, weights
+        )
+    dense_weights = weights.toarray().astype(dtype).reshape((number,) + shape)
+    weights_axes = list(range(1, ndim + 1))
+    # `np.tensordot` moves the contracted axes of its first operand last and
+    # those of the second one first: pick the order which keeps the layout
+    # of the data
+    if list(indices) == list(range(ndim)):
+        values = np.tensordot(dense_weights, data, axes=(weights_axes, indices))
+    else:
+        values = np.tensordot(data, dense_weights, axes=(indices, weights_axes))
+        values = np.moveaxis(values, -1, 0)
+    return values.astype(dtype, copy=False)
+
+
+def reduce_rois(signal, rois, reduction="sum", axes=None):
+    """Reduce the pixels of the signal selected by several ROIs (or the
+    regions of a label image) at once.
+
+    This is equivalent to slicing the signal with each ROI, reducing the
+    result over the axes of the ROI and stacking them, but without creating
+    intermediate signals: the sum and the mean are computed in a single pass
+    over the data using a sparse matrix of the pixels of the ROIs.
+
+    Parameters
+    ----------
+    signal : :class:`~.api.signals.BaseSignal`
+        The signal to reduce. It can be lazy, in which case the result is
+        lazy.
+    rois : list of ROI, numpy.ndarray or :class:`~.api.signals.BaseSignal`
+        The ROIs selecting the pixels to reduce, which can overlap.
+        :class:`~.api.roi.Line2DROI` is not supported. Alternatively, an
+        integer label image, whose shape is the shape of the axes in array
+        order: the pixels with label ``i > 0`` are reduced in the
+        ``i - 1`` element of the output and the pixels with label 0 are
+        ignored.
+    reduction : {"sum", "mean", "max", "min"}, default "sum"
+        The reduction applied to the pixels selected by each ROI.
+    axes : None, str, int or tuple, default None
+        The axes the ROIs are applied on. If None, the axes of the widgets of
+        the ROIs on this signal are used, if any. Otherwise, the navigation
+        axes are used if possible, or the signal axes, as when slicing a
+        signal with a ROI.
+
+    Returns
+    -------
+    :class:`~.api.signals.BaseSignal` (or subclass)
+        The signal where the axes of the ROIs are replaced by a single axis
+        of the ROIs, which is a navigation axis if the ROIs operate on the
+        navigation space, and a signal axis otherwise.
+
+    Examples
+    --------
+    Sum the spectra of three regions of a spectrum image:
+
+    >>> s = hs.signals.Signal1D(np.random.random((64, 64, 1024)))
+    >>> rois = [
+    ...     hs.roi.RectangularROI(left=0, top=0, right=10, bottom=10),
+    ...     hs.roi.CircleROI(cx=32, cy=32, r=5),
+    ...     hs.roi.CircleROI(cx=48, cy=16, r=8, r_inner=4),
+    ... ]
+    >>> hs.roi.reduce_rois(s, rois)
+    <Signal1D, title: , dimensions: (3|1024)>
+
+    Mean spectra of the regions of a label image:
+
+    >>> labels = np.zeros((64, 64), dtype=int)
+    >>> labels[:32], labels[40:] = 1, 2
+    >>> hs.roi.reduce_rois(s, labels, reduction="mean")
+    <Signal1D, title: , dimensions: (2|1024)>
+    """
+    if reduction not in ("sum", "mean", "max", "min"):
+        raise ValueError(
+            f"`reduction` must be 'sum', 'mean', 'max' or 'min', not '{reduction}'."
+        )
+    weights, axes = _get_rois_weights(signal, rois, axes)
+    number = weights.shape[0]
+    shape = tuple(axis.size for axis in axes)
+    indices = [axis.index_in_array for axis in axes]
+    ndim = len(indices)
+    data = signal.data
+    if signal._lazy:
+        import dask.array as da
+
+        xp = da
+    else:
+        xp = np
+    # move the axes of the ROIs first
+    data = xp.moveaxis(data, indices, list(range(ndim)))
+    if reduction in ("sum", "mean"):
+        if signal._lazy:
+            values = _apply_pixel_weights(data, ndim, weights)
+        else:
+            values = _contract_pixel_weights(signal.data, indices, shape, weights)
+        if reduction == "mean":
+            counts = np.asarray(weights.sum(axis=1)).reshape(
+                (-1,) + (1,) * (values.ndim - 1)
+            )
+            with np.errstate(invalid="ignore", divide="ignore"):
+                values = values / counts
+    else:
+        if np.issubdtype(data.dtype, np.inexact):
+            fill = -np.inf if reduction == "max" else np.inf
+        else:
+            info = np.iinfo(data.dtype)
+            fill = info.min if reduction == "max" else info.max
+        values = []
+        for i in range(number):
+            mask = np.zeros(weights.shape[1], dtype=bool)
+            mask[weights[i].indices] = True
+            mask = mask.reshape(shape)
+            if not mask.any():
+                values.append(xp.full(data.shape[ndim:], fill, dtype=data.dtype))
+                continue
+            # reduce the bounding box of the ROI only
+            bbox = tuple(
+                slice(nonzero.min(), nonzero.max() + 1) for nonzero in np.nonzero(mask)
+            )
+            mask = mask[bbox].reshape(mask[bbox].shape + (1,) * (data.ndim - ndim))
+            values.append(
+                getattr(xp.where(mask, data[bbox], fill), reduction)(
+                    axis=tuple(range(ndim))
+                )
+            )
+        values = xp.stack(values)
+
+    # insert the ROI axis in place of the first axis of the ROIs
+    values = xp.moveaxis(values, 0, min(indices))
+    return _get_reduced_signal(
+        signal,
+        values,
+        axes,
+        new_axis={"size": number, "name": "ROI", "navigate": axes[0].navigate},
+    )
+
+
 def _get_central_half_limits_of_axis(ax):
     "Return indices of the central half of a DataAxis"
     return ax._parse_value("rel0.25"), ax._parse_value("rel0.75")
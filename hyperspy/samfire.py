@@ -17,6 +17,7 @@
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import logging
+import os
 from multiprocessing import cpu_count
 
 import cloudpickle
@@ -27,6 +28,7 @@
 from hyperspy.misc.utils import DictionaryTreeBrowser, slugify
 from hyperspy.samfire_utils.global_strategies import HistogramStrategy
 from hyperspy.samfire_utils.local_strategies import ReducedChiSquaredStrategy
+from hyperspy.samfire_utils.pixel_queue import PixelQueue
 from hyperspy.samfire_utils.strategy import GlobalStrategy, LocalStrategy
 from hyperspy.signal import BaseSignal
 
@@ -147,6 +149,10 @@ def __init__(self, model, workers=None, setup=True, random_state=None, **kwargs)
         marker.fill(self._scale)
 
         self.metadata.marker = marker
+        self._pixel_queue = PixelQueue(self)
+        # pixels updated since the last backup to self._backup_file
+        self._updated_pixels = set()
+        self._backup_file = None
         self.strategies = StrategyList(self)
         self.strategies.append(ReducedChiSquaredStrategy())
         self.strategies.append(HistogramStrategy())
@@ -169,6 +175,25 @@ def __init__(self, model, workers=None, setup=True, random_state=None, **kwargs)
     def metadata(self):
         return self._metadata
 
+    @property
+    def worker_stats(self):
+        """The statistics of the workers of the pool, accumulated since they
+        were prepared, as a dictionary with one item per worker, each a
+        dictionary with:
+
+        * ``"jobs"``: the number of jobs (batches of pixels) run,
+        * ``"pixels"``: the number of pixels fitted,
+        * ``"busy_time"``: the time spent fitting, in seconds (only with
+          multiprocessing),
+        * ``"utilization"``: the fraction of the running time of SAMFire
+          spent fitting (only with multiprocessing, otherwise NaN).
+
+        Empty if SAMFire runs without a pool.
+        """
+        if self.pool is None:
+            return {}
+        return self.pool.worker_stats
+
     @property
     def active_strategy(self):
         return self.strategies[self._active_strategy_ind]
@@ -307,6 +332,7 @@ def _run_active_strategy_one(self):
                 self.metadata.goodness_test,
             )
             self.running_pixels.remove(ind)
+            self._updated_pixels.add(ind)
             self.count += 1
             if isgood:
                 self._progressbar.update(1)
@@ -314,24 +340,65 @@ def _run_active_strategy_one(self):
             self.plot(on_count=True)
             self.backup(on_count=True)
 
+    def _get_backup_filename(self, filename):
+        if filename is None:
+            title = self.model.signal.metadata.General.title
+            filename = slugify("backup_" + title)
+        if not os.path.splitext(filename)[1]:
+            filename += ".h5"
+        return filename
+
     def backup(self, filename=None, on_count=True):
-        """Backup the samfire results in a file.
+        """Backup the samfire results in a HDF5 checkpoint file.
+
+        The first backup writes all the results of the model, the marker and
+        the active strategy. The following backups to the same file only
+        write the pixels updated since the previous one. SAMFire can be
+        restarted from the file with :meth:`load_backup`.
 
         Parameters
         ----------
         filename : str, None, default None
             the filename. If None, a default value of ``backup_`` + signal_title
-            is used.
+            is used. If it has no extension, ``.h5`` is added.
         on_count : bool, default True
             if True, only saves on the required count of steps
         """
-        if filename is None:
-            title = self.model.signal.metadata.General.title
-            filename = slugify("backup_" + title)
-        # maybe add saving marker + strategies as well?
+        from hyperspy.samfire_utils.checkpoint import write_checkpoint
+
+        filename = self._get_backup_filename(filename)
         if self.count % self.save_every == 0 or not on_count:
-            self.model.save(filename, name="samfire_backup", overwrite=True)
-            self.model.signal.models.remove("samfire_backup")
+            if filename == self._backup_file and os.path.exists(filename):
+                write_checkpoint(self, filename, pixels=list(self._updated_pixels))
+            else:
+                write_checkpoint(self, filename)
+            self._backup_file = filename
+            self._updated_pixels = set()
+
+    def load_backup(self, filename=None):
+        """Restore the samfire results and state from a backup written by
+        :meth:`backup`, to restart an interrupted SAMFire run with
+        :meth:`start`.
+
+        The model must have the same navigation shape and components as the
+        one of the saved SAMFire, and the strategies must be the same.
+
+        Parameters
+        ----------
+        filename : str, None, default None
+            the filename. If None, a default value of ``backup_`` + signal_title
+            is used. If it has no extension, ``.h5`` is added.
+        """
+        from hyperspy.samfire_utils.checkpoint import read_checkpoint
+
+        filename = self._get_backup_filename(filename)
+        read_checkpoint(self, filename)
+        self.model.fetch_stored_values()
+        self._backup_file = filename
+        self._updated_pixels = set()
+        # the pixels running when saving have to be fitted again
+        self.running_pixels = []
+        self.active_strategy.refresh(False)
 
     def update(self, ind, results=None, isgood=None):
         """Updates the current model with the results, received from the
@@ -350,6 +417,7 @@ def update(self, ind, results=None, isgood=None):
         """
         if results is not None and (isgood is None or isgood):
             self._swap_dict_and_model(ind, results)
+            self._updated_pixels.add(ind)
 
         if isgood is None:
             isgood = self.metadata.goodness_test.test(self.model, ind)
@@ -438,10 +506,11 @@ def generate_values(self, need_inds):
             the number of pixels to be returned in the generator
         """
         if need_inds:
-            # get pixel index
-            for ind in self._next_pixels(need_inds):
-                # get starting parameters / array of possible values
-                value_dict = self.active_strategy.values(ind)
+            # get pixel indices
+            inds = self._next_pixels(need_inds)
+            # get starting parameters / array of possible values
+            values = self.active_strategy.batch_values(inds)
+            for ind, value_dict in zip(inds, values):
                 value_dict["fitting_kwargs"] = self._args
                 value_dict["signal.data"] = self.model.signal.data[ind + (...,)]
                 if self.model.signal._lazy:
@@ -466,19 +535,7 @@ def generate_values(self, need_inds):
                 yield ind, value_dict
 
     def _next_pixels(self, number):
-        best = self.metadata.marker.max()
-        inds = []
-        if best > 0.0:
-            ind_list = np.where(self.metadata.marker == best)
-            while number and ind_list[0].size > 0:
-                i = self.random_state.integers(len(ind_list[0]))
-                ind = tuple([lst[i] for lst in ind_list])
-                if ind not in self.running_pixels:
-                    inds.append(ind)
-                # removing the added indices
-                ind_list = [np.delete(lst, i, 0) for lst in ind_list]
-                number -= 1
-        return inds
+        return self._pixel_queue.pop(number, exclude=self.running_pixels)
 
     def _swap_dict_and_model(self, m_ind, dict_, d_ind=None):
         if d_ind is None:
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2024 The HyperSpy developers
+#
+# This file is part of HyperSpy.
+#
+# HyperSpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# HyperSpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""Incremental checkpoints of the SAMFire results in HDF5 files.
+
+The results of the model (parameter maps, reduced chi-squared, degrees of
+freedom and active arrays) are stored with the navigation dimensions
+flattened and chunked, so that the pixels updated since the previous
+checkpoint can be written without rewriting the whole file. The marker and
+the position in the strategies list are stored alongside, to restart
+SAMFire from the checkpoint.
+"""
+
+import numpy as np
+
+# number of pixels per chunk of the datasets
+_CHUNK_SIZE = 1024
+
+
+def _model_arrays(model):
+    """Yields the path in the checkpoint and the array of each result of the
+    model, with the navigation dimensions first."""
+    yield "chisq", model.chisq.data
+    yield "dof", model.dof.data
+    for component in model:
+        path = "components/" + component.name
+        if component.active_is_multidimensional:
+            yield path + "/_active_array", component._active_array
+        for par in component.parameters:
+            yield path + "/" + par.name, par.map
+
+
+def write_checkpoint(samf, filename, pixels=None):
+    """Writes the results and the state of a SAMFire to a checkpoint file.
+
+    Parameters
+    ----------
+    samf : :class:`~hyperspy.samfire.Samfire`
+        The SAMFire to save.
+    filename : str
+        The name of the HDF5 file.
+    pixels : None or list of tuple, default None
+        If None, the file is (over)written with all the pixels. Otherwise,
+        only the given pixels are updated in the existing file.
+    """
+    import h5py
+
+    marker = samf.metadata.marker
+    if pixels is not None:
+        flat_pixels = np.unique(
+            np.ravel_multi_index(tuple(np.array(pixels, dtype=int).T), marker.shape)
+            if len(pixels)
+            else np.empty(0, dtype=int)
+        )
+    with h5py.File(filename, "w" if pixels is None else "r+") as f:
+        f.attrs["navigation_shape"] = marker.shape
+        for path, array in _model_arrays(samf.model):
+            flat = array.reshape((marker.size,) + array.shape[marker.ndim :])
+            if pixels is None or path not in f:
+                if path in f:
+                    del f[path]
+                f.create_dataset(
+                    path,
+                    data=flat,
+                    chunks=(min(marker.size, _CHUNK_SIZE),) + flat.shape[1:],
+                )
+            elif flat_pixels.size:
+                f[path][flat_pixels] = flat[flat_pixels]
+        # the marker changes around every fitted pixel, so it is always
+        # written entirely
+        if "marker" in f:
+            f["marker"][...] = marker
+        else:
+            f.create_dataset("marker", data=marker)
+        f.attrs["active_strategy_ind"] = samf._active_strategy_ind
+        f.attrs["count"] = samf.count
+
+
+def read_checkpoint(samf, filename):
+    """Restores the results and the state of a SAMFire from a checkpoint file
+    written by :func:`write_checkpoint`.
+
+    Parameters
+    ----------
+    samf : :class:`~hyperspy.samfire.Samfire`
+        The SAMFire to restore, whose model must have the same navigation
+        shape and components as the saved one.
+    filename : str
+        The name of the HDF5 file.
+    """
+    import h5py
+
+    marker = samf.metadata.marker
+    with h5py.File(filename, "r") as f:
+        if tuple(f.attrs["navigation_shape"]) != marker.shape:
+            raise ValueError(
+                "The navigation shape of the checkpoint "
+                f"{tuple(f.attrs['navigation_shape'])} doesn't match the "
+                f"navigation shape of the model {marker.shape}."
+            )
+        arrays = list(_model_arrays(samf.model))
+        missing = [path for path, _ in arrays if path not in f]
+        if missing:
+            raise ValueError(
+                "The checkpoint doesn't match the model, it is missing: "
+                + ", ".join(missing)
+            )
+        for path, array in arrays:
+            array[...] = f[path][...].reshape(array.shape)
+        samf.metadata.marker = f["marker"][...]
+        samf._active_strategy_ind = int(f.attrs["active_strategy_ind"])
+        samf.count = int(f.attrs["count"])
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2024 The HyperSpy developers
+#
+# This file is part of HyperSpy.
+#
+# HyperSpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# HyperSpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import heapq
+
+import numpy as np
+
+
+class PixelQueue:
+    """Priority queue of the pixels left to fit by SAMFire, ordered by their
+    value in the SAMFire marker (highest first), with random tie-breaking.
+
+    The queue is a heap with lazy deletion: when the marker of a pixel
+    increases, the strategy pushes the pixel again with :meth:`push`, and the
+    entries that don't match the current marker are discarded (or moved
+    down, if the marker decreased) when popped. The popped pixels are
+    expected to be removed from the marker by SAMFire.
+    When the marker changes as a whole (e.g. when refreshing a strategy), the
+    queue is rebuilt from the marker after calling :meth:`invalidate`.
+    Selecting a pixel costs O(log N).
+    """
+
+    def __init__(self, samf):
+        """
+        Parameters
+        ----------
+        samf : :class:`~hyperspy.samfire.Samfire`
+            The SAMFire whose marker is indexed.
+        """
+        self.samf = samf
+        self._heap = []
+        self._marker = None
+
+    def invalidate(self):
+        """Rebuild the queue from the marker on next use."""
+        self._marker = None
+        self._heap = []
+
+    def _entries(self, marker, flat_indices):
+        values = marker.flat[flat_indices]
+        keep = values > 0.0
+        flat_indices = flat_indices[keep]
+        # random keys for the tie-breaking
+        keys = self.samf.random_state.random(flat_indices.size)
+        return list(zip((-values[keep]).tolist(), keys.tolist(), flat_indices.tolist()))
+
+    def rebuild(self):
+        """Build the queue from the current marker."""
+        marker = self.samf.metadata.marker
+        self._marker = marker
+        self._heap = self._entries(marker, np.flatnonzero(marker > 0.0))
+        heapq.heapify(self._heap)
+
+    def push(self, flat_indices):
+        """Add or update the given pixels after their marker increased.
+
+        Parameters
+        ----------
+        flat_indices : array of int
+            The indices of the pixels in the flattened marker.
+        """
+        marker = self.samf.metadata.marker
+        if marker is not self._marker:
+            # will be rebuilt with the new values anyway
+            return
+        for entry in self._entries(marker, np.asarray(flat_indices, dtype=int)):
+            heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * marker.size + 1000:
+            # too many outdated entries
+            self.invalidate()
+
+    def pop(self, number, exclude=()):
+        """Remove and return pixels with the highest value of the marker.
+
+        Only the pixels sharing the highest value are returned, in random
+        order.
+
+        Parameters
+        ----------
+        number : int
+            The (maximum) number of pixels to return.
+        exclude : container of tuple
+            The pixels that must not be returned (e.g. that are running).
+
+        Returns
+        -------
+        list of tuple
+            The indices of the pixels.
+        """
+        marker = self.samf.metadata.marker
+        if marker is not self._marker:
+            self.rebuild()
+        inds = []
+        seen = set()
+        best = None
+        rebuilt = False
+        while len(inds) < number:
+            if not self._heap:
+                if best is not None or rebuilt or not np.any(marker > 0.0):
+                    break
+                # the marker changed without notifying the queue
+                self.rebuild()
+                rebuilt = True
+                continue
+            entry = self._heap[0]
+            value, _, flat_index = entry
+            current = marker.flat[flat_index]
+            if current != -value or flat_index in seen:
+                # outdated entry
+                heapq.heappop(self._heap)
+                if 0.0 < current < -value:
+                    # decreased without notifying the queue
+                    heapq.heappush(self._heap, (-current, entry[1], flat_index))
+                continue
+            if best is not None and value != best:
+                break
+            heapq.heappop(self._heap)
+            best = value
+            seen.add(flat_index)
+            ind = tuple(int(i) for i in np.unravel_index(flat_index, marker.shape))
+            if ind not in exclude:
+                inds.append(ind)
+        return inds
@@ -17,15 +17,26 @@
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 
+import hashlib
 import logging
+import os
 import time
-from multiprocessing import Manager
+from concurrent.futures import wait as futures_wait
+from multiprocessing import Pipe, resource_tracker
+from multiprocessing.connection import wait
 
+import cloudpickle
 import numpy as np
 from dask.array import Array as dar
 
-from hyperspy.samfire_utils.samfire_worker import create_worker
-from hyperspy.utils.parallel_pool import ParallelPool
+from hyperspy.samfire_utils.samfire_worker import (
+    _shared_input_layout,
+    _shared_result_layout,
+    create_worker,
+    read_shared_result,
+)
+from hyperspy.samfire_utils.shared_arrays import SharedArrays
+from hyperspy.utils.parallel_pool import ParallelPool, shutdown_reusable_executor
 
 _logger = logging.getLogger(__name__)
 
@@ -56,15 +67,21 @@ class SamfirePool(ParallelPool):
     and sets up ipyparallel load_balanced_view.
 
     Ipyparallel is managed directly, but multiprocessing pool is managed via
-    three of queues:
-
-    * Shared by all (master and workers) for distributing "load-balanced"
-      work.
-    * Shared by all (master and workers) for sending results back to the
-      master
-    * Individual queues from master to each worker. For setting up and
-      addressing individual workers in general. This one is checked with
-      higher priority in workers.
+    a pipe to each worker and two blocks of shared memory:
+
+    * The pipes carry the messages between the master and the workers: the
+      commands to set up the workers, the indices of the pixels to fit and
+      the notifications that the results are ready. The jobs are given to
+      the least busy workers, and the master waits for the results on the
+      pipes instead of polling them.
+    * The data of the pixels (signal, variance and low-loss) are written by
+      the master into a free "slot" of the shared input arrays, and the
+      fitted parameter maps are written back by the workers into the same
+      slot of the shared result arrays, so that no array is pickled.
+
+    With multiprocessing, each job contains a batch of pixels, whose size
+    adapts so that a job takes about ``job_duration`` seconds, to reduce the
+    messaging overhead when the fits are fast.
 
     Attributes
     ----------
@@ -87,6 +104,17 @@ class SamfirePool(ParallelPool):
         If recorded, stores one-way trip time of each worker
     pid : dict
         If available, stores the process-id of each worker
+    batch_size : int
+        The current number of pixels per job (multiprocessing only).
+    max_batch_size : int
+        The maximum number of pixels per job (multiprocessing only). Has to
+        be set before the workers are prepared.
+    job_duration : float
+        The targeted duration of a job in seconds, used to adapt the
+        ``batch_size`` (multiprocessing only).
+    worker_stats : dict
+        The statistics of each worker, see
+        :attr:`~hyperspy.samfire.Samfire.worker_stats`.
     """
 
     def __init__(self, **kwargs):
@@ -98,17 +126,34 @@ def __init__(self, **kwargs):
         self.pid = {}
         self.workers = {}
         self.rworker = None
-        self.result_queue = None
-        self.shared_queue = None
+        self.shared_input = None
+        self.shared_result = None
+        self._free_slots = []
+        self._running_slots = {}
+        self._jobs = {}
+        self._stats = {}
+        self._run_time = 0.0
+        self._worker_futures = []
+        self.batch_size = 1
+        self.max_batch_size = 32
+        self.job_duration = 0.1
         self._last_time = 0
         self.results = []
 
+    def _setup_multiprocessing(self):
+        if os.name == "posix":
+            # The workers have to share the resource tracker of the master,
+            # otherwise the shared memory that they attach to is unlinked by
+            # their own resource tracker when they exit.
+            resource_tracker.ensure_running()
+        return super()._setup_multiprocessing()
+
     def _timestep_set(self, value):
         value = np.abs(value)
         self._timestep = value
         if self.has_pool and self.is_multiprocessing:
-            for this_queue in self.workers.values():
-                this_queue.put(("change_timestep", (value,)))
+            for connection in self.workers.values():
+                connection.send(("change_timestep", (value,)))
 
     def prepare_workers(self, samfire):
         """Given SAMFire object, populate the workers with the required
@@ -136,6 +181,12 @@ def prepare_workers(self, samfire):
 
         optional_names = {mall[c].name for c in samfire.optional_components}
 
+        self._stats = {
+            i: {"jobs": 0, "pixels": 0, "busy_time": 0.0}
+            for i in range(self.num_workers)
+        }
+        self._run_time = 0.0
+
         if self.is_ipyparallel:
             from ipyparallel import Reference as ipp_Reference
 
@@ -166,18 +217,32 @@ def prepare_workers(self, samfire):
 
         if self.is_multiprocessing:
             _logger.debug("preparing multiprocessing workers")
-            manager = Manager()
-            self.shared_queue = manager.Queue()
-            self.result_queue = manager.Queue()
+            # at most two jobs per worker are in flight, see `need_pixels`
+            num_slots = 2 * self.num_workers * self.max_batch_size
+            self.shared_input = SharedArrays(_shared_input_layout(model, num_slots))
+            self.shared_result = SharedArrays(_shared_result_layout(model, num_slots))
+            self._free_slots = list(range(num_slots))
+            self._running_slots = {}
+            self._jobs = {i: 0 for i in range(self.num_workers)}
+            self.batch_size = 1
+            self._worker_futures = []
+            # identifies the model, for the workers that are reused to
+            # recognise a model they have already created
+            model_key = hashlib.sha1(cloudpickle.dumps(m_dict)).hexdigest()
             for i in range(self.num_workers):
-                this_queue = manager.Queue()
-                self.workers[i] = this_queue
-                this_queue.put(("setup_test", (samfire.metadata._gt_dump,)))
-                this_queue.put(("create_model", (m_dict, "z")))
-                this_queue.put(("set_optional_names", (optional_names,)))
-                self.pool.apply_async(
-                    create_worker,
-                    args=(i, this_queue, self.shared_queue, self.result_queue),
+                connection, worker_connection = Pipe()
+                self.workers[i] = connection
+                connection.send(("setup_test", (samfire.metadata._gt_dump,)))
+                connection.send(("create_model", (m_dict, "z", model_key)))
+                connection.send(("set_optional_names", (optional_names,)))
+                connection.send(
+                    (
+                        "attach_shared_arrays",
+                        (self.shared_input.spec, self.shared_result.spec),
+                    )
+                )
+                self._worker_futures.append(
+                    self._submit(create_worker, i, connection=worker_connection)
                 )
 
     def update_parameters(self):
@@ -194,10 +259,10 @@ def update_parameters(self):
             for comp in self.samf.model
         )
         if self.is_multiprocessing:
-            for this_queue in self.workers.values():
-                this_queue.put(("set_optional_names", (optional_names,)))
-                this_queue.put(("setup_test", (samfire.metadata._gt_dump,)))
-                this_queue.put(("set_parameter_boundaries", (boundaries,)))
+            for connection in self.workers.values():
+                connection.send(("set_optional_names", (optional_names,)))
+                connection.send(("setup_test", (samfire.metadata._gt_dump,)))
+                connection.send(("set_parameter_boundaries", (boundaries,)))
         elif self.is_ipyparallel:
             direct_view = self.pool.client[: self.num_workers]
             direct_view.block = True
@@ -231,8 +296,8 @@ def ping_workers(self, timeout=None):
             _logger.error("Have to add samfire to the pool first")
         else:
             if self.is_multiprocessing:
-                for _id, this_queue in self.workers.items():
-                    this_queue.put("ping")
+                for _id, connection in self.workers.items():
+                    connection.send("ping")
                     self.ping[_id] = time.time()
             elif self.is_ipyparallel:
                 for i in range(self.num_workers):
@@ -253,15 +318,19 @@ def __len__(self):
         if self.is_ipyparallel:
             return self.pool.client.queue_status()["unassigned"]
         elif self.is_multiprocessing:
-            return self.shared_queue.qsize()
+            # the jobs waiting for a worker to be free
+            return max(0, sum(self._jobs.values()) - self.num_workers)
 
     def add_jobs(self, needed_number=None):
         """Adds jobs to the job queue that is consumed by the workers.
 
+        With multiprocessing, the pixels are split in jobs of at most
+        ``batch_size`` pixels, each sent to the least busy worker.
+
         Parameters
         ----------
         needed_number: {None, int}
-            The number of jobs to add. If None (default), adds `need_pixels`
+            The number of pixels to add. If None (default), adds `need_pixels`
         """
 
         def test_func(worker, ind, value_dict):
@@ -269,10 +338,23 @@ def test_func(worker, ind, value_dict):
 
         if needed_number is None:
             needed_number = self.need_pixels
+        if self.is_multiprocessing:
+            needed_number = min(needed_number, len(self._free_slots))
+            batch = []
+            for ind, value_dict in self.samf.generate_values(needed_number):
+                slot = self._free_slots.pop()
+                for key, array in self.shared_input.arrays.items():
+                    array[slot] = value_dict.pop(key)
+                self._running_slots[slot] = ind
+                batch.append((ind, value_dict, slot))
+                if len(batch) == self.batch_size:
+                    self._send_job(batch)
+                    batch = []
+            if batch:
+                self._send_job(batch)
+            return
         for ind, value_dict in self.samf.generate_values(needed_number):
-            if self.is_multiprocessing:
-                self.shared_queue.put(("run_pixel", (ind, value_dict)))
-            elif self.is_ipyparallel:
+            if self.is_ipyparallel:
                 self.results.append(
                     (
                         self.pool.apply_async(test_func, self.rworker, ind, value_dict),
@@ -280,21 +362,58 @@ def test_func(worker, ind, value_dict):
                     )
                 )
 
+    def _send_job(self, batch):
+        _id = min(self._jobs, key=self._jobs.get)
+        self._jobs[_id] += 1
+        self.workers[_id].send(("run_pixels", tuple(zip(*batch))))
+
+    def _adapt_batch_size(self, batch_size, duration):
+        """Adapt the number of pixels per job to the duration of the last job,
+        so that a job takes about ``job_duration``. The batch size at most
+        doubles from one job to the next."""
+        if duration > 0:
+            target = int(self.job_duration * batch_size / duration)
+        else:
+            target = self.max_batch_size
+        target = max(1, min(target, 2 * self.batch_size, self.max_batch_size))
+        if target != self.batch_size:
+            _logger.debug("Changing the batch size to {}".format(target))
+        self.batch_size = target
+
+    @property
+    def worker_stats(self):
+        """The statistics of each worker, see
+        :attr:`~hyperspy.samfire.Samfire.worker_stats`."""
+        stats = {}
+        for _id, this in self._stats.items():
+            this = dict(this)
+            if self._run_time > 0 and self.is_multiprocessing:
+                this["utilization"] = min(1.0, this["busy_time"] / self._run_time)
+            else:
+                this["utilization"] = np.nan
+            stats[_id] = this
+        return stats
+
     def parse(self, value):
         """Parse the value returned from the workers.
 
         Parameters
         ----------
         value: tuple of the form (keyword, the_rest)
-            Keyword currently can be one of ['pong', 'Error', 'result']. For
-            each of the keywords, "the_rest" is a tuple of different elements,
-            but generally the first one is always the worker_id that the result
-            came from. In particular:
+            Keyword currently can be one of ['pong', 'Error', 'result',
+            'shared_result', 'batch']. For each of the keywords, "the_rest" is
+            a tuple of different elements, but generally the first one is
+            always the worker_id that the result came from. In particular:
 
             * ('pong', (worker_id, pid, pong_time, optional_message_str))
             * ('Error', (worker_id, error_message_string))
             * ('result', (worker_id, pixel_index, result_dict,
               bool_if_result_converged))
+            * ('shared_result', (worker_id, pixel_index, slot,
+              component_names, bool_if_result_converged)), when the
+              result has been written in the shared memory
+            * ('batch', (worker_id, list_of_values, duration)), the values
+              returned by a job of several pixels and the time it took
         """
         if value is None:
             keyword = "Failed"
@@ -302,6 +421,23 @@ def parse(self, value):
         else:
             keyword, the_rest = value
         samf = self.samf
+        if keyword == "batch":
+            _id, values, duration = the_rest
+            self._jobs[_id] -= 1
+            self._stats[_id]["jobs"] += 1
+            self._stats[_id]["busy_time"] += duration
+            self._adapt_batch_size(len(values), duration)
+            for this_value in values:
+                self.parse(this_value)
+            return
+        if keyword == "shared_result":
+            _id, ind, slot, component_names, isgood = the_rest
+            result = None
+            if component_names:
+                result = read_shared_result(self.shared_result, slot, component_names)
+            self._running_slots.pop(slot, None)
+            self._free_slots.append(slot)
+            keyword, the_rest = "result", (_id, ind, result, isgood)
         if keyword == "pong":
             _id, pid, pong_time, message = the_rest
             self.ping[_id] = pong_time - self.ping[_id]
@@ -318,6 +454,10 @@ def parse(self, value):
             _logger.debug(
                 "Got result from pixel {} and it is good:" "{}".format(ind, isgood)
             )
+            if _id in self._stats:
+                self._stats[_id]["pixels"] += 1
+                if self.is_ipyparallel:
+                    self._stats[_id]["jobs"] += 1
             if ind in samf.running_pixels:
                 samf.running_pixels.remove(ind)
                 samf.update(ind, result, isgood)
@@ -329,7 +469,7 @@ def parse(self, value):
                 "Unusual return from some worker. The value " "is:\n%s" % str(value)
             )
 
-    def collect_results(self, timeout=None):
+    def collect_results(self, timeout=None, block=False):
         """Collects and parses all results, currently not processed due to
         being in the queue.
 
@@ -338,6 +478,9 @@ def collect_results(self, timeout=None):
         timeout: {None, flaot}
             the time to wait when collecting results. If None, the default
             timeout is used
+        block : bool, default False
+            Only used with multiprocessing. If True, wait (at most
+            ``timeout``) for a result to be available if none is.
 
         """
         if timeout is None:
@@ -361,28 +504,23 @@ def collect_results(self, timeout=None):
                 else:
                     pass
         elif self.is_multiprocessing:
-            while not self.result_queue.empty():
-                try:
-                    result = self.result_queue.get(block=True, timeout=timeout)
-                    self.parse(result)
+            connections = list(self.workers.values())
+            for connection in wait(connections, timeout if block else 0):
+                while connection.poll():
+                    self.parse(connection.recv())
                     found_something = True
-                except TimeoutError:
-                    _logger.info(
-                        "Some ind failed to come back in {} " "seconds.".format(
-                            self.timeout
-                        )
-                    )
         return found_something
 
     @property
     def need_pixels(self):
         """Returns the number of pixels that should be added to the processing
-        queue. At most is equal to the number of workers.
+        queue. At most is equal to the number of workers (times the
+        ``batch_size`` with multiprocessing).
         """
-        return min(
-            self.samf.pixels_done * self.samf.metadata.marker.ndim,
-            self.num_workers - len(self),
-        )
+        need = self.num_workers - len(self)
+        if self.is_multiprocessing:
+            need = min(need * self.batch_size, len(self._free_slots))
+        return min(self.samf.pixels_done * self.samf.metadata.marker.ndim, need)
 
     @property
     def _not_too_long(self):
@@ -401,9 +539,19 @@ def run(self):
         Run the full procedure until no more pixels are left to run in the
         SAMFire.
         """
+        start = time.perf_counter()
+        self._last_time = time.time()
         while self._not_too_long and (
             self.samf.pixels_left or len(self.samf.running_pixels)
         ):
+            if self.is_multiprocessing:
+                need_number = self.need_pixels
+                if need_number > 0:
+                    self.add_jobs(need_number)
+                # wait for the workers to send something back
+                if self.collect_results(block=True):
+                    self._last_time = time.time()
+                continue
             # bool if got something
             new_result = self.collect_results()
             need_number = self.need_pixels
@@ -415,16 +563,35 @@ def run(self):
                 self.sleep()
             else:
                 self._last_time = time.time()
+        self._run_time += time.perf_counter() - start
 
     def stop(self):
         """Stops the appropriate pool and (if ipyparallel) clears the memory
         and history.
         """
         if self.is_multiprocessing:
-            for queue in self.workers.values():
-                queue.put("stop_listening")
-            self.pool.close()
-            self.pool.terminate()
-            self.pool.join()
+            for connection in self.workers.values():
+                connection.send("stop_listening")
+            if self.reuse_workers:
+                # the workers finish their jobs and return, but the processes
+                # are kept alive for the next pool
+                _, not_done = futures_wait(self._worker_futures, timeout=self.timeout)
+                if not_done:
+                    _logger.warning(
+                        "The workers did not stop in time, their processes "
+                        "are shut down."
+                    )
+                    shutdown_reusable_executor(wait=False)
+                for connection in self.workers.values():
+                    connection.close()
+                self.workers = {}
+                self._worker_futures = []
+            else:
+                self.pool.close()
+                self.pool.terminate()
+                self.pool.join()
+            for shared in (self.shared_input, self.shared_result):
+                if shared is not None:
+                    shared.close()
         elif self.is_ipyparallel:
             self.pool.client.clear()
@@ -26,20 +26,110 @@
 import cloudpickle
 import numpy as np
 
+from hyperspy.samfire_utils.shared_arrays import SharedArrays
 from hyperspy.signal import BaseSignal
 from hyperspy.utils.model_selection import AICc
 
 _logger = logging.getLogger(__name__)
 
+# The models created in this process, by key, to be reused by the next
+# workers when the processes are reused (see `Worker.create_model`)
+_model_cache = {}
+_MODEL_CACHE_SIZE = 4
+
+
+def _result_signal_names(model):
+    """The names of the signals of the model that are sent back with the
+    results of the fits, e.g. ``chisq`` and ``dof``."""
+    names = []
+    for k, v in model.__dict__.items():
+        # the signals can be stored as private attributes, with a property
+        name = k[1:] if k.startswith("_") and hasattr(type(model), k[1:]) else k
+        if (
+            isinstance(v, BaseSignal)
+            and name not in ["signal", "image", "spectrum", "low_loss"]
+            and not name.startswith("_")
+        ):
+            names.append(name)
+    return names
+
+
+def _shared_input_layout(model, num_slots):
+    """The layout of the :class:`SharedArrays` used to send the data of the
+    pixels to the workers, with one slot per pixel."""
+    signals = {"signal.data": model.signal}
+    if model.signal.metadata.has_item("Signal.Noise_properties.variance"):
+        var = model.signal.metadata.Signal.Noise_properties.variance
+        if isinstance(var, BaseSignal):
+            signals["variance.data"] = var
+    if getattr(model, "low_loss", None) is not None:
+        signals["low_loss.data"] = model.low_loss
+    return {
+        key: ((num_slots,) + sig.axes_manager._signal_shape_in_array, sig.data.dtype)
+        for key, sig in signals.items()
+    }
+
+
+def _shared_result_layout(model, num_slots):
+    """The layout of the :class:`SharedArrays` used to send the results of
+    the fits back from the workers, with one slot per pixel.
+
+    The model must be the single pixel model of the workers.
+    """
+    layout = {
+        name + ".data": ((num_slots,), getattr(model, name).data.dtype)
+        for name in _result_signal_names(model)
+    }
+    for component in model:
+        for parameter in component.parameters:
+            layout[(component.name, parameter.name)] = (
+                (num_slots,) + parameter.map.shape,
+                parameter.map.dtype,
+            )
+    return layout
+
+
+def read_shared_result(shared_result, slot, component_names):
+    """Read the result of a fit from the slot of the shared result arrays,
+    in the format of the results returned by :meth:`Worker.send_results`.
+
+    Parameters
+    ----------
+    shared_result : :class:`~hyperspy.samfire_utils.shared_arrays.SharedArrays`
+        The shared result arrays.
+    slot : int
+        The slot that the result was written to.
+    component_names : list of str
+        The names of the (active) components of the result.
+    """
+    result = {"components": {name: {} for name in component_names}}
+    for key, array in shared_result.arrays.items():
+        if isinstance(key, tuple):
+            comp_name, par_name = key
+            if comp_name in result["components"]:
+                result["components"][comp_name][par_name] = np.array(array[slot])
+        else:
+            result[key] = np.array(array[slot])
+    return result
+
 
 class Worker:
     def __init__(
-        self, identity, individual_queue=None, shared_queue=None, result_queue=None
+        self,
+        identity,
+        individual_queue=None,
+        shared_queue=None,
+        result_queue=None,
+        connection=None,
     ):
         self.identity = identity
         self.individual_queue = individual_queue
         self.shared_queue = shared_queue
         self.result_queue = result_queue
+        self.connection = connection
+        self.shared_input = None
+        self.shared_result = None
+        self._batch = None
         self.timestep = 0.001
         self.max_get_timeout = 3
         self._AICc_fraction = 0.99
@@ -49,7 +139,26 @@ def __init__(
         self.model = None
         self.parameters = {}
 
-    def create_model(self, signal_dict, model_letter):
+    def create_model(self, signal_dict, model_letter, key=None):
+        """Create the model of the worker from the dictionary of its signal.
+
+        Parameters
+        ----------
+        signal_dict : dict
+            The dictionary of the signal, with the model stored in it.
+        model_letter : str
+            The name of the stored model.
+        key : None or str, default None
+            If given, identifies the model: a model already created with the
+            same key in this process (e.g. by the worker of a previous
+            SAMFire, when the processes are reused) is reused instead of
+            being created again.
+        """
+        if key is not None and key in _model_cache:
+            _logger.debug("Reusing model in worker {}".format(self.identity))
+            self.model = _model_cache[key]
+            self.parameters = dict.fromkeys(_result_signal_names(self.model))
+            return
         _logger.debug("Creating model in worker {}".format(self.identity))
         sig = BaseSignal(**signal_dict)
         sig._assign_subclass()
@@ -65,17 +174,46 @@ def create_model(self, signal_dict, model_letter):
             if isinstance(var, BaseSignal):
                 var.data = var.data.copy()
         self._array_views_to_copies()
+        if key is not None:
+            if len(_model_cache) >= _MODEL_CACHE_SIZE:
+                # forget the oldest model
+                del _model_cache[next(iter(_model_cache))]
+            _model_cache[key] = self.model
 
     def _array_views_to_copies(self):
         dct = self.model.__dict__
-        self.parameters = {}
         for k, v in dct.items():
             if isinstance(v, BaseSignal):
                 v.data = v.data.copy()
-                if k not in ["signal", "image", "spectrum"] and not k.startswith("_"):
-                    self.parameters[k] = None
             if isinstance(v, np.ndarray):
                 dct[k] = v.copy()
+        self.parameters = dict.fromkeys(_result_signal_names(self.model))
+
+    def attach_shared_arrays(self, input_spec, result_spec):
+        """Attach to the shared memory blocks used to receive the data of the
+        pixels and send back the results.
+
+        Parameters
+        ----------
+        input_spec, result_spec : tuple
+            The ``spec`` of the input and result
+            :class:`~hyperspy.samfire_utils.shared_arrays.SharedArrays`.
+        """
+        self.shared_input = SharedArrays(*input_spec)
+        self.shared_result = SharedArrays(*result_spec)
+
+    def _put(self, to_send):
+        """Send a message to the master, or return it if the worker is not
+        listening to a queue or connection."""
+        if self._batch is not None:
+            # sent with the other results of the job, see `run_pixels`
+            self._batch.append(to_send)
+        elif self.connection is not None:
+            self.connection.send(to_send)
+        elif self.result_queue is not None:
+            self.result_queue.put(to_send)
+        else:
+            return to_send
 
     def set_optional_names(self, optional_names):
         self.optional_names = optional_names
@@ -128,11 +266,7 @@ def set_values(self, name_list, iterator):
                                 ),
                             ),
                         )
-                        if self.result_queue is None:
-                            return to_send
-                        else:
-                            self.result_queue.put()
-                            return
+                        return self._put(to_send)
             yield
 
     def fit(self, component_comb):
@@ -162,10 +296,15 @@ def reset(self):
         self.best_values = []
         self.best_dof = np.inf
 
-    def run_pixel(self, ind, value_dict):
+    def run_pixel(self, ind, value_dict, slot=None):
         self.reset()
         self.ind = ind
         self.value_dict = value_dict
+        self.slot = slot
+        if slot is not None:
+            # the data of the pixel is in the shared memory
+            for key, array in self.shared_input.arrays.items():
+                self.value_dict[key] = array[slot]
 
         self.fitting_kwargs = self.value_dict.pop("fitting_kwargs", {})
         if "min_function" in self.fitting_kwargs:
@@ -198,6 +337,32 @@ def run_pixel(self, ind, value_dict):
                     self.compare_models()
         return self.send_results()
 
+    def run_pixels(self, inds, value_dicts, slots=None):
+        """Run several pixels and send back all the results in one message,
+        together with the time it took.
+
+        Parameters
+        ----------
+        inds : tuple of tuple
+            The indices of the pixels.
+        value_dicts : tuple of dict
+            The starting values of each pixel, see :meth:`run_pixel`.
+        slots : None or tuple of int
+            The slots of the shared arrays used by each pixel.
+        """
+        if slots is None:
+            slots = (None,) * len(inds)
+        start = time.perf_counter()
+        self._batch = []
+        try:
+            for ind, value_dict, slot in zip(inds, value_dicts, slots):
+                self.run_pixel(ind, value_dict, slot)
+            batch = self._batch
+        finally:
+            self._batch = None
+        duration = time.perf_counter() - start
+        return self._put(("batch", (self.identity, batch, duration)))
+
     def _collect_values(self):
         result = {
             component.name: {
@@ -241,10 +406,24 @@ def send_results(self, current=False):
             )
             result = None
             found_solution = False
-        to_send = ("result", (self.identity, self.ind, result, found_solution))
-        if self.individual_queue is None:
-            return to_send
-        self.result_queue.put(to_send)
+        if getattr(self, "slot", None) is not None:
+            # write the result in the shared memory, only send its location
+            component_names = []
+            if result is not None:
+                arrays = self.shared_result.arrays
+                for k, v in self.parameters.items():
+                    arrays[k + ".data"][self.slot] = v
+                for comp_name, comp in self.best_values.items():
+                    component_names.append(comp_name)
+                    for par_name, par_map in comp.items():
+                        arrays[(comp_name, par_name)][self.slot] = par_map
+            to_send = (
+                "shared_result",
+                (self.identity, self.ind, self.slot, component_names, found_solution),
+            )
+        else:
+            to_send = ("result", (self.identity, self.ind, result, found_solution))
+        return self._put(to_send)
 
     def setup_test(self, test_string):
         self.fit_test = cloudpickle.loads(test_string)
@@ -265,9 +444,7 @@ def parse(self, result):
 
     def ping(self, message=None):
         to_send = ("pong", (self.identity, os.getpid(), time.time(), message))
-        if self.result_queue is None:
-            return to_send
-        self.result_queue.put(to_send)
+        return self._put(to_send)
 
     def sleep(self, howlong=None):
         if howlong is None:
@@ -279,6 +456,11 @@ def change_timestep(self, value):
         self.timestep = value
 
     def listen(self):
+        if self.connection is not None:
+            while self._listening:
+                if self.connection.poll(self.max_get_timeout):
+                    self.parse(self.connection.recv())
+            return
         while self._listening:
             queue = None
             found_what_to_do = False
@@ -302,10 +484,17 @@ def listen(self):
 
 
 def create_worker(
-    identity, individual_queue=None, shared_queue=None, result_queue=None
+    identity,
+    individual_queue=None,
+    shared_queue=None,
+    result_queue=None,
+    connection=None,
 ):
-    w = Worker(identity, individual_queue, shared_queue, result_queue)
-    if individual_queue is None:
+    w = Worker(identity, individual_queue, shared_queue, result_queue, connection)
+    if individual_queue is None and connection is None:
         return w
     w.start_listening()
+    if w.shared_input is not None:
+        w.shared_input.close()
+        w.shared_result.close()
     return 1
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2024 The HyperSpy developers
+#
+# This file is part of HyperSpy.
+#
+# HyperSpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# HyperSpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+# alignment (in bytes) of the start of each array in the shared memory block
+_ALIGNMENT = 64
+
+
+def _get_offsets(layout):
+    offsets = {}
+    size = 0
+    for key, (shape, dtype) in layout.items():
+        offsets[key] = size
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        size += -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+    return offsets, size
+
+
+class SharedArrays:
+    """A group of numpy arrays backed by a single block of shared memory.
+
+    The block is created by one process, and attached to by any other process
+    using :attr:`spec`, so that the arrays can be exchanged between processes
+    without pickling them.
+
+    Attributes
+    ----------
+    arrays : dict
+        The numpy arrays, backed by the shared memory block.
+    layout : dict
+        The ``(shape, dtype)`` of each array.
+    """
+
+    def __init__(self, layout, name=None):
+        """Create a new block of shared memory or attach to an existing one.
+
+        Parameters
+        ----------
+        layout : dict
+            The ``(shape, dtype)`` of each array, keyed by array name.
+        name : None or str, default None
+            The name of the shared memory block to attach to. If None, a new
+            block is created.
+        """
+        self.layout = dict(layout)
+        offsets, size = _get_offsets(self.layout)
+        self._owner = name is None
+        self._shm = SharedMemory(name=name, create=self._owner, size=max(size, 1))
+        self.arrays = {
+            key: np.ndarray(
+                shape, dtype=dtype, buffer=self._shm.buf, offset=offsets[key]
+            )
+            for key, (shape, dtype) in self.layout.items()
+        }
+
+    @property
+    def spec(self):
+        """The (picklable) arguments to attach to the shared memory block from
+        another process with ``SharedArrays(*spec)``."""
+        return self.layout, self._shm.name
+
+    def close(self):
+        """Release the arrays and close the access to the shared memory block.
+        The block itself is freed when the process that created it closes it.
+        """
+        if self._shm is None:
+            return
+        self.arrays = {}
+        try:
+            self._shm.close()
+        except BufferError:
+            # some views of the arrays are still referenced; the memory is
+            # released when they are garbage collected
+            pass
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
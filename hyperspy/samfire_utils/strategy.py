@@ -17,6 +17,7 @@
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import numpy as np
+from scipy import ndimage
 
 
 def make_sure_ind(inds, req_len=None):
@@ -86,6 +87,14 @@ def nearest_indices(shape, ind, radii):
     return par, center
 
 
+def _invalidate_pixel_queue(samf):
+    """Marks the pixel queue of the SAMFire (if any) to be rebuilt after the
+    marker was changed as a whole."""
+    queue = getattr(samf, "_pixel_queue", None)
+    if queue is not None:
+        queue.invalidate()
+
+
 class SamfireStrategy:
     """A SAMFire strategy base class."""
 
@@ -111,6 +120,21 @@ def update(self, ind, isgood):
     def __repr__(self):
         return self.name
 
+    def batch_values(self, inds):
+        """Returns the current starting value estimates for several pixels.
+
+        Parameters
+        ----------
+        inds : list of tuple
+            the indices of the pixels of interest.
+
+        Returns
+        -------
+        list of dict
+            The estimates of each pixel, as returned by ``values``.
+        """
+        return [self.values(ind) for ind in inds]
+
     def remove(self):
         """Removes this strategy from its SAMFire"""
         self.samf.strategies.remove(self)
@@ -219,40 +243,69 @@ def refresh(self, overwrite, given_pixels=None):
                     todo_pixels, np.logical_xor(marker == -scale, calc_pixels)
                 )
 
-        done_number = np.sum(calc_pixels)
-        todo_number = np.sum(todo_pixels)
-
         marker[todo_pixels] = 0.0
         marker[calc_pixels] = -scale
 
         weights_all = self.decay_function(self.weight.map(calc_pixels))
 
-        if done_number <= todo_number:
-            # most efficient to propagate FROM fitted pixels
-            ind_list = np.where(calc_pixels)
-            for iindex in range(ind_list[0].size):
-                ind = [one_list[iindex] for one_list in ind_list]
-
-                distances, slices, _, mask = self._get_distance_array(shape, ind)
+        # The marker of each pixel to do is the sum of the weights of the
+        # calculated pixels within the radii, decaying with the distance,
+        # i.e. the correlation of the weights with the distance kernel.
+        # Pixels out of the map don't contribute.
+        weights_all = np.where(calc_pixels, weights_all, 0.0)
+        propagated = ndimage.correlate(
+            weights_all, self._get_kernel(len(shape)), mode="constant", cval=0.0
+        )
+        marker[todo_pixels] = propagated[todo_pixels]
+        _invalidate_pixel_queue(self.samf)
+
+    def _update_distances(self, ndim):
+        """Calculates (if required) the distances from the centre of a box
+        enclosing the radii and their normalisation by the radii (> 1 is
+        outside the radii).
 
-                mask = np.logical_and(mask, todo_pixels[slices])
-
-                weight = weights_all[tuple(ind)]
-                distance_f = self.decay_function(distances)
-                marker[slices][mask] += weight * distance_f[mask]
-        else:
-            # most efficient to propagate TO unknown pixels
-            ind_list = np.where(todo_pixels)
-            for iindex in range(ind_list[0].size):
-                ind = [one_list[iindex] for one_list in ind_list]
+        Parameters
+        ----------
+        ndim : int
+            the number of dimensions of the marker
 
-                distances, slices, centre, mask = self._get_distance_array(shape, ind)
+        Returns
+        -------
+        radii : tuple of floats
+            the radii in all dimensions
+        """
+        radii = make_sure_ind(self.radii, ndim)
+        # This should be unnecessary.......................
+        if self._untruncated is not None and self._untruncated.ndim != ndim:
+            self._untruncated = None
+            self._mask_all = None
+        if self._radii_changed or self._untruncated is None or self._mask_all is None:
+            par = []
+            for radius in radii:
+                radius_top = np.ceil(radius)
+                par.append(abs(np.arange(-radius_top, radius_top + 1)))
+            meshg = np.array(np.meshgrid(*par, indexing="ij"))
+            self._untruncated = np.sqrt(np.sum(meshg**2.0, axis=0))
+            distance_mask = np.array([c / float(radii[i]) for i, c in enumerate(meshg)])
+            self._mask_all = np.sum(distance_mask**2.0, axis=0)
+            self._radii_changed = False
+        return radii
 
-                mask = np.logical_and(mask, calc_pixels[slices])
+    def _get_kernel(self, ndim):
+        """Returns the decay of the weights with the distance from the centre
+        pixel, within the radii. The centre pixel itself has zero weight.
 
-                weight = weights_all[slices]
-                distance_f = self.decay_function(distances)
-                marker[tuple(ind)] = np.sum(weight[mask] * distance_f[mask])
+        Parameters
+        ----------
+        ndim : int
+            the number of dimensions of the marker
+        """
+        self._update_distances(ndim)
+        inside = self._mask_all <= 1.0
+        kernel = np.zeros(self._untruncated.shape)
+        kernel[inside] = self.decay_function(self._untruncated[inside])
+        kernel[tuple(size // 2 for size in kernel.shape)] = 0.0
+        return kernel
 
     def _get_distance_array(self, shape, ind):
         """Calculatex the array of distances (withing radii) from the given
@@ -277,21 +330,7 @@ def _get_distance_array(self, shape, ind):
         mask : numpy.ndarray of bool
             a binary mask for the values to consider
         """
-        radii = make_sure_ind(self.radii, len(ind))
-        # This should be unnecessary.......................
-        if self._untruncated is not None and self._untruncated.ndim != len(ind):
-            self._untruncated = None
-            self._mask_all = None
-        if self._radii_changed or self._untruncated is None or self._mask_all is None:
-            par = []
-            for radius in radii:
-                radius_top = np.ceil(radius)
-                par.append(abs(np.arange(-radius_top, radius_top + 1)))
-            meshg = np.array(np.meshgrid(*par, indexing="ij"))
-            self._untruncated = np.sqrt(np.sum(meshg**2.0, axis=0))
-            distance_mask = np.array([c / float(radii[i]) for i, c in enumerate(meshg)])
-            self._mask_all = np.sum(distance_mask**2.0, axis=0)
-            self._radii_changed = False
+        radii = self._update_distances(len(ind))
 
         slices_return, centre = nearest_indices(shape, ind, np.ceil(radii))
 
@@ -329,6 +368,10 @@ def _update_marker(self, ind):
         weight = self.decay_function(self.weight.function(ind))
         distance_f = self.decay_function(distances)
         marker[slices][mask] += weight * distance_f[mask]
+        queue = getattr(self.samf, "_pixel_queue", None)
+        if queue is not None:
+            updated = [i + sl.start for i, sl in zip(np.nonzero(mask), slices)]
+            queue.push(np.ravel_multi_index(updated, shape))
 
         scale = self.samf._scale
         for i in self.samf.running_pixels:
@@ -353,35 +396,79 @@ def values(self, ind):
             for active components and free parameters.
 
         """
+        return self.batch_values([ind])[0]
+
+    def batch_values(self, inds):
+        """Returns the current starting value estimates for several pixels at
+        once. Calculated as the weighted local average, gathering the
+        neighbourhoods of all the pixels from the parameter maps in a single
+        operation.
+
+        Parameters
+        ----------
+        inds : list of tuple
+            the indices of the pixels of interest.
+
+        Returns
+        -------
+        list of dict
+            The estimates of each pixel, as returned by :meth:`values`.
+        """
         marker = self.samf.metadata.marker
         shape = marker.shape
         model = self.samf.model
-
-        distances, slices, _, mask_dist = self._get_distance_array(shape, ind)
+        ans = [{} for _ in inds]
+        if not len(inds):
+            return ans
+
+        self._update_distances(len(shape))
+        centre = tuple(size // 2 for size in self._mask_all.shape)
+        inside = self._mask_all <= 1.0
+        # don't use the pixel itself
+        inside[centre] = False
+        offsets = np.argwhere(inside) - np.array(centre)
+        distance_f = self.decay_function(self._untruncated[inside])
+
+        # the neighbours of each pixel, shape (pixels, neighbours, ndim)
+        positions = np.array(inds, dtype=int)[:, np.newaxis] + offsets
+        in_map = np.all((positions >= 0) & (positions < shape), axis=-1)
+        positions = np.clip(positions, 0, np.array(shape) - 1)
+        flat = np.ravel_multi_index(tuple(np.moveaxis(positions, -1, 0)), shape)
 
         # only use pixels that are calculated and "active"
-        mask_dist_calc = np.logical_and(mask_dist, marker[slices] == -self.samf._scale)
+        calc_pixels = marker == -self.samf._scale
+        use = np.logical_and(in_map, calc_pixels.ravel()[flat])
+        if not use.any():
+            return ans
+        weights_all = self.decay_function(self.weight.map(calc_pixels)).ravel()
+        weights = np.where(use, distance_f * weights_all[flat], 0.0)
 
-        distance_f = self.decay_function(distances)
-        weights_values = self.decay_function(self.weight.map(mask_dist_calc, slices))
-        ans = {}
         for component in model:
             if component.active_is_multidimensional:
-                mask = np.logical_and(component._active_array[slices], mask_dist_calc)
+                mask = np.logical_and(use, component._active_array.ravel()[flat])
             else:
                 if component.active:
-                    mask = mask_dist_calc
+                    mask = use
                 else:  # not multidim and not active, skip
                     continue
-            comp_dict = {}
-            weight = distance_f[mask] * weights_values[mask]
-            if weight.size:  # should never happen that np.sum(weight) == 0
-                for par in component.parameters:
-                    if par.free:
-                        comp_dict[par.name] = np.average(
-                            par.map[slices][mask]["values"], weights=weight, axis=0
+            has_values = mask.any(axis=1)
+            if not has_values.any():
+                continue
+            weight = np.where(mask, weights, 0.0)
+            # should never happen that the sum of weights is 0
+            total = weight.sum(axis=1)[:, np.newaxis]
+            comp_dicts = [{} for _ in inds]
+            for par in component.parameters:
+                if par.free:
+                    par_values = par.map["values"].reshape(marker.size, -1)[flat]
+                    par_values = np.where(mask[..., np.newaxis], par_values, 0.0)
+                    average = np.einsum("ij,ijk->ik", weight, par_values) / total
+                    for comp_dict, value in zip(comp_dicts, average):
+                        comp_dict[par.name] = (
+                            value[0] if par._number_of_elements == 1 else value
                         )
-                ans[component.name] = comp_dict
+            for i in np.flatnonzero(has_values):
+                ans[i][component.name] = comp_dicts[i]
         return ans
 
     def plot(self, fig=None):
@@ -450,6 +537,7 @@ def refresh(self, overwrite, given_pixels=None):
             if given_pixels is not None:
                 good_pixels = np.logical_and(good_pixels, given_pixels)
         self.samf.metadata.marker[~good_pixels] = scale
+        _invalidate_pixel_queue(self.samf)
         self._update_database(None, 0)  # to force to update
 
     def _update_marker(self, ind):
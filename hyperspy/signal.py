@@ -28,6 +28,7 @@
 from itertools import product
 from pathlib import Path
 
+import dask
 import dask.array as da
 import numpy as np
 import traits.api as t
@@ -43,6 +44,7 @@
 
 from hyperspy.api import _ureg
 from hyperspy.axes import AxesManager, create_axis
+from hyperspy.defaults_parser import preferences
 from hyperspy.docstrings.plot import (
     BASE_PLOT_DOCSTRING,
     BASE_PLOT_DOCSTRING_PARAMETERS,
@@ -90,11 +92,15 @@
     _get_block_pattern,
     add_scalar_axis,
     dummy_context_manager,
+    get_batch,
     guess_output_signal_size,
     is_cupy_array,
     isiterable,
     iterable_not_string,
+    output_signature_cache,
     process_function_blockwise,
+    process_function_threaded,
+    replace_first_navigation_block,
     rollelem,
     slugify,
     to_numpy,
@@ -2994,12 +3000,14 @@ def _get_undefined_axes_list(self, ragged=False):
             axes = []
         return axes
 
-    def _get_current_data(self, axes_manager=None, fft_shift=False, as_numpy=False):
+    def _get_current_data(
+        self, axes_manager=None, fft_shift=False, as_numpy=False, prefetch=False
+    ):
         if axes_manager is None:
             axes_manager = self.axes_manager
         indices = axes_manager._getitem_tuple
         if self._lazy:
-            value = self._get_cache_dask_chunk(indices)
+            value = self._get_cache_dask_chunk(indices, prefetch=prefetch)
         else:
             value = self.data.__getitem__(indices)
         if as_numpy:
@@ -3063,6 +3071,9 @@ def plot(self, navigator="auto", axes_manager=None, plot_markers=True, **kwargs)
 
         self._plot.axes_manager = axes_manager
         self._plot.signal_data_function = partial(self._get_current_data, as_numpy=True)
+        self._plot.asynchronous_signal_data = (
+            self._lazy and preferences.Plot.lazy_asynchronous_data
+        )
 
         if self.metadata.has_item("Signal.quantity"):
             self._plot.quantity_label = self.metadata.Signal.quantity
@@ -5241,6 +5252,8 @@ def map(
         output_dtype=None,
         lazy_output=None,
         silence_warnings=False,
+        vectorized=False,
+        cache_output_signature=False,
         **kwargs,
     ):
         """Apply a function to the signal data at all the navigation
@@ -5273,7 +5286,11 @@ def map(
         %s
         inplace : bool, default True
             If ``True``, the data is replaced by the result. Otherwise
-            a new Signal with the results is returned.
+            a new Signal with the results is returned. For in-memory data,
+            when the shape and dtype of the result are the same as those of
+            the data, the results are written directly in the data array:
+            if ``function`` raises an error, the data is then left partially
+            processed.
         ragged : None or bool, default None
             Indicates if the results for each navigation pixel are of identical
             shape (and/or numpy arrays to begin with). If ``None``,
@@ -5287,7 +5304,11 @@ def map(
             Since the size and dtype of the signal dimension of the output
             signal can be different from the input signal, this output signal
             size must be calculated somehow. If both ``output_signal_size``
-            and ``output_dtype`` is ``None``, this is automatically determined.
+            and ``output_dtype`` is ``None``, this is automatically determined
+            by applying the function to the first navigation pixel. The result
+            is cached for the function, the shape and dtype of the signal and
+            the values of the keyword arguments at this pixel, so that it is
+            not determined again when calling ``map`` with the same inputs.
             However, if for some reason this is not working correctly, this
             can be specified via ``output_signal_size`` and ``output_dtype``.
             The most common reason for this failing is due to the signal size
@@ -5305,6 +5326,25 @@ def map(
             units of the signal axes, respectively.
             If ``False``, all warnings will be added to the logger.
             Default is ``False``.
+        vectorized : bool, default False
+            If ``True``, the function is applied to a batch of signals at
+            once instead of each signal separately: it receives an array of
+            shape ``(n, *signal_shape)``, the iterating keyword arguments as
+            arrays of shape ``(n, *argument_signal_shape)`` (with the
+            singleton dimensions removed) and must return an array of shape
+            ``(n, *output_signal_shape)``, or a sequence of ``n`` objects if
+            ``ragged=True``. The batches are the chunks of the navigation
+            space, whose size depends on ``navigation_chunks`` and
+            ``num_workers``. This avoids calling the function at each
+            navigation coordinate, for functions which are vectorized with
+            numpy or numba for example.
+        cache_output_signature : bool, default False
+            If ``True``, the output signal size and dtype guessed by calling
+            the function at the first navigation coordinate are cached and
+            reused by the next calls to ``map`` with the same function, signal
+            shape and dtype and keyword arguments, which avoids the test call.
+            Only use it if the output of the function doesn't depend on
+            anything else, e.g. global variables.
         **kwargs : dict
             All extra keyword arguments are passed to the provided function
 
@@ -5374,6 +5414,16 @@ def map(
         ... )
         >>> s.compute()
 
+        Normalise all the spectra with a function operating on a batch of
+        spectra, which is called once per chunk of the navigation space
+        instead of once per spectrum:
+
+        >>> s = hs.signals.Signal1D(np.random.random((10, 20, 100)))
+        >>> s.map(
+        ...    lambda spectra: spectra / spectra.sum(axis=-1, keepdims=True),
+        ...    vectorized=True,
+        ... )
+
         """
         if lazy_output is None:
             lazy_output = self._lazy
@@ -5472,7 +5522,8 @@ def _silence_warnings(silence_warnings, key):
         # iterate over the coordinates.
         # We use _map_all only when the user doesn't specify axis/axes
         if (
-            not ndkwargs
+            not vectorized
+            and not ndkwargs
             and not lazy_output
             and self.axes_manager.signal_dimension == 1
             and "axis" in fargs
@@ -5481,7 +5532,8 @@ def _silence_warnings(silence_warnings, key):
             kwargs["axis"] = self.axes_manager.signal_axes[-1].index_in_array
             result = self._map_all(function, inplace=inplace, **kwargs)
         elif (
-            not ndkwargs
+            not vectorized
+            and not ndkwargs
             and not lazy_output
             and "axes" in fargs
             and "axes" not in kwargs.keys()
@@ -5507,6 +5559,8 @@ def _silence_warnings(silence_warnings, key):
                 output_dtype=output_dtype,
                 output_signal_size=output_signal_size,
                 navigation_chunks=navigation_chunks,
+                vectorized=vectorized,
+                cache_output_signature=cache_output_signature,
                 **kwargs,  # function argument(s) (non-iterating)
             )
         if not inplace:
@@ -5551,39 +5605,63 @@ def _map_iterate(
         lazy_output=None,
         num_workers=None,
         navigation_chunks="auto",
+        vectorized=False,
+        cache_output_signature=False,
         **kwargs,
     ):
         if lazy_output is None:
             lazy_output = self._lazy
 
-        if not self._lazy:
-            s_input = self.as_lazy()
-            s_input.rechunk(nav_chunks=navigation_chunks)
-        else:
-            s_input = self
-
         # unpacking keyword arguments
         if iterating_kwargs is None:
             iterating_kwargs = {}
         elif isinstance(iterating_kwargs, (tuple, list)):
             iterating_kwargs = dict((k, v) for k, v in iterating_kwargs)
 
-        nav_indexes = s_input.axes_manager.navigation_indices_in_array
-        chunk_span = np.equal(s_input.data.chunksize, s_input.data.shape)
-        chunk_span = [
-            chunk_span[i] for i in s_input.axes_manager.signal_indices_in_array
-        ]
-
-        if not all(chunk_span):
-            _logger.info(
-                "The chunk size needs to span the full signal size, rechunking..."
+        if (
+            not lazy_output
+            and navigation_chunks is None
+            and self._can_map_in_memory(iterating_kwargs)
+        ):
+            return self._map_iterate_in_memory(
+                function,
+                iterating_kwargs=iterating_kwargs,
+                show_progressbar=show_progressbar,
+                ragged=ragged,
+                inplace=inplace,
+                output_signal_size=output_signal_size,
+                output_dtype=output_dtype,
+                num_workers=num_workers,
+                vectorized=vectorized,
+                cache_output_signature=cache_output_signature,
+                **kwargs,
             )
 
-            old_sig = s_input.rechunk(inplace=False, nav_chunks=None)
+        if not self._lazy:
+            s_input = self.as_lazy()
+            s_input.rechunk(nav_chunks=navigation_chunks)
         else:
-            old_sig = s_input
+            s_input = self
+
+        nav_indexes = s_input.axes_manager.navigation_indices_in_array
+        # The blocks of the signal axes split in several chunks are
+        # concatenated by `da.blockwise` for each navigation chunk, which
+        # avoids rechunking the data
+        concatenate_axes = tuple(
+            i
+            for i in s_input.axes_manager.signal_indices_in_array
+            if s_input.data.numblocks[i] > 1
+        )
+        if concatenate_axes:
+            _logger.info(
+                "The signal axes are split in several chunks, which are "
+                "concatenated for each navigation chunk."
+            )
+        old_sig = s_input
+        old_data = old_sig.data
 
         os_am = old_sig.axes_manager
+        nav_dim = len(os_am.navigation_axes)
 
         autodetermine = (
             output_signal_size is None or output_dtype is None
@@ -5599,27 +5677,63 @@ def _map_iterate(
         if autodetermine:  # trying to guess the output d-type and size from one signal
             testing_kwargs = {}
             for ikey, key in enumerate(arg_keys):
-                test_ind = (0,) * len(os_am.navigation_axes)
-                # For discussion on if squeeze is necessary, see
-                # https://github.com/hyperspy/hyperspy/pull/2981
-                testing_kwargs[key] = np.squeeze(args[ikey][test_ind].compute())[()]
+                if vectorized:
+                    test_batch = args[ikey][(slice(0, 1),) * nav_dim].compute()
+                    testing_kwargs[key] = get_batch(test_batch, nav_dim)
+                else:
+                    test_ind = (0,) * nav_dim
+                    # For discussion on if squeeze is necessary, see
+                    # https://github.com/hyperspy/hyperspy/pull/2981
+                    testing_kwargs[key] = np.squeeze(args[ikey][test_ind].compute())[()]
             testing_kwargs = {**kwargs, **testing_kwargs}
-            test_data = np.array(
-                old_sig.inav[(0,) * len(os_am.navigation_shape)].data.compute()
-            )
-            temp_output_signal_size, temp_output_dtype = guess_output_signal_size(
-                test_data=test_data,
-                function=function,
-                ragged=ragged,
-                **testing_kwargs,
-            )
+            signature_key = None
+            if cache_output_signature and not ragged:
+                signature_key = output_signature_cache.get_key(
+                    old_data.shape[nav_dim:],
+                    old_data.dtype,
+                    vectorized,
+                    **testing_kwargs,
+                )
+            signature = output_signature_cache.get(function, signature_key)
+            if signature is None:
+                if ragged:
+                    # the function doesn't need to be called
+                    test_data = None
+                elif self._lazy and not lazy_output:
+                    # Load the whole first navigation chunk, which is reused
+                    # when computing the result, instead of loading the first
+                    # pixel, which may require to read the same chunk twice
+                    first_block = np.asarray(
+                        old_data.blocks[(0,) * nav_dim].compute()
+                        if nav_dim
+                        else old_data.compute()
+                    )
+                    old_data = replace_first_navigation_block(
+                        old_data, nav_dim, first_block
+                    )
+                    test_data = first_block[(0,) * nav_dim]
+                else:
+                    test_data = np.array(
+                        old_sig.inav[(0,) * len(os_am.navigation_shape)].data.compute()
+                    )
+                if vectorized and test_data is not None:
+                    test_data = test_data[np.newaxis]
+                signature = guess_output_signal_size(
+                    test_data=test_data,
+                    function=function,
+                    ragged=ragged,
+                    vectorized=vectorized,
+                    **testing_kwargs,
+                )
+                output_signature_cache.set(function, signature_key, signature)
+            temp_output_signal_size, temp_output_dtype = signature
             if output_signal_size is None:
                 output_signal_size = temp_output_signal_size
             if output_dtype is None:
                 output_dtype = temp_output_dtype
         output_shape = self.axes_manager._navigation_shape_in_array + output_signal_size
         arg_pairs, adjust_chunks, new_axis, output_pattern = _get_block_pattern(
-            (old_sig.data,) + args, output_shape
+            (old_data,) + args, output_shape, concatenate_axes=concatenate_axes
         )
 
         axes_changed = len(new_axis) != 0 or len(adjust_chunks) != 0
@@ -5638,6 +5752,7 @@ def _map_iterate(
             output_dtype=output_dtype,
             nav_indexes=nav_indexes,
             output_signal_size=output_signal_size,
+            vectorized=vectorized,
             **kwargs,
         )
 
@@ -5696,6 +5811,141 @@ def _map_iterate(
 
         return sig
 
+    def _can_map_in_memory(self, iterating_kwargs):
+        """Whether :meth:`_map_iterate_in_memory` can be used, i.e. if the
+        data of the signal and of the iterating kwargs are numpy arrays with
+        the navigation axes first, and dask is not configured to use another
+        scheduler than threads."""
+        scheduler = dask.config.get("scheduler", None)
+        if scheduler not in (None, "threads", "threading"):
+            return False
+        for sig in (self,) + tuple(iterating_kwargs.values()):
+            if sig._lazy or not isinstance(sig.data, np.ndarray):
+                return False
+            nav_indices = sig.axes_manager.navigation_indices_in_array
+            if sorted(nav_indices) != list(range(len(nav_indices))):
+                return False
+        return True
+
+    def _map_iterate_in_memory(
+        self,
+        function,
+        iterating_kwargs,
+        show_progressbar=None,
+        ragged=False,
+        inplace=True,
+        output_signal_size=None,
+        output_dtype=None,
+        num_workers=None,
+        vectorized=False,
+        cache_output_signature=False,
+        **kwargs,
+    ):
+        """Same as :meth:`_map_iterate` for non-lazy data and output, without
+        building a dask graph: the navigation indices are split in blocks
+        processed by a pool of threads, which write the results directly in
+        the output array."""
+        nav_dim = self.axes_manager.navigation_dimension
+        nav_shape = self.axes_manager._navigation_shape_in_array
+        arg_keys = tuple(iterating_kwargs.keys())
+        args = tuple(iterating_kwargs[key].data for key in arg_keys)
+
+        if output_signal_size is None or output_dtype is None:
+            # guess the output dtype and size from the first pixel
+            if vectorized:
+                test_ind = (slice(0, 1),) * nav_dim
+                testing_kwargs = {
+                    key: get_batch(arg[test_ind], nav_dim)
+                    for key, arg in zip(arg_keys, args)
+                }
+                test_data = self.data[test_ind].reshape(
+                    (1,) + self.data.shape[nav_dim:]
+                )
+            else:
+                test_ind = (0,) * nav_dim
+                testing_kwargs = {
+                    key: np.squeeze(arg[test_ind])[()]
+                    for key, arg in zip(arg_keys, args)
+                }
+                test_data = np.array(self.data[test_ind])
+            testing_kwargs = {**kwargs, **testing_kwargs}
+            signature_key = None
+            if cache_output_signature and not ragged:
+                signature_key = output_signature_cache.get_key(
+                    self.data.shape[nav_dim:],
+                    self.data.dtype,
+                    vectorized,
+                    **testing_kwargs,
+                )
+            signature = output_signature_cache.get(function, signature_key)
+            if signature is None:
+                signature = guess_output_signal_size(
+                    test_data=test_data,
+                    function=function,
+                    ragged=ragged,
+                    vectorized=vectorized,
+                    **testing_kwargs,
+                )
+                output_signature_cache.set(function, signature_key, signature)
+            temp_output_signal_size, temp_output_dtype = signature
+            if output_signal_size is None:
+                output_signal_size = temp_output_signal_size
+            if output_dtype is None:
+                output_dtype = temp_output_dtype
+        output_signal_size = tuple(output_signal_size)
+        output_shape = nav_shape + output_signal_size
+        axes_changed = output_shape != self.data.shape
+
+        if (
+            inplace
+            and output_shape == self.data.shape
+            and output_dtype == self.data.dtype
+            # the results are written in a flattened view of the data
+            and self.data.flags.c_contiguous
+            and not any(
+                isinstance(value, np.ndarray) and np.may_share_memory(value, self.data)
+                for value in kwargs.values()
+            )
+        ):
+            # write the results in the existing array
+            output = self.data
+        else:
+            output = np.empty(output_shape, dtype=output_dtype)
+        process_function_threaded(
+            self.data,
+            *args,
+            function=function,
+            output=output,
+            nav_dimension=nav_dim,
+            arg_keys=arg_keys,
+            num_workers=num_workers,
+            show_progressbar=show_progressbar,
+            vectorized=vectorized,
+            **kwargs,
+        )
+
+        if inplace:
+            self.data = output
+            sig = self
+        else:
+            sig = self._deepcopy_with_new_data(output)
+        am = sig.axes_manager
+        if ragged:
+            axes_dicts = self.axes_manager._get_navigation_axes_dicts()
+            sig.axes_manager.__init__(axes_dicts)
+            sig.axes_manager._ragged = True
+        else:
+            if axes_changed:
+                am.remove(am.signal_axes[len(output_signal_size) :])
+                for ind in range(len(output_signal_size) - am.signal_dimension, 0, -1):
+                    am._append_axis(size=output_signal_size[-ind], navigate=False)
+            sig.axes_manager._ragged = False
+            if output_signal_size == () and am.navigation_dimension == 0:
+                add_scalar_axis(sig)
+            sig.get_dimensions_from_data()
+        sig._assign_subclass()
+        return sig
+
     def _get_iterating_kwargs(self, iterating_kwargs):
         nav_chunks = self.get_chunk_size(self.axes_manager.navigation_axes)
         args, arg_keys = (), ()
@@ -36,6 +36,7 @@
 from hyperspy.drawing._widgets.range import SpanSelector
 from hyperspy.drawing.markers import convert_positions
 from hyperspy.drawing.signal1d import Signal1DFigure
+from hyperspy.drawing.utils import sample_data
 from hyperspy.drawing.widgets import Line2DWidget, VerticalLineWidget
 from hyperspy.exceptions import SignalDimensionError
 from hyperspy.misc.array_tools import numba_histogram
@@ -921,7 +922,7 @@ def _update_image_contrast(self, *args, **kwargs):
         self._reset(auto=False, indices_changed=False, update_histogram=False)
 
     def _get_data(self):
-        return self.image._current_data
+        return sample_data(self.image._current_data, self.image.contrast_max_samples)
 
     def _get_histogram(self, data):
         return numba_histogram(data, bins=self.bins, ranges=(self._vmin, self._vmax))
@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+from unittest import mock
+
 import numpy as np
 import pytest
 from matplotlib.backend_bases import CloseEvent
@@ -118,3 +120,65 @@ def test_remove_markers():
     s._plot.signal_plot.remove_markers()
     assert len(s._plot.signal_plot.ax_markers) == 0
     assert m._collection is None  # Check that the collection is set to None
+
+
+class FakeTimer:
+    def __init__(self):
+        self.callbacks = []
+        self.started = False
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.started = False
+
+    def fire(self):
+        self.started = False
+        for callback in self.callbacks:
+            callback()
+
+
+class TestRenderFigure:
+    def setup_method(self, method):
+        s = Signal2D(np.arange(3 * 10 * 10).reshape((3, 10, 10)))
+        s.add_marker(Points(offsets=[[1, 1]]))
+        self.s = s
+        self.fig = s._plot.signal_plot
+
+    def test_render_non_interactive(self):
+        fig = self.fig
+        fig.renders_requested = fig.renders_performed = 0
+        self.s.axes_manager.indices = (1,)
+        assert fig.renders_requested > 0
+        assert fig.renders_performed == fig.renders_requested
+
+    def test_render_coalesced(self):
+        fig = self.fig
+        timer = FakeTimer()
+        fig.figure.canvas.new_timer = mock.Mock(return_value=timer)
+        fig.renders_requested = fig.renders_performed = 0
+        with mock.patch(
+            "hyperspy.drawing.figure.supports_timers", return_value=True
+        ), mock.patch.object(fig, "_update_animated") as update_animated:
+            fig._background = object()
+            fig.render_figure()
+            fig.render_figure()
+            self.s.axes_manager.indices = (2,)
+            assert fig.renders_requested > 2
+            assert fig.renders_performed == 0
+            assert timer.started
+            timer.fire()
+            assert fig.renders_performed == 1
+            update_animated.assert_called_once()
+            # nothing pending
+            timer.fire()
+            assert fig.renders_performed == 1
+            fig.render_figure()
+            assert timer.started
+            fig.close()
+            timer.fire()
+            assert fig.renders_performed == 1
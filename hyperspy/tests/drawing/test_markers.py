@@ -34,7 +34,7 @@
 import hyperspy.api as hs
 from hyperspy._signals.signal2d import BaseSignal, Signal1D, Signal2D
 from hyperspy.axes import UniformDataAxis
-from hyperspy.drawing.markers import markers_dict_to_markers
+from hyperspy.drawing.markers import _RaggedIndex, markers_dict_to_markers
 from hyperspy.external.matplotlib.collections import (
     CircleCollection,
     EllipseCollection,
@@ -1240,3 +1240,91 @@ def test_position_texts_with_mathtext():
     s.add_marker([point_marker, text_marker])
 
     return s._plot.signal_plot.figure
+
+
+class TestRaggedMarkers:
+    @pytest.fixture
+    def offsets(self):
+        rng = np.random.default_rng(0)
+        offsets = np.empty((4, 3), dtype=object)
+        for i in np.ndindex(offsets.shape):
+            offsets[i] = rng.random((rng.integers(0, 5), 2)) * 10
+        return offsets
+
+    def test_ragged_index(self, offsets):
+        ragged_index = _RaggedIndex(offsets)
+        assert ragged_index.data.shape == (
+            sum(len(item) for item in offsets.flat),
+            2,
+        )
+        for i in np.ndindex(offsets.shape):
+            np.testing.assert_array_equal(ragged_index[i], offsets[i])
+
+    def test_ragged_index_not_supported(self):
+        texts = np.empty(2, dtype=object)
+        texts[0] = ["a", "b"]
+        texts[1] = ["c"]
+        ragged_index = _RaggedIndex(texts)
+        assert ragged_index.data is None
+        assert ragged_index[(1,)] is texts[1]
+
+        offsets = np.empty(2, dtype=object)
+        offsets[0] = np.ones((2, 2), dtype=int)
+        offsets[1] = np.ones((2, 2), dtype=float)
+        assert _RaggedIndex(offsets).data is None
+
+    @pytest.mark.parametrize("lazy", (True, False))
+    def test_navigate(self, offsets, lazy):
+        s = Signal2D(np.zeros((3, 4, 10, 10)))
+        data = da.from_array(offsets, chunks=(2, 2)) if lazy else offsets
+        m = Points(offsets=data)
+        s.add_marker(m)
+        for i in np.ndindex(offsets.shape):
+            s.axes_manager.indices = i
+            np.testing.assert_allclose(
+                m._collection.get_offsets().reshape(-1, 2), offsets[i]
+            )
+        if lazy:
+            # maximum number of chunks kept in memory
+            assert len(m._cache_dask_chunk_kwargs) == 4
+
+    def test_edit_in_place(self):
+        s = Signal2D(np.zeros((2, 10, 10)))
+        offsets = np.empty(2, dtype=object)
+        offsets[0] = np.array([[1.0, 2.0], [3.0, 4.0]])
+        offsets[1] = np.array([[5.0, 6.0]])
+        m = Points(offsets=offsets)
+        s.add_marker(m)
+        m.kwargs["offsets"][0][0] = [7, 7]
+        m._update()
+        np.testing.assert_allclose(m._collection.get_offsets(), [[7, 7], [3, 4]])
+        m.kwargs["offsets"][0] = np.array([[5.0, 5.0], [6.0, 6.0]])
+        s.axes_manager.indices = (1,)
+        s.axes_manager.indices = (0,)
+        np.testing.assert_allclose(m._collection.get_offsets(), [[5, 5], [6, 6]])
+
+    def test_lazy_chunk_cache(self, offsets):
+        s = Signal2D(np.zeros((3, 4, 10, 10)))
+        texts = np.empty(offsets.shape, dtype=object)
+        for i in np.ndindex(offsets.shape):
+            texts[i] = [str(i)] * len(offsets[i])
+        m = Texts(
+            offsets=da.from_array(offsets, chunks=(2, 2)),
+            texts=da.from_array(texts, chunks=(2, 2)),
+        )
+        s.add_marker(m)
+        s.axes_manager.indices = (3, 2)
+        # one chunk per argument for each of the two positions
+        assert len(m._cache_dask_chunk_kwargs) == 4
+        kwargs = m.get_current_kwargs(only_variable_length=True)
+        np.testing.assert_allclose(kwargs["offsets"], offsets[3, 2])
+        assert list(kwargs["texts"]) == texts[3, 2]
+
+    def test_remove_items(self, offsets):
+        s = Signal2D(np.zeros((3, 4, 10, 10)))
+        offsets[1, 1] = np.array([[1.0, 2.0], [3.0, 4.0]])
+        m = Points(offsets=offsets)
+        s.add_marker(m)
+        s.axes_manager.indices = (1, 1)
+        m.remove_items(0, navigation_indices=((1, 1),))
+        np.testing.assert_allclose(m._collection.get_offsets(), [[3.0, 4.0]])
@@ -15,11 +15,16 @@
 # You should have received a copy of the GNU General Public License
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import threading
+from unittest import mock
+
 import dask.array as da
 import numpy as np
 import pytest
 
 import hyperspy.api as hs
+from hyperspy._signals.lazy import _NavigatorRefinement
+from hyperspy.drawing._data_fetcher import AsyncDataFetcher
 
 
 @pytest.mark.parametrize("ndim", [0, 1, 2, 3])
@@ -62,6 +67,48 @@ def test_compute_navigator():
     np.testing.assert_allclose(s._plot.navigator_data_function(), s.navigator.data)
 
 
+def test_compute_navigator_progressive():
+    shape = (6, 8, 4, 4)
+    s = hs.signals.Signal2D(da.random.random(shape, chunks=(2, 3, 4, 4))).as_lazy()
+    with mock.patch.object(_NavigatorRefinement, "start"):
+        s.compute_navigator(progressive=3)
+    refinement = s._navigator_refinement
+    assert not s.navigator.original_metadata.refined
+    assert s.navigator.original_metadata.sum_from == str([slice(0, 4), slice(0, 4)])
+    # coarse navigator computed from every other position
+    coarse = s.data[::2, ::3].sum(axis=(2, 3)).compute()
+    coarse = np.repeat(np.repeat(coarse, 2, axis=0), 3, axis=1)[:, :8]
+    np.testing.assert_allclose(s.navigator.data, coarse)
+
+    refinement._run()
+    assert s.navigator.original_metadata.refined
+    np.testing.assert_allclose(s.navigator.data, s.data.sum(axis=(2, 3)).compute())
+
+
+def test_plot_progressive_navigator(monkeypatch):
+    shape = (6, 8, 4, 4)
+    s = hs.signals.Signal2D(da.random.random(shape, chunks=(2, 3, 4, 4))).as_lazy()
+    monkeypatch.setattr("hyperspy._signals.lazy.backend_supports_timers", lambda: True)
+    timer = FakeTimer()
+    with mock.patch(
+        "matplotlib.backend_bases.FigureCanvasBase.new_timer",
+        side_effect=lambda interval: timer,
+    ), mock.patch.object(_NavigatorRefinement, "start"):
+        s.plot()
+    refinement = s._navigator_refinement
+    refinement._run()
+    expected = s.data.sum(axis=(2, 3)).compute()
+    np.testing.assert_allclose(s.navigator.data, expected)
+    assert timer.started
+    timer.fire()
+    assert not timer.started
+    np.testing.assert_allclose(s._plot.navigator_plot._current_data, expected)
+    # The refined navigator is reused
+    s._plot.close()
+    s.plot()
+    assert s._navigator_refinement is refinement
+
+
 def test_navigator_deepcopy_with_new_data():
     shape = (15, 15, 30, 30)
     s = hs.signals.Signal2D(da.arange(np.prod(shape)).reshape(shape)).as_lazy()
@@ -149,3 +196,98 @@ def test_plot_navigator_signal():
     nav *= -1
     s.plot(navigator=nav)
     np.testing.assert_allclose(s._plot.navigator_data_function(), nav)
+
+
+class FakeTimer:
+    def __init__(self):
+        self.callbacks = []
+        self.started = False
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.started = False
+
+    def fire(self):
+        for callback in self.callbacks:
+            callback()
+
+
+class TestAsyncDataFetcher:
+    def test_fetch(self):
+        s = hs.signals.Signal1D(np.arange(4 * 5).reshape((4, 5))).as_lazy()
+        timer = FakeTimer()
+        canvas = mock.Mock(new_timer=mock.Mock(return_value=timer))
+        callback = mock.Mock()
+        fetcher = AsyncDataFetcher(s._get_current_data, canvas, callback)
+        assert fetcher.fetch(s.axes_manager) is None
+        assert timer.started
+        s.axes_manager.indices = (2,)
+        # superseded request
+        assert fetcher.fetch(s.axes_manager) is None
+        fetcher._executor.submit(lambda: None).result()
+        timer.fire()
+        callback.assert_called_once()
+        assert not timer.started
+        np.testing.assert_array_equal(fetcher.fetch(s.axes_manager), s.data[2])
+        fetcher.close()
+
+    def test_fetch_error(self):
+        def data_function(axes_manager, prefetch):
+            raise ValueError("Test error")
+
+        canvas = mock.Mock(new_timer=mock.Mock(return_value=FakeTimer()))
+        s = hs.signals.Signal1D(np.zeros(5))
+        fetcher = AsyncDataFetcher(data_function, canvas, mock.Mock())
+        assert fetcher.fetch(s.axes_manager) is None
+        fetcher._executor.submit(lambda: None).result()
+        with pytest.raises(ValueError, match="Test error"):
+            fetcher.fetch(s.axes_manager)
+        fetcher.close()
+
+    @pytest.mark.parametrize("signal_dimension", [1, 2])
+    def test_plot(self, monkeypatch, signal_dimension):
+        data = da.arange(6 * 6 * 4 * 4).reshape((6, 6, 4, 4)).rechunk(2)
+        s = hs.signals.BaseSignal(data).as_lazy()
+        s = s.transpose(signal_axes=signal_dimension)
+        for module in ["image", "signal1d"]:
+            monkeypatch.setattr(
+                f"hyperspy.drawing.{module}.supports_timers", lambda canvas: True
+            )
+        s.plot()
+        timer = FakeTimer()
+        canvas = s._plot.signal_plot.figure.canvas
+        monkeypatch.setattr(canvas, "new_timer", lambda interval: timer)
+        if signal_dimension == 2:
+            plot = s._plot.signal_plot
+        else:
+            plot = s._plot.signal_plot.ax_lines[0]
+        fetcher = plot._get_data_fetcher()
+        data_function = fetcher.data_function
+        release = threading.Event()
+
+        def blocking_data_function(**kwargs):
+            release.wait(5)
+            return data_function(**kwargs)
+
+        fetcher.data_function = blocking_data_function
+
+        def displayed_data():
+            if signal_dimension == 2:
+                return plot._current_data
+            return plot.line.get_ydata()
+
+        current = displayed_data().copy()
+        s.axes_manager.indices = (1,) * (4 - signal_dimension)
+        # The current data is displayed until the new data is available
+        np.testing.assert_array_equal(displayed_data(), current)
+        release.set()
+        fetcher._executor.submit(lambda: None).result()
+        timer.fire()
+        np.testing.assert_array_equal(displayed_data(), s._get_current_data())
+        s._plot.close()
+        assert fetcher._executor is None
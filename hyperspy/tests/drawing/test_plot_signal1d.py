@@ -25,6 +25,7 @@
 import numpy as np
 import pytest
 from matplotlib.backend_bases import MouseEvent, PickEvent
+from matplotlib.colors import to_rgba_array
 
 try:
     # scipy >=1.10
@@ -520,3 +521,75 @@ def test_plot_empty_slice_autoscale():
     # change span selector to an "empty" slice and trigger update
     r.left = 23
     r.right = 23.1
+
+
+@pytest.mark.parametrize("normalise", (True, False))
+def test_plot_spectra_line_collection(normalise):
+    rng = np.random.default_rng(0)
+    s = hs.signals.Signal1D(rng.random((150, 20)))
+    ax = hs.plot.plot_spectra(s, normalise=normalise)
+    assert len(ax.get_lines()) == 0
+    assert len(ax.collections) == 1
+    segments = ax.collections[0].get_segments()
+    assert len(segments) == 150
+    data = s.data[3]
+    if normalise:
+        data = (data - data.min()) / (data.max() - data.min())
+    np.testing.assert_allclose(segments[3][:, 1], data)
+    np.testing.assert_allclose(segments[3][:, 0], s.axes_manager[-1].axis)
+
+    # same as plotting each line
+    ax2 = hs.plot.plot_spectra(s, normalise=normalise, line_collection=False)
+    assert len(ax2.get_lines()) == 150
+    np.testing.assert_allclose(ax.get_xlim(), ax2.get_xlim())
+    np.testing.assert_allclose(ax.get_ylim(), ax2.get_ylim())
+    np.testing.assert_allclose(
+        ax.collections[0].get_colors()[:10],
+        to_rgba_array([line.get_color() for line in ax2.get_lines()[:10]]),
+    )
+
+
+def test_plot_spectra_line_collection_auto_update():
+    s = hs.signals.Signal1D(np.arange(100))
+    s2 = s / 2
+    ax = hs.plot.plot_spectra([s, s2], line_collection=True)
+    s2.data = -s2.data * 4 + 50
+    s2.events.data_changed.trigger(s2)
+    segments = ax.collections[0].get_segments()
+    np.testing.assert_allclose(segments[1][:, 1], s2.data)
+    np.testing.assert_allclose(segments[0][:, 1], s.data)
+    assert ax.get_ylim()[0] < -100
+
+
+@pytest.mark.parametrize("normalise", (True, False))
+def test_plot_spectra_line_collection_auto_update_signal(normalise):
+    s = hs.signals.Signal1D(np.arange(150 * 20.0).reshape((150, 20)))
+    ax = hs.plot.plot_spectra(s, normalise=normalise)
+    # a single connection for all the spectra
+    assert len(s.events.data_changed.connected) == 1
+    s.data = -(s.data[::-1] ** 2)
+    s.events.data_changed.trigger(s)
+    segments = ax.collections[0].get_segments()
+    data = s.data[3]
+    if normalise:
+        data = (data - data.min()) / (data.max() - data.min())
+    np.testing.assert_allclose(segments[3][:, 1], data)
+    if not normalise:
+        assert ax.get_ylim()[0] < -1000
+
+
+def test_plot_spectra_line_collection_error():
+    s = hs.signals.Signal1D(np.arange(100).reshape(2, 50))
+    with pytest.raises(ValueError):
+        hs.plot.plot_spectra(s, line_collection=True, legend="auto")
+
+
+def test_plot_spectra_timings():
+    from hyperspy.drawing.utils import _PlotTimings
+
+    s = hs.signals.Signal1D(np.arange(100).reshape(2, 50))
+    hs.plot.plot_spectra(s, style="cascade")
+    timings = _PlotTimings.last
+    assert timings["function"] == "plot_spectra"
+    for step in ["figure", "artists", "layout", "total"]:
+        assert timings[step] >= 0
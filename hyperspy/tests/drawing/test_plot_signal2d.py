@@ -35,6 +35,7 @@
 
 import hyperspy.api as hs
 from hyperspy.decorators import lazifyTestClass
+from hyperspy.drawing.image import _block_mean
 from hyperspy.drawing.utils import make_cmap, plot_RGB_map
 from hyperspy.tests.drawing.test_plot_signal import _TestPlot
 
@@ -995,3 +996,70 @@ def test_plot_images_axes_ticks(axes_decor):
     assert np.allclose(plot_ax.get_yticks(), plot_images_ax.get_yticks())
     assert np.allclose(plot_ax.get_xlim(), plot_images_ax.get_xlim())
     assert np.allclose(plot_ax.get_ylim(), plot_images_ax.get_ylim())
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.float32])
+def test_block_mean(dtype):
+    data = np.arange(5 * 7 * 2).reshape((5, 7, 2)).astype(dtype)
+    mean = _block_mean(data)
+    assert mean.shape == (3, 4, 2)
+    assert mean.dtype == dtype
+    np.testing.assert_allclose(mean[0, 0], data[:2, :2].mean(axis=(0, 1)), atol=0.5)
+    # The last row and column are repeated
+    np.testing.assert_allclose(mean[-1, -1], data[-1, -1])
+
+
+def test_plot_display_pyramid():
+    data = np.random.default_rng(0).random((2048, 2048))
+    s = hs.signals.Signal2D(data)
+    s.plot(pyramid_min_size=1024**2)
+    imf = s._plot.signal_plot
+    im = imf.ax.images[0]
+    level = imf._display_level
+    assert level > 0
+    assert im.get_array().shape == (2048 // 2**level,) * 2
+    np.testing.assert_allclose(imf._pyramid.get_level(1), _block_mean(data))
+    # zoom in: the full resolution is displayed
+    imf.ax.set_xlim(0, 100)
+    imf.ax.set_ylim(100, 0)
+    assert imf._display_level == 0
+    assert im.get_array().shape == (2048, 2048)
+    # the pyramid is not used for small images
+    s2 = hs.signals.Signal2D(data[:256, :256])
+    s2.plot(pyramid_min_size=1024**2)
+    assert s2._plot.signal_plot._pyramid is None
+    assert s2._plot.signal_plot.ax.images[0].get_array().shape == (256, 256)
+
+
+def test_plot_images_mosaic():
+    data = np.arange(7 * 4 * 5, dtype=float).reshape((7, 4, 5))
+    s = hs.signals.Signal2D(data)
+    axes = hs.plot.plot_images(s, mosaic=True, per_row=3, vmin="0th", vmax="100th")
+    assert len(axes) == 1
+    im = axes[0].images[0]
+    tiles = im.get_array()
+    assert tiles.shape == (3 * 4, 3 * 5)
+    np.testing.assert_allclose(tiles[:4, 5:10], data[1])
+    np.testing.assert_allclose(tiles[8:12, :5], data[6])
+    # the missing tiles are transparent
+    assert np.all(tiles.mask[8:, 5:])
+    assert im.get_clim() == (data.min(), data.max())
+    # single colorbar
+    assert len(axes[0].figure.axes) == 2
+
+
+def test_plot_images_mosaic_list():
+    s1 = hs.signals.Signal2D(np.zeros((4, 5)))
+    s2 = hs.signals.Signal2D(np.ones((2, 4, 5)))
+    axes = hs.plot.plot_images([s1, s2], mosaic=True, colorbar=None)
+    assert axes[0].images[0].get_array().shape == (4, 3 * 5)
+    assert len(axes[0].figure.axes) == 1
+
+
+def test_plot_images_mosaic_error():
+    s1 = hs.signals.Signal2D(np.zeros((4, 5)))
+    s2 = hs.signals.Signal2D(np.zeros((5, 5)))
+    with pytest.raises(ValueError, match="same shape"):
+        hs.plot.plot_images([s1, s2], mosaic=True)
+    with pytest.raises(ValueError, match="overlay"):
+        hs.plot.plot_images([s1, s1], mosaic=True, overlay=True)
@@ -17,6 +17,7 @@
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 
+import dask.array as da
 import numpy as np
 import pytest
 
@@ -529,3 +530,72 @@ def test_bss_supported_return_true(self):
     @skip_sklearn
     def test_bss_supported_return_false(self):
         assert self.s.blind_source_separation(return_info=False) is None
+
+
+def are_bss_components_correlated(c1_list, c2_list, threshold=0.99):
+    """Check that each component of c1_list is correlated with one of c2_list."""
+    c1 = np.asarray(c1_list.data).reshape(len(c1_list.data), -1)
+    c2 = np.asarray(c2_list.data).reshape(len(c2_list.data), -1)
+    corr = abs(np.corrcoef(c1, c2)[: len(c1), len(c1) :])
+    return np.all(corr.max(axis=1) > threshold)
+
+
+@skip_sklearn
+class TestBSSMaxSamples:
+    def setup_method(self, method):
+        rng = np.random.RandomState(123)
+        ics = rng.laplace(size=(3, 2000))
+        mixing_matrix = rng.random_sample(size=(3, 50))
+        s = Signal1D((ics.T @ mixing_matrix).reshape(20, 100, 50))
+        s.decomposition(output_dimension=3, print_info=False)
+        s.blind_source_separation(3, on_loadings=True, diff_order=0, print_info=False)
+        self.s = s
+
+    def test_max_samples(self):
+        s = self.s
+        bss_loadings = s.get_bss_loadings()
+        s.blind_source_separation(
+            3, on_loadings=True, diff_order=0, max_samples=1000, print_info=False
+        )
+        assert are_bss_components_correlated(bss_loadings, s.get_bss_loadings())
+
+    def test_lazy_on_loadings(self):
+        bss_loadings = self.s.get_bss_loadings()
+        s = self.s.as_lazy()
+        s.data = s.data.rechunk((5, 100, 50))
+        s.decomposition(output_dimension=3, print_info=False)
+        s.blind_source_separation(
+            3, on_loadings=True, diff_order=0, max_samples=1000, print_info=False
+        )
+        lr = s.learning_results
+        assert isinstance(lr.bss_loadings, da.Array)
+        assert lr.bss_loadings.chunks[0] == lr.loadings.chunks[0]
+        assert are_bss_components_correlated(bss_loadings, s.get_bss_loadings())
+
+    def test_lazy_reverse(self):
+        s = self.s.as_lazy()
+        s.decomposition(output_dimension=3, print_info=False)
+        s.blind_source_separation(3, on_loadings=True, diff_order=0, print_info=False)
+        lr = s.learning_results
+        bss_loadings = lr.bss_loadings.compute()
+        unmixing_matrix = lr.unmixing_matrix.copy()
+        s.reverse_bss_component(1)
+        assert isinstance(lr.bss_loadings, da.Array)
+        np.testing.assert_allclose(lr.bss_loadings[:, 1].compute(), -bss_loadings[:, 1])
+        np.testing.assert_allclose(lr.bss_loadings[:, 0].compute(), bss_loadings[:, 0])
+        np.testing.assert_allclose(lr.unmixing_matrix[1], -unmixing_matrix[1])
+
+    def test_lazy_reverse_several(self):
+        s = self.s.as_lazy()
+        s.decomposition(output_dimension=3, print_info=False)
+        s.blind_source_separation(3, on_loadings=True, diff_order=0, print_info=False)
+        lr = s.learning_results
+        bss_factors = np.asarray(lr.bss_factors).copy()
+        bss_loadings = np.asarray(lr.bss_loadings).copy()
+        s.reverse_bss_component((0, 2))
+        np.testing.assert_allclose(
+            np.asarray(lr.bss_factors), bss_factors * [-1, 1, -1]
+        )
+        np.testing.assert_allclose(
+            np.asarray(lr.bss_loadings), bss_loadings * [-1, 1, -1]
+        )
@@ -424,7 +424,7 @@ class TestReturnInfo:
     def setup_method(self, method):
         self.s = signals.Signal1D(generate_low_rank_matrix())
 
-    @pytest.mark.parametrize("algorithm", ["SVD", "MLPCA"])
+    @pytest.mark.parametrize("algorithm", ["SVD"])
     def test_decomposition_not_supported(self, algorithm):
         assert (
             self.s.decomposition(
@@ -441,6 +441,7 @@ def test_decomposition_not_supported(self, algorithm):
     @pytest.mark.parametrize(
         "algorithm",
         [
+            "MLPCA",
             "RPCA",
             "ORPCA",
             "ORNMF",
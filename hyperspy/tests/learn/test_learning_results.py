@@ -20,6 +20,7 @@
 import numpy as np
 import pytest
 
+from hyperspy.learn.mva import LearningResults
 from hyperspy.misc.machine_learning.import_sklearn import sklearn_installed
 from hyperspy.signals import Signal1D
 
@@ -50,3 +51,66 @@ def test_learning_results_bss():
     assert "Demixing parameters" in out
     assert "algorithm=sklearn_fastica" in out
     assert "n_components=2" in out
+
+
+class TestSaveLoad:
+    def setup_method(self, method):
+        rng = np.random.RandomState(123)
+        self.s = Signal1D(rng.random_sample(size=(4, 5, 100)))
+        self.s.decomposition(output_dimension=3)
+
+    @pytest.mark.parametrize("extension", ["npz", "hdf5", "h5"])
+    def test_save_load(self, tmp_path, extension):
+        fname = tmp_path / f"results.{extension}"
+        lr = self.s.learning_results
+        lr.save(fname, overwrite=True)
+        lr2 = LearningResults()
+        lr2.load(fname)
+        for key in ["factors", "loadings", "explained_variance"]:
+            np.testing.assert_allclose(getattr(lr2, key), getattr(lr, key))
+        assert lr2.decomposition_algorithm == lr.decomposition_algorithm
+        assert lr2.output_dimension == lr.output_dimension
+        assert lr2.poissonian_noise_normalized is False
+        assert lr2.centre is None
+        np.testing.assert_array_equal(lr2.original_shape, lr.original_shape)
+
+    @pytest.mark.parametrize("extension", ["npz", "hdf5"])
+    def test_load_reset_none(self, tmp_path, extension):
+        # the results which are None in the file are reset when loading it
+        fname = tmp_path / f"results.{extension}"
+        self.s.learning_results.save(fname, overwrite=True)
+        lr = LearningResults()
+        lr.bss_factors = np.ones((100, 2))
+        lr.bss_algorithm = "sklearn_fastica"
+        lr.load(fname)
+        assert lr.bss_factors is None
+        assert lr.bss_algorithm is None
+        assert lr.factors is not None
+
+    @pytest.mark.parametrize("memmap", [True, False])
+    def test_load_hdf5_memmap(self, tmp_path, memmap):
+        fname = tmp_path / "results.hdf5"
+        self.s.learning_results.save(fname, overwrite=True)
+        lr = LearningResults()
+        lr.load(fname, memmap=memmap)
+        assert isinstance(lr.loadings, np.memmap) is memmap
+        assert isinstance(lr.factors, np.memmap) is memmap
+        # the results can be used and modified without touching the file
+        s = self.s.deepcopy()
+        s.learning_results = lr
+        s.get_decomposition_model(2)
+        lr.loadings[:, 0] *= -1
+        lr2 = LearningResults()
+        lr2.load(fname)
+        np.testing.assert_allclose(lr2.loadings, self.s.learning_results.loadings)
+
+    def test_save_hdf5_lazy(self, tmp_path):
+        s = self.s.as_lazy()
+        s.decomposition(output_dimension=3)
+        fname = tmp_path / "results.hdf5"
+        s.learning_results.save(fname, overwrite=True)
+        lr = LearningResults()
+        lr.load(fname)
+        assert isinstance(lr.loadings, np.ndarray)
+        np.testing.assert_allclose(lr.loadings, s.learning_results.loadings.compute())
+        np.testing.assert_allclose(lr.factors, s.learning_results.factors)
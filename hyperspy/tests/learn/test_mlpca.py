@@ -80,3 +80,55 @@ def test_signal():
     Y = s.get_decomposition_model(r).data
     normX = np.linalg.norm(Y.reshape(m, n) - X)
     assert normX < tol
+
+
+def _generate_data(m=100, n=101, r=3):
+    rng = np.random.RandomState(101)
+    U = rng.uniform(0, 1, size=(m, r))
+    V = rng.uniform(0, 10, size=(n, r))
+    varX = U @ V.T
+    X = rng.poisson(varX).astype(float)
+    return X, varX
+
+
+@pytest.mark.parametrize("chunk_size", [None, 7])
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_mlpca_chunks_and_workers(chunk_size, num_workers):
+    X, varX = _generate_data()
+    U, S, V, Sobj = mlpca(X, varX, output_dimension=3)
+    U2, S2, V2, Sobj2 = mlpca(
+        X, varX, output_dimension=3, chunk_size=chunk_size, num_workers=num_workers
+    )
+    np.testing.assert_allclose(S, S2)
+    np.testing.assert_allclose(U * S @ V.T, U2 * S2 @ V2.T, atol=1e-8)
+    np.testing.assert_allclose(Sobj, Sobj2)
+
+
+def test_mlpca_return_info():
+    X, varX = _generate_data()
+    U, S, V, Sobj, info = mlpca(X, varX, output_dimension=3, tol=1e-8, return_info=True)
+    assert info["converged"]
+    assert info["n_iter"] == len(info["objective"])
+    assert info["objective"][-1] == Sobj
+    assert info["stop_criterion"][-1] < 1e-8
+
+
+@pytest.mark.parametrize("max_iter", [1, 2, 3])
+def test_mlpca_not_converged(max_iter, caplog):
+    m, n, r = 60, 80, 3
+    X, varX = _generate_data(m, n, r)
+    U, S, V, Sobj, info = mlpca(
+        X, varX, output_dimension=r, tol=1e-12, max_iter=max_iter, return_info=True
+    )
+    assert not info["converged"]
+    assert "did not converge" in caplog.text
+    assert U.shape == (m, r)
+    assert S.shape == (r,)
+    assert V.shape == (n, r)
+
+
+def test_signal_return_info():
+    X, _ = _generate_data()
+    s = Signal1D(X.reshape(10, 10, 101))
+    info = s.decomposition(algorithm="MLPCA", output_dimension=3, return_info=True)
+    assert info["converged"]
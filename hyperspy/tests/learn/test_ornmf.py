@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from hyperspy.learn.ornmf import ornmf
+from hyperspy.learn.ornmf import ORNMF, _solveproj, ornmf
 from hyperspy.signals import Signal1D
 
 
@@ -57,6 +57,36 @@ def test_batch_size(self):
         assert W.shape == self.U.shape
         assert H.shape == self.V.T.shape
 
+    def test_batch_size_store_error(self):
+        Xhat, Ehat, W, H = ornmf(self.X, self.rank, store_error=True, batch_size=32)
+        compare_norms(Xhat, self.X)
+
+        assert Xhat.shape == self.X.shape
+        assert Ehat.shape == self.E.shape
+
+    def test_batch_size_iterator(self):
+        _ornmf = ORNMF(self.rank)
+        _ornmf.fit(iter(self.X.T), batch_size=32)
+        W, H = _ornmf.finish()
+
+        assert W.shape == self.U.shape
+        assert H.shape == self.V.T.shape
+
+    @pytest.mark.parametrize("batch_size", [None, 7])
+    def test_project_batch(self, batch_size):
+        _ornmf = ORNMF(self.rank, random_state=1)
+        _ornmf.fit(self.X.T)
+        H, E = _ornmf.project(self.X.T, return_error=True, batch_size=batch_size)
+
+        # The samples of a batch are solved independently
+        for i in [0, 100, self.n - 1]:
+            h, e = _solveproj(self.X[:, i], _ornmf.W, _ornmf.lambda1, vmax=np.inf)
+            np.testing.assert_allclose(H[:, i], h, atol=1e-12)
+            np.testing.assert_allclose(E[:, i], e, atol=1e-12)
+
+        H2 = _ornmf.project(iter(self.X.T), batch_size=batch_size)
+        np.testing.assert_allclose(H, H2)
+
     def test_store_error(self):
         Xhat, Ehat, W, H = ornmf(self.X, self.rank, store_error=True)
         compare_norms(Xhat, self.X)
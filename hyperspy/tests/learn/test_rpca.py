@@ -20,7 +20,7 @@
 import pytest
 import scipy.linalg
 
-from hyperspy.learn.rpca import orpca, rpca_godec
+from hyperspy.learn.rpca import ORPCA, _solveproj, orpca, rpca_godec
 from hyperspy.signals import Signal1D
 
 
@@ -135,6 +135,34 @@ def test_batch_size(self):
         assert L.shape == (self.m, self.rank)
         assert R.shape == (self.rank, self.n)
 
+    def test_batch_size_store_error(self):
+        X, E, U, S, V = orpca(self.X, rank=self.rank, store_error=True, batch_size=32)
+        compare_norms(X, self.A)
+        assert E.shape == (self.m, self.n)
+
+    def test_batch_size_iterator(self):
+        orpca = ORPCA(self.rank)
+        orpca.fit(iter(self.X.T), batch_size=32)
+        L, R = orpca.finish()
+
+        assert L.shape == (self.m, self.rank)
+        assert R.shape == (self.rank, self.n)
+
+    @pytest.mark.parametrize("batch_size", [None, 7])
+    def test_project_batch(self, batch_size):
+        orpca = ORPCA(self.rank)
+        orpca.fit(self.X.T)
+        R, E = orpca.project(self.X.T, return_error=True, batch_size=batch_size)
+
+        # The samples of a batch are solved independently
+        for i in [0, 100, self.n - 1]:
+            r, e = _solveproj(self.X[:, i], orpca.L, orpca.K, orpca.lambda2)
+            np.testing.assert_allclose(R[:, i], r, atol=1e-12)
+            np.testing.assert_allclose(E[:, i], e, atol=1e-12)
+
+        R2 = orpca.project(iter(self.X.T), batch_size=batch_size)
+        np.testing.assert_allclose(R, R2)
+
     def test_method_BCD(self):
         X, E, U, S, V = orpca(self.X, rank=self.rank, store_error=True, method="BCD")
         compare_norms(X, self.A)
@@ -19,7 +19,7 @@
 import numpy as np
 import pytest
 
-from hyperspy.drawing.utils import contrast_stretching
+from hyperspy.drawing.utils import contrast_stretching, sample_data
 
 
 class TestImageStretching:
@@ -42,3 +42,25 @@ def test_nans(self, value):
     def test_out_of_range(self):
         with pytest.raises(ValueError):
             contrast_stretching(self.data, "-0.5th", "100.5th")
+
+    def test_min_max(self):
+        bounds = contrast_stretching(self.data, "0th", "100th")
+        assert bounds == (0.0, 9.0)
+
+    def test_max_samples(self):
+        rng = np.random.default_rng(0)
+        data = rng.random((1000, 1000))
+        data[1, 1] = -1.0
+        vmin, vmax = contrast_stretching(data, "0th", "99th", max_samples=10000)
+        # The minimum is calculated from all the data
+        assert vmin == -1.0
+        np.testing.assert_allclose(vmax, 0.99, atol=0.01)
+        assert vmax == np.percentile(data[::10, ::10], 99)
+
+
+def test_sample_data():
+    data = np.arange(100 * 60).reshape((100, 60))
+    assert sample_data(data) is data
+    assert sample_data(data, 10000) is data
+    sampled = sample_data(data, 100)
+    np.testing.assert_array_equal(sampled, data[::8, ::8])
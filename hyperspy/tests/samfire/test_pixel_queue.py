@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2024 The HyperSpy developers
+#
+# This file is part of HyperSpy.
+#
+# HyperSpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# HyperSpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import types
+
+import numpy as np
+
+from hyperspy.misc.utils import DictionaryTreeBrowser
+from hyperspy.samfire_utils.pixel_queue import PixelQueue
+
+
+def create_samf(marker):
+    samf = types.SimpleNamespace()
+    samf.metadata = DictionaryTreeBrowser()
+    samf.metadata.marker = marker
+    samf.random_state = np.random.default_rng(0)
+    return samf
+
+
+def pop(queue, number, **kwargs):
+    # mimic SAMFire, which removes the selected pixels from the marker
+    inds = queue.pop(number, **kwargs)
+    for ind in inds:
+        queue.samf.metadata.marker[ind] = 0.0
+    return inds
+
+
+class TestPixelQueue:
+    def setup_method(self, method):
+        marker = np.zeros((4, 5))
+        marker[0, 1] = 2.0
+        marker[1, 3] = 2.0
+        marker[2, 2] = 1.0
+        marker[3, 4] = -1.0
+        self.samf = create_samf(marker)
+        self.queue = PixelQueue(self.samf)
+
+    def test_pop_ties(self):
+        inds = pop(self.queue, 10)
+        assert sorted(inds) == [(0, 1), (1, 3)]
+        assert pop(self.queue, 10) == [(2, 2)]
+        assert pop(self.queue, 10) == []
+
+    def test_pop_number(self):
+        inds = pop(self.queue, 1)
+        assert len(inds) == 1
+        assert inds[0] in [(0, 1), (1, 3)]
+        assert pop(self.queue, 1)[0] in [(0, 1), (1, 3)]
+        assert pop(self.queue, 1) == [(2, 2)]
+
+    def test_pop_random_ties(self):
+        first = set()
+        for seed in range(20):
+            self.samf.random_state = np.random.default_rng(seed)
+            self.queue.invalidate()
+            first.add(self.queue.pop(1)[0])
+        assert first == {(0, 1), (1, 3)}
+
+    def test_pop_exclude(self):
+        inds = pop(self.queue, 10, exclude=[(0, 1)])
+        assert inds == [(1, 3)]
+
+    def test_push(self):
+        pop(self.queue, 10)
+        marker = self.samf.metadata.marker
+        marker[0, 0] = 0.5
+        marker[2, 2] = 3.0
+        self.queue.push(np.ravel_multi_index(([0, 2], [0, 2]), marker.shape))
+        assert pop(self.queue, 10) == [(2, 2)]
+        assert pop(self.queue, 10) == [(0, 0)]
+
+    def test_outdated_entries(self):
+        pop(self.queue, 0)
+        marker = self.samf.metadata.marker
+        # decreased without notifying the queue
+        marker[0, 1] = 0.0
+        marker[1, 3] = 1.0
+        assert sorted(pop(self.queue, 10)) == [(1, 3), (2, 2)]
+        assert pop(self.queue, 10) == []
+
+    def test_duplicate_entries(self):
+        pop(self.queue, 0)
+        marker = self.samf.metadata.marker
+        marker[0, 1] = 4.0
+        self.queue.push([1])
+        assert pop(self.queue, 10) == [(0, 1)]
+        assert pop(self.queue, 10) == [(1, 3)]
+
+    def test_rebuild_new_marker(self):
+        pop(self.queue, 0)
+        marker = np.zeros((4, 5))
+        marker[3, 3] = 1.0
+        self.samf.metadata.marker = marker
+        assert pop(self.queue, 10) == [(3, 3)]
+
+    def test_rebuild_when_empty(self):
+        pop(self.queue, 10)
+        pop(self.queue, 10)
+        marker = self.samf.metadata.marker
+        # increased without notifying the queue
+        marker[3, 0] = 1.0
+        assert pop(self.queue, 10) == [(3, 0)]
+
+    def test_invalidate(self):
+        pop(self.queue, 0)
+        marker = self.samf.metadata.marker
+        marker[3, 0] = 5.0
+        self.queue.invalidate()
+        assert pop(self.queue, 10) == [(3, 0)]
@@ -18,6 +18,8 @@
 
 import copy
 import gc
+import os
+import types
 
 import cloudpickle
 import numpy as np
@@ -25,7 +27,15 @@
 
 import hyperspy.api as hs
 from hyperspy.misc.utils import DictionaryTreeBrowser
-from hyperspy.samfire_utils.samfire_worker import create_worker
+from hyperspy.samfire_utils import samfire_worker
+from hyperspy.samfire_utils.samfire_pool import SamfirePool
+from hyperspy.samfire_utils.samfire_worker import (
+    _shared_input_layout,
+    _shared_result_layout,
+    create_worker,
+    read_shared_result,
+)
+from hyperspy.samfire_utils.shared_arrays import SharedArrays
 
 N_WORKERS = 1
 
@@ -327,6 +337,62 @@ def test_change_strategy(self):
         samf.stop()
         del samf
 
+    def test_backup(self, tmp_path):
+        m = self.model
+        m[1].active_is_multidimensional = True
+        samf = m.create_samfire(workers=N_WORKERS, setup=False)
+        fname = str(tmp_path / "backup")
+        samf.metadata.marker[0, 0] = -1
+        samf.metadata.marker[1, 1] = -2
+        m.chisq.data[0, 0] = 2.0
+        m[0].A.map["values"][0, 0] = 5.0
+        m[1]._active_array[0, 0] = False
+        samf.count = 3
+        saved = m[0].A.map["values"][4, 4]
+        samf.backup(fname, on_count=False)
+        assert os.path.exists(fname + ".h5")
+        assert samf._backup_file == fname + ".h5"
+
+        # only the updated pixels are written in the following backups
+        samf.metadata.marker[2, 3] = -1
+        m[0].A.map["values"][2, 3] = 7.0
+        m[0].A.map["values"][4, 4] = saved + 9.0
+        samf._updated_pixels.add((2, 3))
+        samf._active_strategy_ind = 1
+        samf.backup(fname, on_count=False)
+        assert samf._updated_pixels == set()
+        samf.stop()
+
+        m.chisq.data[:] = np.nan
+        m[0].A.map["values"][:] = -1.0
+        m[1]._active_array[:] = True
+        samf2 = m.create_samfire(workers=N_WORKERS, setup=False)
+        samf2.load_backup(fname)
+        assert samf2._active_strategy_ind == 1
+        assert samf2.count == 3
+        assert samf2.metadata.marker[0, 0] == -1
+        assert samf2.metadata.marker[1, 1] == -2
+        assert samf2.metadata.marker[2, 3] == -1
+        assert samf2.metadata.marker[3, 3] > 0
+        assert m.chisq.data[0, 0] == 2.0
+        assert m[0].A.map["values"][0, 0] == 5.0
+        assert m[0].A.map["values"][2, 3] == 7.0
+        assert m[0].A.map["values"][4, 4] == saved
+        assert not m[1]._active_array[0, 0]
+        assert m[1]._active_array[1, 0]
+        samf2.stop()
+
+    def test_backup_wrong_model(self, tmp_path):
+        samf = self.model.create_samfire(workers=N_WORKERS, setup=False)
+        fname = str(tmp_path / "backup.h5")
+        samf.backup(fname, on_count=False)
+        samf.stop()
+        m = self.model.signal.inav[:3].create_model()
+        samf2 = m.create_samfire(workers=N_WORKERS, setup=False)
+        with pytest.raises(ValueError, match="navigation shape"):
+            samf2.load_backup(fname)
+        samf2.stop()
+
 
 @pytest.mark.xfail(
     reason="Sometimes the number of failed pixels > 3 when using multiprocessing. Unknown reason"
@@ -372,12 +438,45 @@ def test_create_worker_defaults():
     assert worker.shared_queue is None
     assert worker.result_queue is None
     assert worker.individual_queue is None
+    assert worker.connection is None
     np.testing.assert_equal(worker.best_AICc, np.inf)
     np.testing.assert_equal(worker.best_values, [])
     np.testing.assert_equal(worker.best_dof, np.inf)
     np.testing.assert_equal(worker.last_time, 1)
 
 
+def test_shared_arrays():
+    layout = {
+        "a": ((2, 3), np.float64),
+        ("b", "c"): ((2,), np.dtype([("values", "float"), ("is_set", "bool")])),
+    }
+    shared = SharedArrays(layout)
+    attached = SharedArrays(*shared.spec)
+    try:
+        assert attached.layout == shared.layout
+        shared.arrays["a"][1] = [1, 2, 3]
+        attached.arrays[("b", "c")][0] = (4.0, True)
+        np.testing.assert_equal(attached.arrays["a"][1], [1, 2, 3])
+        assert shared.arrays[("b", "c")][0]["values"] == 4.0
+        assert shared.arrays[("b", "c")][0]["is_set"]
+    finally:
+        attached.close()
+        shared.close()
+    assert shared.arrays == {}
+
+
+@pytest.mark.parametrize(
+    "batch_size, n, duration, expected",
+    [(1, 1, 0.001, 2), (8, 8, 0.001, 16), (16, 16, 0.001, 20), (8, 8, 1.0, 1)],
+)
+def test_samfire_pool_adapt_batch_size(batch_size, n, duration, expected):
+    pool = types.SimpleNamespace(
+        batch_size=batch_size, max_batch_size=20, job_duration=0.1
+    )
+    SamfirePool._adapt_batch_size(pool, n, duration)
+    assert pool.batch_size == expected
+
+
 class TestSamfireWorker:
     def setup_method(self, method):
         np.random.seed(17)
@@ -489,6 +588,98 @@ def test_add_model(self):
 
         del worker
 
+    def test_add_model_cached(self, monkeypatch):
+        monkeypatch.setattr(samfire_worker, "_model_cache", {})
+        worker = create_worker("worker")
+        worker.create_model(self.model_dictionary, self.model_letter, "key")
+        worker2 = create_worker("worker2")
+        worker2.create_model(self.model_dictionary, self.model_letter, "key")
+        assert worker2.model is worker.model
+        assert worker2.parameters.keys() == worker.parameters.keys()
+        worker3 = create_worker("worker3")
+        worker3.create_model(self.model_dictionary, self.model_letter, "other")
+        assert worker3.model is not worker.model
+        assert list(samfire_worker._model_cache) == ["key", "other"]
+
+    def test_run_pixel_shared(self):
+        m_slice = self.model.inav[self.ind[::-1]]
+        shared_input = SharedArrays(_shared_input_layout(m_slice, 2))
+        shared_result = SharedArrays(_shared_result_layout(m_slice, 2))
+        vals = {
+            "g1": self.vals["g1"],
+            "l1": self.vals["l2"],
+            "l2": self.vals["l3"],
+            "g2": {},
+            "g3": {},
+            "l3": {},
+        }
+        workers = []
+        for _ in range(2):
+            worker = create_worker("worker")
+            worker.create_model(self.model_dictionary, self.model_letter)
+            worker.setup_test(self._gt_dump)
+            worker.set_optional_names({"g2", "g3", "l3"})
+            workers.append(worker)
+        try:
+            signal = self.model.signal.data[self.ind]
+            variance = self.model.signal.metadata.Signal.Noise_properties.variance
+            variance = variance.data[self.ind]
+            # reference: the data and the results are sent in the messages
+            value_dict = copy.deepcopy(vals)
+            value_dict.update({"signal.data": signal, "variance.data": variance})
+            keyword, (_, _, result, found_solution) = workers[0].run_pixel(
+                self.ind, value_dict
+            )
+            assert keyword == "result"
+
+            worker = workers[1]
+            worker.attach_shared_arrays(shared_input.spec, shared_result.spec)
+            shared_input.arrays["signal.data"][1] = signal
+            shared_input.arrays["variance.data"][1] = variance
+            keyword, (_id, ind, slot, names, found) = worker.run_pixel(
+                self.ind, copy.deepcopy(vals), slot=1
+            )
+            assert keyword == "shared_result"
+            assert (_id, ind, slot) == ("worker", self.ind, 1)
+            assert found == found_solution
+            assert sorted(names) == sorted(result["components"])
+            shared = read_shared_result(shared_result, slot, names)
+            assert shared.keys() == result.keys()
+            for key in ["chisq.data", "dof.data"]:
+                np.testing.assert_allclose(shared[key], result[key])
+            for comp_name, comp in result["components"].items():
+                for par_name, par_map in comp.items():
+                    shared_map = shared["components"][comp_name][par_name]
+                    assert shared_map.shape == par_map.shape
+                    np.testing.assert_allclose(shared_map["values"], par_map["values"])
+        finally:
+            worker.shared_input.close()
+            worker.shared_result.close()
+            shared_input.close()
+            shared_result.close()
+
+    def test_run_pixels(self):
+        worker = create_worker("worker")
+        worker.create_model(self.model_dictionary, self.model_letter)
+        worker.setup_test(self._gt_dump)
+        variance = self.model.signal.metadata.Signal.Noise_properties.variance
+        value_dicts = []
+        for ind in [(0,), (1,)]:
+            vals = {"g1": self.vals["g1"], "l1": self.vals["l2"]}
+            vals.update({name: {} for name in ["l2", "g2", "g3", "l3"]})
+            vals["signal.data"] = self.model.signal.data[ind]
+            vals["variance.data"] = variance.data[ind]
+            value_dicts.append(vals)
+        keyword, (_id, values, duration) = worker.run_pixels(
+            ((0,), (1,)), tuple(value_dicts)
+        )
+        assert keyword == "batch"
+        assert _id == "worker"
+        assert duration > 0
+        assert [value[0] for value in values] == ["result", "result"]
+        assert [value[1][1] for value in values] == [(0,), (1,)]
+        assert worker._batch is None
+
     @pytest.mark.xfail(reason="Sometimes fails - Unknown reason")
     def test_main_result(self):
         worker = create_worker("worker")
@@ -178,6 +178,41 @@ def test_refresh_nooverwrite(self):
         s.refresh(False, given_pixels=given)
         np.testing.assert_allclose(ans1, s.samf.metadata.marker[:4, :4])
 
+    def test_refresh_3d(self):
+        shape = (4, 6, 5)
+        rng = np.random.RandomState(17)
+        s = self.s
+        s.radii = (1.5, 2.0, 1.0)
+        samf = create_artificial_samfire(shape)
+        samf.metadata.marker[rng.rand(*shape) < 0.3] = -1
+        samf.model.set_item("chisq.data", rng.rand(*shape))
+        s.samf = samf
+        s.weight = someweight()
+        calc = samf.metadata.marker == -1
+        weights = np.exp(-samf.model.chisq.data)
+        # brute force: sum the decayed weights of the calculated pixels
+        expected = np.zeros(shape)
+        for ind in zip(*np.where(~calc)):
+            distances, slices, _, mask = s._get_distance_array(shape, ind)
+            mask &= calc[slices]
+            expected[ind] = np.sum(weights[slices][mask] * np.exp(-distances[mask]))
+        expected[calc] = -1
+
+        s.refresh(False)
+        np.testing.assert_allclose(samf.metadata.marker, expected)
+
+    def test_get_kernel(self):
+        s = self.s
+        s.samf = self.samf
+        s.radii = (1.0, 2.0)
+        kernel = s._get_kernel(2)
+        assert kernel.shape == (3, 5)
+        assert kernel[1, 2] == 0.0
+        np.testing.assert_allclose(
+            kernel[1], np.exp(-np.array([2, 1, 0, 1, 2])) * [1, 1, 0, 1, 1]
+        )
+        np.testing.assert_allclose(kernel[0], [0, 0, np.exp(-1), 0, 0])
+
     def test_get_distance_array(self):
         s = self.s
         s.samf = self.samf
@@ -387,6 +422,55 @@ def test_values(self):
         test2 = compare_two_value_dicts(ans_r2, ans2)
         assert test2
 
+    def test_batch_values(self):
+        s = self.s
+        s.radii = (1.9, 2.1)
+        samf = self.samf
+        s.samf = samf
+        s.decay_function = lambda x: np.exp(-x)
+        s.weight = someweight()
+        rng = np.random.default_rng(0)
+        m = samf.model
+        m.chisq.data[:] = rng.random(self.shape)
+        m[1].active_is_multidimensional = True
+        m[1]._active_array[:] = rng.random(self.shape) > 0.3
+        m[2].active = False
+        for component in m:
+            for par in component.parameters:
+                par.map["values"] = rng.random(self.shape)
+        samf.metadata.marker[:] = np.where(rng.random(self.shape) > 0.5, -1, 1)
+
+        def reference(ind):
+            # the weighted average of each pixel separately
+            marker = samf.metadata.marker
+            distances, slices, _, mask_dist = s._get_distance_array(self.shape, ind)
+            mask_calc = np.logical_and(mask_dist, marker[slices] == -1)
+            weights = s.decay_function(distances) * s.decay_function(
+                s.weight.map(mask_calc, slices)
+            )
+            ans = {}
+            for component in m[:2]:
+                mask = mask_calc
+                if component.active_is_multidimensional:
+                    mask = np.logical_and(mask, component._active_array[slices])
+                if mask.any():
+                    ans[component.name] = {
+                        par.name: np.average(
+                            par.map["values"][slices][mask], weights=weights[mask]
+                        )
+                        for par in component.parameters
+                    }
+            return ans
+
+        inds = [(0, 0), (2, 3), (4, 6), (1, 5), (3, 0)]
+        ans = s.batch_values(inds)
+        assert len(ans) == len(inds)
+        for ind, values in zip(inds, ans):
+            ans_r = reference(ind)
+            assert values.keys() == ans_r.keys()
+            assert compare_two_value_dicts(ans_r, values)
+        assert s.batch_values([]) == []
+
 
 class TestGlobalStrategy:
     def setup_method(self, method):
@@ -25,6 +25,7 @@
 from hyperspy import _lazy_signals
 from hyperspy._signals.lazy import (
     _get_navigation_dimension_chunk_slice,
+    _prefetched_dask_chunks,
     _reshuffle_mixed_blocks,
     to_array,
 )
@@ -329,6 +330,33 @@ def test_clear_cache_dask_data_method(self):
         assert s._cache_dask_chunk is None
         assert s._cache_dask_chunk_slice is None
 
+    def test_prefetch(self):
+        data = da.arange(6 * 6 * 8).reshape((6, 6, 8)).rechunk((2, 2, 8))
+        s = _lazy_signals.LazySignal1D(data)
+        s._get_cache_dask_chunk(s.axes_manager._getitem_tuple, prefetch=True)
+        futures = _prefetched_dask_chunks[s]
+        assert set(futures) == {((2, 4), (0, 2)), ((0, 2), (2, 4))}
+        future = futures[((0, 2), (2, 4))]
+        chunk = future.result()
+        # The prefetched chunk is used when navigating to it
+        s.axes_manager.indices = (3, 1)
+        value = s._get_cache_dask_chunk(s.axes_manager._getitem_tuple, prefetch=True)
+        assert s._cache_dask_chunk is chunk
+        np.testing.assert_array_equal(value, data[1, 3].compute())
+        # The chunks which are not neighbours anymore are discarded
+        assert set(_prefetched_dask_chunks[s]) == {
+            ((0, 2), (0, 2)),
+            ((0, 2), (4, 6)),
+            ((2, 4), (2, 4)),
+        }
+        s._clear_cache_dask_data()
+        assert s not in _prefetched_dask_chunks
+
+    def test_no_prefetch(self):
+        s = _lazy_signals.LazySignal2D(da.zeros((6, 6, 8, 8), chunks=(2, 2, 4, 4)))
+        s._get_cache_dask_chunk(s.axes_manager._getitem_tuple)
+        assert s not in _prefetched_dask_chunks
+
 
 class TestLazyPlot:
     def test_correct_value(self):
@@ -28,7 +28,7 @@
 import hyperspy.api as hs
 from hyperspy._signals.lazy import LazySignal
 from hyperspy.decorators import lazifyTestClass
-from hyperspy.misc.utils import _get_block_pattern
+from hyperspy.misc.utils import _get_block_pattern, output_signature_cache
 
 
 def identify_function(x):
@@ -801,6 +801,16 @@ def test_different_output_signal_size_signal2d_3(self):
         assert new_axis == {}
         assert adjust_chunks == {2: 5, 3: 0, 4: 0}
 
+    def test_concatenate_axes(self):
+        dask_array = da.zeros((4, 6, 20), chunks=(2, 3, 5))
+        arg_pairs, adjust_chunks, new_axis, output_pattern = _get_block_pattern(
+            (dask_array,), (4, 6, 20), concatenate_axes=(2,)
+        )
+        assert arg_pairs[0][1] == (0, 1, 3)
+        assert output_pattern == (0, 1, 2)
+        assert new_axis == {2: 20}
+        assert adjust_chunks == {}
+
 
 def test_dask_array_store():
     def a_function(image):
@@ -965,6 +975,230 @@ def return_img(image, add):
         s_out = s.map(return_img, inplace=False, add=s_add, ragged=True)
         np.testing.assert_array_equal(s_out.data[0], x[0])
 
+    @pytest.mark.parametrize("num_workers", [None, 1, 3])
+    def test_in_memory(self, monkeypatch, num_workers):
+        def add_sum(image, add):
+            return np.sum(image) + add
+
+        s = self.s
+        s.data = np.random.default_rng(0).random(s.data.shape)
+        s_add = hs.signals.BaseSignal(np.arange(200.0).reshape((10, 20))).T
+        expected = s.data.sum(axis=(2, 3)) + s_add.data
+        # dask is not used for in-memory signals
+        monkeypatch.setattr(da, "blockwise", None)
+        s_out = s.map(add_sum, inplace=False, add=s_add, num_workers=num_workers)
+        np.testing.assert_allclose(s_out.data, expected)
+        assert not s_out._lazy
+        assert s_out.axes_manager.signal_shape == ()
+        assert s_out.axes_manager.navigation_shape == (self.px, self.py)
+
+    def test_in_memory_inplace(self):
+        s = self.s
+        data = s.data
+        s.map(lambda image: image * 3)
+        assert s.data is data
+        assert (s.data == 3).all()
+
+    @pytest.mark.parametrize("vectorized", (False, True))
+    def test_in_memory_inplace_not_contiguous(self, vectorized):
+        s = self.s.inav[1:3]
+        assert not s.data.flags.c_contiguous
+        s.map(lambda image: image * 3, vectorized=vectorized)
+        assert (s.data == 3).all()
+
+    def test_in_memory_inplace_error(self):
+        s = self.s
+        calls = []
+
+        def negate(image):
+            if len(calls) == 120:
+                raise ValueError
+            calls.append(image)
+            return -image
+
+        with pytest.raises(ValueError):
+            s.map(negate, num_workers=1)
+        # the data is partially processed: the results of the blocks
+        # processed before the error are kept
+        assert (s.data == -1).any()
+        assert (s.data == 1).any()
+
+    def test_in_memory_other_scheduler(self):
+        assert self.s._can_map_in_memory({})
+        with dask.config.set(scheduler="processes"):
+            assert not self.s._can_map_in_memory({})
+        assert not self.s.as_lazy()._can_map_in_memory({})
+
+
+class TestMapVectorized:
+    def setup_method(self):
+        self.s = hs.signals.Signal1D(np.random.random((4, 5, 10)))
+        self.s_scale = hs.signals.BaseSignal(np.random.random((4, 5))).T
+        self.calls = []
+
+    def scale(self, data, factor=1.0):
+        self.calls.append(data.shape)
+        return data * factor
+
+    def scale_batch(self, data, factor=1.0):
+        self.calls.append(data.shape)
+        return data * np.reshape(factor, (-1, 1))
+
+    @pytest.mark.parametrize("lazy_output", (False, True))
+    @pytest.mark.parametrize("lazy", (False, True))
+    def test_iterating_kwargs(self, lazy, lazy_output):
+        s = self.s.as_lazy() if lazy else self.s
+        s_ref = self.s.map(self.scale, factor=self.s_scale, inplace=False)
+        self.calls = []
+        s_out = s.map(
+            self.scale_batch,
+            factor=self.s_scale,
+            vectorized=True,
+            inplace=False,
+            lazy_output=lazy_output,
+        )
+        assert s_out._lazy == lazy_output
+        if lazy_output:
+            s_out.compute()
+        np.testing.assert_allclose(s_out.data, s_ref.data)
+        # all the calls are made on batches of signals
+        assert all(shape[1:] == (10,) for shape in self.calls)
+        assert len(self.calls) < 20
+
+    @pytest.mark.parametrize("inplace", (False, True))
+    def test_change_signal_shape(self, inplace):
+        s_out = self.s.map(
+            lambda data: data.sum(axis=-1), vectorized=True, inplace=inplace
+        )
+        if inplace:
+            s_out = self.s
+        assert s_out.axes_manager.signal_dimension == 0
+        assert s_out.data.shape == (4, 5)
+
+    def test_axis_function_not_map_all(self):
+        # the function is called with batches, even if it has an `axis`
+        # argument
+        def function(data, axis=-1):
+            assert data.ndim == 2
+            return data
+
+        s_out = self.s.map(function, vectorized=True, inplace=False)
+        np.testing.assert_allclose(s_out.data, self.s.data)
+
+    def test_ragged(self):
+        s_out = self.s.map(
+            lambda data: [np.where(d > 0.5)[0] for d in data],
+            vectorized=True,
+            ragged=True,
+            inplace=False,
+        )
+        assert s_out.ragged
+        for index in np.ndindex(4, 5):
+            np.testing.assert_equal(
+                s_out.data[index], np.where(self.s.data[index] > 0.5)[0]
+            )
+
+    def test_wrong_output_shape(self):
+        with pytest.raises(ValueError, match="vectorized function"):
+            self.s.map(lambda data: data[0], vectorized=True, inplace=False)
+
+
+class CountingArray:
+    # array-like counting the number of reads
+    def __init__(self, data):
+        self.data = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.ndim = data.ndim
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return self.data[key]
+
+
+class TestMapOverheads:
+    def setup_method(self):
+        output_signature_cache.clear()
+        self.data = np.random.random((4, 6, 20))
+        self.calls = 0
+
+    def function(self, data):
+        self.calls += 1
+        return data * 2
+
+    def test_output_signature_cache(self):
+        s = hs.signals.Signal1D(self.data)
+        s.map(self.function, inplace=False, cache_output_signature=True)
+        # the test call on the first pixel
+        assert self.calls == 24 + 1
+        self.calls = 0
+        s.map(self.function, inplace=False, cache_output_signature=True)
+        assert self.calls == 24
+
+    def test_output_signature_cache_default(self):
+        # the output size of the function depends on a global variable
+        size = 10
+
+        def function(data):
+            return data[:size]
+
+        s = hs.signals.Signal1D(self.data)
+        assert s.map(function, inplace=False).data.shape == (4, 6, 10)
+        size = 5
+        assert s.map(function, inplace=False).data.shape == (4, 6, 5)
+        s_lazy = s.as_lazy()
+        size = 3
+        assert s_lazy.map(function, inplace=False).data.shape == (4, 6, 3)
+        size = 4
+        assert s_lazy.map(function, inplace=False).data.shape == (4, 6, 4)
+
+        self.calls = 0
+        s.map(self.function, inplace=False)
+        s.map(self.function, inplace=False)
+        assert self.calls == 2 * (24 + 1)
+
+    def test_output_signature_cache_kwargs(self):
+        def function(data, size):
+            return data[:size]
+
+        s = hs.signals.Signal1D(self.data)
+        kwargs = dict(inplace=False, cache_output_signature=True)
+        assert s.map(function, size=5, **kwargs).data.shape == (4, 6, 5)
+        assert s.map(function, size=3, **kwargs).data.shape == (4, 6, 3)
+        s_size = hs.signals.BaseSignal(np.full((4, 6), 2)).T
+        assert s.map(function, size=s_size, **kwargs).data.shape == (4, 6, 2)
+
+    def test_reuse_first_chunk(self):
+        array = CountingArray(self.data)
+        s = hs.signals.Signal1D(da.from_array(array, chunks=(2, 6, 20))).as_lazy()
+        array.reads = 0
+        s_out = s.map(self.function, inplace=False, lazy_output=False)
+        np.testing.assert_allclose(s_out.data, self.data * 2)
+        # each chunk is read once
+        assert array.reads == 2
+
+    def test_signal_chunks(self):
+        s = hs.signals.Signal1D(da.from_array(self.data, chunks=(2, 3, 5))).as_lazy()
+        s_out = s.map(lambda x: x[::-1], inplace=False, lazy_output=True)
+        assert not any("rechunk" in name for name in s_out.data.dask.layers)
+        assert s_out.data.chunks == ((2, 2), (3, 3), (20,))
+        np.testing.assert_allclose(s_out.data.compute(), self.data[..., ::-1])
+
+    def test_signal_chunks_iterating_kwargs(self):
+        s = hs.signals.Signal1D(da.from_array(self.data, chunks=(2, 3, 5))).as_lazy()
+        s_shift = hs.signals.BaseSignal(np.arange(24).reshape(4, 6)).T
+        s_out = s.map(
+            lambda x, shift: np.roll(x, shift),
+            shift=s_shift,
+            inplace=False,
+            lazy_output=False,
+        )
+        for index in np.ndindex(4, 6):
+            np.testing.assert_allclose(
+                s_out.data[index], np.roll(self.data[index], s_shift.data[index])
+            )
+
 
 class TestFullProcessing:
     def setup_method(self):
@@ -202,6 +202,8 @@ def test_dir_utils_roi():
         "Point2DROI",
         "RectangularROI",
         "SpanROI",
+        "profile_lines",
+        "reduce_rois",
     ]
 
 
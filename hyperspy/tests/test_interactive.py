@@ -18,6 +18,7 @@
 
 from __future__ import print_function
 
+import threading
 from unittest import mock
 
 import numpy as np
@@ -25,6 +26,7 @@
 
 import hyperspy.api as hs
 from hyperspy.events import Event
+from hyperspy.interactive import Interactive
 
 
 class TestInteractive:
@@ -148,3 +150,112 @@ def function_return_None():
 
         hs.interactive(function_return_None, e)
         e.trigger()
+
+
+class TestInteractiveDeferred:
+    def setup_method(self, method):
+        self.s = hs.signals.Signal1D(np.arange(3 * 4 * 5.0).reshape((3, 4, 5)))
+
+    def test_update_interval(self):
+        s = self.s
+        e = Event()
+        m = mock.Mock(side_effect=s.sum)
+        m.__self__ = s
+        cls = Interactive(m, e, recompute_out_event=None, axis=0, update_interval=0.05)
+        ss = cls.out
+        assert m.call_count == 1
+        for i in range(10):
+            s.data += 1
+            e.trigger()
+        # The updates are merged
+        assert m.call_count == 1
+        cls.wait()
+        assert m.call_count == 2
+        np.testing.assert_array_equal(ss.data, np.sum(s.data, axis=1))
+
+    def test_background(self):
+        s = self.s
+        e = Event()
+        cls = Interactive(s.sum, e, recompute_out_event=None, axis=0, background=True)
+        ss = cls.out
+        s.data += 1
+        e.trigger()
+        cls.wait()
+        np.testing.assert_array_equal(ss.data, np.sum(s.data, axis=1))
+
+    def test_background_discard_stale(self):
+        e = Event()
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def f(value):
+            if value.pop(0):
+                started.set()
+                release.wait(5)
+            out = hs.signals.Signal1D(np.full(5, float(len(results))))
+            results.append(out)
+            return out
+
+        # The first operation (run when creating `out`) and the third are
+        # fast, the second one blocks until the third is requested
+        cls = Interactive(f, None, e, [False, True, False], background=True)
+        out = cls.out
+        e.trigger()
+        assert started.wait(5)
+        e.trigger()
+        release.set()
+        cls.wait()
+        assert len(results) == 3
+        # Only the result of the latest operation is used
+        np.testing.assert_array_equal(out.data, results[2].data)
+
+    def test_background_gui_thread(self):
+        s = self.s
+        e = Event()
+        cls = Interactive(s.sum, e, recompute_out_event=None, axis=0, background=True)
+        ss = cls.out
+        threads = []
+        ss.events.data_changed.connect(
+            lambda: threads.append(threading.current_thread()), []
+        )
+        timer = mock.Mock()
+        canvas = mock.Mock(new_timer=mock.Mock(return_value=timer))
+        with mock.patch.object(Interactive, "_get_canvas", return_value=canvas):
+            s.data += 1
+            e.trigger()
+            timer.start.assert_called_once()
+            cls._executor.submit(lambda: None).result()
+            # The result is only set by the timer of the canvas
+            assert not threads
+            poll = timer.add_callback.call_args[0][0]
+            poll()
+        assert threads == [threading.current_thread()]
+        timer.stop.assert_called_once()
+        np.testing.assert_array_equal(ss.data, np.sum(s.data, axis=1))
+
+    def test_update_interval_gui_thread(self):
+        s = self.s
+        e = Event()
+        cls = Interactive(
+            s.sum, e, recompute_out_event=None, axis=0, update_interval=0.05
+        )
+        ss = cls.out
+        timer = mock.Mock()
+        canvas = mock.Mock(new_timer=mock.Mock(return_value=timer))
+        with mock.patch.object(Interactive, "_get_canvas", return_value=canvas):
+            s.data += 1
+            e.trigger()
+            e.trigger()
+        canvas.new_timer.assert_called_once_with(interval=50)
+        timer.add_callback.call_args[0][0]()
+        np.testing.assert_array_equal(ss.data, np.sum(s.data, axis=1))
+
+    def test_background_axes(self):
+        s = self.s
+        cls = Interactive(s.sum, axis=0, background=True)
+        ss = cls.out
+        s.crop(1, 1)
+        cls.wait()
+        assert ss.axes_manager.navigation_axes[0].offset == 1
+        np.testing.assert_array_equal(ss.data, np.sum(s.data, axis=1))
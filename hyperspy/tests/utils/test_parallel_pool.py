@@ -16,10 +16,12 @@
 # along with HyperSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import importlib
+from concurrent.futures import ProcessPoolExecutor
 
 import pytest
 
-from hyperspy.utils.parallel_pool import ParallelPool
+from hyperspy.utils import parallel_pool
+from hyperspy.utils.parallel_pool import ParallelPool, shutdown_reusable_executor
 
 
 def test_parallel_pool_multiprocessing():
@@ -38,3 +40,22 @@ def test_parallel_pool_ipyparallel_not_installed():
 
         with pytest.raises(ValueError):
             ParallelPool(ipyparallel=True)
+
+
+def test_parallel_pool_reuse_workers(monkeypatch):
+    monkeypatch.setattr(parallel_pool, "cpu_count", lambda: 3)
+    pool = ParallelPool(num_workers=2, ipyparallel=False, reuse_workers=True)
+    try:
+        assert pool.is_multiprocessing
+        assert pool.has_pool
+        assert isinstance(pool.pool, ProcessPoolExecutor)
+        assert pool._submit(abs, -1).result() == 1
+        pool2 = ParallelPool(num_workers=2, ipyparallel=False, reuse_workers=True)
+        assert pool2.pool is pool.pool
+        pool3 = ParallelPool(num_workers=1, ipyparallel=False, reuse_workers=True)
+        assert pool3.pool is not pool.pool
+        assert not pool.has_pool
+        assert pool3.has_pool
+    finally:
+        shutdown_reusable_executor()
+    assert not pool3.has_pool
@@ -19,6 +19,7 @@
 import numpy as np
 import pytest
 import traits.api as t
+from scipy import ndimage
 
 import hyperspy
 from hyperspy.decorators import lazifyTestClass
@@ -31,6 +32,8 @@
     RectangularROI,
     SpanROI,
     _get_central_half_limits_of_axis,
+    profile_lines,
+    reduce_rois,
 )
 from hyperspy.signals import Signal1D, Signal2D
 
@@ -779,6 +782,199 @@ def test_line2droi_length(self):
         np.testing.assert_allclose(line.length, np.sqrt(8))
 
 
+@lazifyTestClass
+class TestReduceROIs:
+    def setup_method(self, method):
+        rng = np.random.default_rng(0)
+        s = Signal1D(rng.random((30, 40, 8)))
+        s.axes_manager[0].scale = 0.5
+        self.s = s
+        self.rois = [
+            RectangularROI(left=1, top=2, right=8, bottom=10),
+            CircleROI(cx=10, cy=15, r=4),
+            CircleROI(cx=12, cy=12, r=6, r_inner=3),
+            Point2DROI(x=3, y=7),
+        ]
+
+    def compute(self, s):
+        if s._lazy:
+            s.compute()
+        return s.data
+
+    @pytest.mark.parametrize(
+        "reduction, function",
+        [
+            ("sum", np.nansum),
+            ("mean", np.nanmean),
+            ("max", np.nanmax),
+            ("min", np.nanmin),
+        ],
+    )
+    def test_navigation_rois(self, reduction, function):
+        s_out = reduce_rois(self.s, self.rois, reduction=reduction)
+        assert s_out.axes_manager.navigation_shape == (4,)
+        assert s_out.axes_manager.navigation_axes[0].name == "ROI"
+        assert s_out.axes_manager.signal_axes[0].size == 8
+        assert s_out._lazy == self.s._lazy
+        data = self.compute(s_out)
+        for i, roi in enumerate(self.rois):
+            s_roi = roi(self.s)
+            if s_roi._lazy:
+                s_roi.compute()
+            axis = tuple(range(s_roi.axes_manager.navigation_dimension))
+            np.testing.assert_allclose(data[i], function(s_roi.data, axis=axis))
+
+    def test_signal_rois(self):
+        s = self.s.T
+        s_out = reduce_rois(s, self.rois[:2], axes=s.axes_manager.signal_axes)
+        assert s_out.axes_manager.navigation_shape == (8,)
+        assert s_out.axes_manager.signal_shape == (2,)
+        data = self.compute(s_out)
+        s_roi = self.rois[1](s)
+        if s_roi._lazy:
+            s_roi.compute()
+        np.testing.assert_allclose(data[:, 1], np.nansum(s_roi.data, axis=(1, 2)))
+
+    def test_labels(self):
+        labels = np.zeros((30, 40), dtype=int)
+        labels[:10, :5] = 1
+        labels[20:, 30:] = 3
+        s_out = reduce_rois(self.s, labels, reduction="mean")
+        data = self.compute(s_out)
+        assert data.shape == (3, 8)
+        np.testing.assert_allclose(data[0], self.s.data[:10, :5].mean(axis=(0, 1)))
+        assert np.isnan(data[1]).all()
+        np.testing.assert_allclose(data[2], self.s.data[20:, 30:].mean(axis=(0, 1)))
+
+    def test_sparse_weights(self, monkeypatch):
+        # many large ROIs are reduced with the sparse matrix of their weights
+        s_dense = reduce_rois(self.s, self.rois)
+        monkeypatch.setattr("hyperspy.roi._DENSE_WEIGHTS_MAX_SIZE", 0)
+        s_sparse = reduce_rois(self.s, self.rois)
+        np.testing.assert_allclose(self.compute(s_sparse), self.compute(s_dense))
+
+    @pytest.mark.parametrize(
+        "reduction, function", [("sum", np.nansum), ("mean", np.nanmean)]
+    )
+    def test_roi_reduction(self, reduction, function):
+        for roi in self.rois:
+            s_out = getattr(roi, reduction)(self.s)
+            assert s_out.axes_manager.navigation_dimension == 0
+            assert s_out.axes_manager.signal_shape == (8,)
+            s_roi = roi(self.s)
+            if s_roi._lazy:
+                s_roi.compute()
+            axis = tuple(range(s_roi.axes_manager.navigation_dimension))
+            np.testing.assert_allclose(
+                self.compute(s_out), function(s_roi.data, axis=axis)
+            )
+
+    def test_roi_reduction_signal_axes_integer(self):
+        s = Signal2D(np.arange(4 * 10 * 12, dtype=np.uint8).reshape((4, 10, 12)))
+        if self.s._lazy:
+            s = s.as_lazy()
+            s.rechunk(nav_chunks=2, sig_chunks=(4, 5))
+        roi = CircleROI(cx=5, cy=4, r=4, r_inner=2)
+        s_out = roi.sum(s, axes=s.axes_manager.signal_axes)
+        data = self.compute(s_out)
+        # no overflow
+        assert data.dtype == np.sum(np.ones(1, dtype=np.uint8)).dtype
+        s_roi = roi(s, axes=s.axes_manager.signal_axes)
+        if s_roi._lazy:
+            s_roi.compute()
+        np.testing.assert_allclose(data, np.nansum(s_roi.data, axis=(1, 2)))
+
+    def test_integer_precision(self):
+        rng = np.random.default_rng(0)
+        s = Signal2D(rng.integers(0, 2**16, size=(2, 256, 256), dtype=np.uint16))
+        if self.s._lazy:
+            s = s.as_lazy()
+            s.rechunk(nav_chunks=1, sig_chunks=(128, 128))
+        axes = s.axes_manager.signal_axes
+        rois = [RectangularROI(left=0, top=0, right=256, bottom=256)]
+        reference = self.compute(rois[0].sum(s, axes=axes))
+        assert reference[0] == s.data[0].sum(dtype=np.uint64)
+        for reduction in ("sum", "mean"):
+            for number in (1, 2):
+                s_out = reduce_rois(s, rois * number, reduction=reduction, axes=axes)
+                data = self.compute(s_out)
+                expected = reference / 256**2 if reduction == "mean" else reference
+                for i in range(number):
+                    np.testing.assert_array_equal(data[:, i], expected)
+
+    def test_roi_reduction_scalar(self):
+        s = self.s.inav[0, 0]
+        s_out = SpanROI(left=2, right=5).sum(s)
+        assert s_out.axes_manager.signal_shape == (1,)
+        np.testing.assert_allclose(self.compute(s_out), self.compute(s)[2:5].sum())
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="reduction"):
+            reduce_rois(self.s, self.rois, reduction="median")
+        with pytest.raises(ValueError, match="shape of the labels"):
+            reduce_rois(self.s, np.ones((3, 3), dtype=int))
+        with pytest.raises(NotImplementedError):
+            reduce_rois(self.s, [Line2DROI(x1=0, y1=0, x2=5, y2=5)])
+        with pytest.raises(ValueError, match="Some ROI parameters"):
+            reduce_rois(self.s, [CircleROI()])
+
+
+@lazifyTestClass
+class TestLineProfiles:
+    def setup_method(self, method):
+        rng = np.random.default_rng(0)
+        s = Signal1D(rng.random((30, 40, 6)))
+        s.axes_manager[0].scale = 0.5
+        self.s = s
+        self.lines = [
+            Line2DROI(x1=1, y1=2, x2=15, y2=25),
+            Line2DROI(x1=-3, y1=0, x2=10, y2=35, linewidth=2),
+            Line2DROI(x1=18, y1=28, x2=2, y2=3, linewidth=1.2),
+        ]
+
+    @pytest.mark.parametrize("order", (0, 1))
+    def test_profile_lines(self, order):
+        profiles = profile_lines(self.s, self.lines, order=order)
+        assert len(profiles) == 3
+        for profile, line in zip(profiles, self.lines):
+            assert profile._lazy == self.s._lazy
+            reference = line(self.s, order=order)
+            assert profile.axes_manager.shape == reference.axes_manager.shape
+            np.testing.assert_allclose(profile.data, reference.data)
+
+    @pytest.mark.parametrize("order", (0, 1))
+    @pytest.mark.parametrize("cval", (0, 0.5))
+    def test_profile_line_weights(self, order, cval):
+        # compare to the interpolation channel by channel
+        data = np.asarray(self.s.data)
+        axes = self.s.axes_manager.navigation_axes
+        line = self.lines[1]
+        args = ((line.x1, line.y1), (line.x2, line.y2), axes)
+        kwargs = dict(linewidth=line.linewidth, order=order, cval=cval)
+        profile = Line2DROI.profile_line(self.s.data, *args, **kwargs)
+        if self.s._lazy:
+            profile = profile.compute()
+        p0 = [(v - ax.offset) / ax.scale for v, ax in zip((line.x1, line.y1), axes)]
+        p1 = [(v - ax.offset) / ax.scale for v, ax in zip((line.x2, line.y2), axes)]
+        coordinates = Line2DROI._line_profile_coordinates(p0, p1, linewidth=4)
+        reference = np.stack(
+            [
+                ndimage.map_coordinates(
+                    data[..., i], coordinates, order=order, cval=cval
+                ).mean(axis=1)
+                for i in range(data.shape[-1])
+            ],
+            axis=-1,
+        )
+        np.testing.assert_allclose(profile, reference)
+
+    def test_profile_lines_errors(self):
+        with pytest.raises(TypeError):
+            profile_lines(self.s, [CircleROI(cx=1, cy=1, r=1)])
+        with pytest.raises(ValueError, match="order"):
+            profile_lines(self.s, self.lines, order=2)
+
+
 @lazifyTestClass
 class TestInteractive:
     def setup_method(self, method):
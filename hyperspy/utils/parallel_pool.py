@@ -19,6 +19,7 @@
 
 import logging
 import time
+from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import Pool, cpu_count
 from multiprocessing.pool import Pool as Pool_type
 
@@ -34,14 +35,66 @@
 
 _logger = logging.getLogger(__name__)
 
+# The executor shared by the pools created with ``reuse_workers=True``
+_reusable_executor = None
+
+
+def get_reusable_executor(num_workers):
+    """Returns a process pool executor that persists between calls, so that
+    its worker processes (with their imported modules and cached objects) are
+    reused. A new executor is only started if the number of workers changes
+    or if the previous one was shut down.
+
+    Parameters
+    ----------
+    num_workers : int
+        The number of worker processes.
+
+    Returns
+    -------
+    :class:`python:concurrent.futures.ProcessPoolExecutor`
+    """
+    global _reusable_executor
+    executor = _reusable_executor
+    if executor is not None and (
+        executor._max_workers != num_workers or executor._broken
+    ):
+        executor.shutdown(wait=True)
+        executor = None
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=num_workers)
+        _reusable_executor = executor
+    return executor
+
+
+def shutdown_reusable_executor(wait=True):
+    """Shuts down the executor returned by :func:`get_reusable_executor`, if
+    any.
+
+    Parameters
+    ----------
+    wait : bool, default True
+        If True, wait for the running tasks to finish.
+    """
+    global _reusable_executor
+    if _reusable_executor is not None:
+        _reusable_executor.shutdown(wait=wait, cancel_futures=True)
+        _reusable_executor = None
+
 
 class ParallelPool:
     """Creates a ParallelPool by either looking for a ipyparallel client and
     then creating a load_balanced_view, or by creating a multiprocessing pool
 
+    The multiprocessing pool is either a new :class:`python:multiprocessing.pool.Pool`,
+    whose processes are terminated when the pool is stopped, or, with
+    ``reuse_workers=True``, a persistent
+    :class:`python:concurrent.futures.ProcessPoolExecutor` shared by all the
+    pools, whose processes are kept alive to be reused by the next pool.
+
     Attributes
     ----------
-    pool : :class:`ipyparallel.LoadBalancedView` or :class:`python:multiprocessing.pool.Pool`
+    pool : :class:`ipyparallel.LoadBalancedView`, :class:`python:multiprocessing.pool.Pool` or :class:`python:concurrent.futures.ProcessPoolExecutor`
         The pool object.
     ipython_kwargs : dict
         The dictionary with Ipyparallel connection arguments.
@@ -58,7 +111,13 @@ class ParallelPool:
 
     _timestep = 0
 
-    def __init__(self, num_workers=None, ipython_kwargs=None, ipyparallel=None):
+    def __init__(
+        self,
+        num_workers=None,
+        ipython_kwargs=None,
+        ipyparallel=None,
+        reuse_workers=False,
+    ):
         """Creates the ParallelPool and sets it up.
 
         Parameters
@@ -72,6 +131,13 @@ def __init__(self, num_workers=None, ipython_kwargs=None, ipyparallel=None):
         ipython_kwargs : None or dict, default None
             Arguments that will be passed to the ipyparallel.Client when
             creating. Not None implies ipyparallel=True.
+        reuse_workers : bool, default False
+            If True, the multiprocessing pool keeps its worker processes alive
+            when stopped, to reuse them in the next pool with the same number
+            of workers. This avoids the cost of starting the processes and
+            importing the modules again. Use
+            :func:`~hyperspy.utils.parallel_pool.shutdown_reusable_executor`
+            to stop them.
         """
         if ipython_kwargs is None:
             ipython_kwargs = {}
@@ -81,6 +147,7 @@ def __init__(self, num_workers=None, ipython_kwargs=None, ipyparallel=None):
         self.ipython_kwargs = {"timeout": self.timeout}
         self.ipython_kwargs.update(ipython_kwargs)
         self.pool = None
+        self.reuse_workers = reuse_workers
         if num_workers is None:
             num_workers = np.inf
         self.num_workers = abs(num_workers)
@@ -104,11 +171,13 @@ def is_ipyparallel(self):
     @property
     def is_multiprocessing(self):
         """Returns ``True`` if the pool is multiprocessing-based else ``False``."""
-        return isinstance(self.pool, Pool_type)
+        return isinstance(self.pool, (Pool_type, ProcessPoolExecutor))
 
     @property
     def has_pool(self):
         """Returns ``True`` if the pool is ready and set-up else ``False``."""
+        if isinstance(self.pool, ProcessPoolExecutor):
+            return self.pool is _reusable_executor and not self.pool._broken
         return self.is_ipyparallel or self.is_multiprocessing and self.pool._state == 0
 
     def _setup_ipyparallel(self):
@@ -125,9 +194,23 @@ def _setup_ipyparallel(self):
     def _setup_multiprocessing(self):
         _logger.debug("Calling _setup_multiprocessing")
         self.num_workers = min(self.num_workers, cpu_count() - 1)
-        self.pool = Pool(processes=self.num_workers)
+        if self.reuse_workers:
+            self.pool = get_reusable_executor(self.num_workers)
+        else:
+            self.pool = Pool(processes=self.num_workers)
         return True
 
+    def _submit(self, function, *args, **kwargs):
+        """Runs the function asynchronously in the multiprocessing pool.
+
+        Returns
+        -------
+        :class:`python:multiprocessing.pool.AsyncResult` or :class:`python:concurrent.futures.Future`
+        """
+        if isinstance(self.pool, ProcessPoolExecutor):
+            return self.pool.submit(function, *args, **kwargs)
+        return self.pool.apply_async(function, args=args, kwds=kwargs)
+
     def setup(self, ipyparallel=None):
         """Sets up the pool.
 
@@ -24,6 +24,8 @@
     Point2DROI,
     RectangularROI,
     SpanROI,
+    profile_lines,
+    reduce_rois,
 )
 
 __doc__ = hyperspy.roi.__doc__
@@ -36,6 +38,8 @@
     "Point2DROI",
     "RectangularROI",
     "SpanROI",
+    "profile_lines",
+    "reduce_rois",
 ]
 
 